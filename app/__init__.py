@@ -1,5 +1,49 @@
-from app.chord import Chord
-from app.utils import calculate_note, calculate_interval
+from importlib import import_module
+from typing import Any, Dict, List
+
+# Maps each public attribute to the module that defines it; modules are imported on first attribute access, so importing the package has no side effects.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+
+    "Chord": "app.chord",
+    "ChordArray": "app.chord_array",
+    "calculate_note": "app.utils",
+    "calculate_interval": "app.utils",
+    "Tuning": "app.tuning",
+    "get_tuning": "app.tuning",
+    "Progression": "app.progression",
+
+}
+
+# Maps each heavy submodule to its import path; submodules are imported on first attribute access.
+_LAZY_SUBMODULES: Dict[str, str] = {
+
+    "chord": "app.chord",
+    "utils": "app.utils",
+    "chord_array": "app.chord_array",
+    "consonance": "app.consonance",
+    "concurrency": "app.concurrency",
+    "demo": "app.demo",
+    "footprint": "app.footprint",
+    "history": "app.history",
+    "instrumentation": "app.instrumentation",
+    "inversions": "app.inversions",
+    "key_finding": "app.key_finding",
+    "markov": "app.markov",
+    "musicxml": "app.musicxml",
+    "patterns": "app.patterns",
+    "progression": "app.progression",
+    "registry": "app.registry",
+    "reharmonisation": "app.reharmonisation",
+    "roman_numerals": "app.roman_numerals",
+    "shared_tables": "app.shared_tables",
+    "similarity": "app.similarity",
+    "symbols": "app.symbols",
+    "transitions": "app.transitions",
+    "tuning": "app.tuning",
+    "library": "app.library",
+    "intervals": "app.library.intervals",
+
+}
 
 __all__ = [
 
@@ -8,3 +52,38 @@ __all__ = [
     "calculate_interval",
     
 ]
+
+def __getattr__(name: str) -> Any:
+
+    """
+    Imports the module that defines a public attribute or heavy submodule on first access, and caches the result in the package namespace.
+
+    Args:
+
+        name (str): The name of the attribute being accessed (e.g., "Chord").
+
+    Returns:
+
+        Any: The attribute or submodule.
+    
+    """
+
+    if name in _LAZY_ATTRIBUTES:
+
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+
+    elif name in _LAZY_SUBMODULES:
+
+        value = import_module(_LAZY_SUBMODULES[name])
+
+    else:
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> List[str]:
+
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
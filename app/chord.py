@@ -1,13 +1,22 @@
-import sys
-from pathlib import Path
+import struct
 
-# Adds the project root directory to the Python path
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-
-from typing import List, Tuple, Optional, TypeVar
+from typing import List, Tuple, Dict, Optional, TypeVar, Union
 
+from app.instrumentation import instrument_methods
+from app.library.codes import CHORD_ID_COUNT, encode_interval_types, decode_interval_types, pack_codes, unpack_codes
+from app.library.dependencies import DEPENDENT_INTERVAL_NAMES, DEPENDENCY_RESOLUTION_TABLE
 from app.library.enums import RootType, SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType
-from config.config import CHROMATIC_SCALE, CHROMATIC_LEN, INTERVAL_NAMES, INTERVAL_DICT, INTERVAL_DEPENDENCIES_DICT, DEFAULT_INTERVAL_TYPES
+from app.registry import INTERVAL_FAMILIES, interval_family
+from app.spelling import NOTE_PATTERN, SPELLING_TABLE, line_of_fifths_position, note_at_position
+from app.tuning import TWELVE_TET, Tuning, get_tuning, is_registered
+from app.utils import invert_interval_signature
+from config.config import INTERVAL_NAMES, INTERVAL_SLOT_NAMES, DEFAULT_INTERVAL_TYPES
+
+# Defines the first bass code of a slash bass note in a chord state (see Chord.state()); the codes below it are root position and the inversions.
+BASS_SLASH_CODE: int = len(INTERVAL_SLOT_NAMES)
+
+# Defines the binary form of a chord: its chord ID (see app/library/codes.py) as a little-endian unsigned 32-bit integer.
+CHORD_STRUCT: struct.Struct = struct.Struct("<I")
 
 class Chord:
 
@@ -18,11 +27,17 @@ class Chord:
 
     A Chord class object defaults to a C Major chord; a "C" root note, a major third interval and a perfect fifth interval.
 
+    Intervals are measured in steps of the chord's tuning, which defaults to 12-TET; the spelled notes are the same in every tuning.
+
+    Only the interval types are recorded when the chord changes; the note and interval attributes and the signatures are calculated lazily on first access, 
+    and are invalidated only for the interval names that have changed.
+
     Attributes:
 
         root_type (RootType): The root note of the chord; defaults to "RootType.C".
+        tuning (Tuning): The tuning that the intervals are measured in; defaults to 12-TET.
         root_note (str): The string representation of the root note.
-        root_index (int): The position of the root note in the chromatic scale, represented as an index.
+        root_index (int): The position of the root note in the tuning's scale, represented as an index.
         root_interval (int): The root interval that all other intervals are relative to, initialised to 0.
 
         third_type (ThirdType): The type of third interval, including sus2, minor, major and sus4; defaults to ThirdType.MAJOR
@@ -38,52 +53,217 @@ class Chord:
 
     """
 
-    def __init__(self):
+    # Stores the state in fixed slots rather than an instance dictionary, as many chords can be held at once (see app/footprint.py).
+    __slots__ = ("tuning", "_types", "_notes", "_intervals", "_root_index", "_note_signature", "_interval_signature", "_bass_slot", "_bass_fifths", "_bass_interval_signature")
+
+    def __init__(self, 
+                 tuning: Optional[Tuning] = None
+                 ):
+
+        # Stores the tuning, whose precompiled tables map interval names and spelled notes to steps.
+        self.tuning: Tuning = TWELVE_TET if tuning is None else tuning
+
+        # Initialises the fundamental tone of the chord and the third and fifth interval types to their default interval types.
+        # All optional interval types are initialised to None by default.
+        self._types: Dict[str, Optional[IntervalType]] = {
+            
+            "root": DEFAULT_INTERVAL_TYPES.get("root"),
+            "second": None,
+            "third": DEFAULT_INTERVAL_TYPES.get("third"),
+            "fourth": None,
+            "fifth": DEFAULT_INTERVAL_TYPES.get("fifth"),
+            "sixth": None,
+            "seventh": None,
+            "ninth": None,
+            "eleventh": None,
+            "thirteenth": None
+            
+            }
+
+        # Stores the note and interval attributes that have been calculated; an interval name missing from either dictionary is dirty.
+        self._notes: Dict[str, Optional[str]] = {}
+        self._intervals: Dict[str, Optional[int]] = {}
+
+        # Stores the root note index position in the chromatic scale, once it has been calculated.
+        self._root_index: Optional[int] = None
 
-        # Initialises the fundamental tone of the chord to the default interval type.
-        self.root_type: RootType = DEFAULT_INTERVAL_TYPES.get("root")        
-        # Initialises the string representation of the root note.
-        self.root_note: str = self.root_type.value
-        # Initialises the root note index position in the chromatic scale.
-        self.root_index: int = CHROMATIC_SCALE.index(self.root_note)
-        # Initialises the root interval that all other intervals are relative to.
-        self.root_interval: int = 0
+        # Stores the note and interval signatures, once they have been generated.
+        self._note_signature: Optional[List[str]] = None
+        self._interval_signature: Optional[List[int]] = None
 
-        # Initialises the third and fifth interval types to their default interval types.
-        self.third_type: ThirdType = DEFAULT_INTERVAL_TYPES.get("third")
-        self.fifth_type: FifthType = DEFAULT_INTERVAL_TYPES.get("fifth")
+        # Stores the bass note relative to the root note, or None to keep the root note in the bass: the interval name of the chord tone in the bass for an inversion,
+        # or the distance in fifths from the root note to a slash bass note; the bass note is spelled from them on access, so that it follows the root note and interval types.
+        self._bass_slot: Optional[str] = None
+        self._bass_fifths: Optional[int] = None
+
+        # Stores the interval signature above the bass note, once it has been generated.
+        self._bass_interval_signature: Optional[List[int]] = None
+
+
+
+    @classmethod
+    def from_interval_types(cls, 
+                            interval_types: Dict[str, Optional["Chord.IntervalType"]],
+                            tuning: Optional[Tuning] = None
+                            ) -> "Chord":
+
+        """
+        Constructs a chord directly from its interval types, without resolving interval dependencies.
+
+        Args:
+
+            interval_types (Dict[str, Optional[IntervalType]]): A dictionary mapping names in INTERVAL_SLOT_NAMES to interval types; missing names are set to None.
+            tuning (Optional[Tuning]): The tuning that the intervals are measured in; defaults to 12-TET.
+
+        Returns:
 
-        # Initialises all optional interval types to None by default.
-        self.second_type: Optional[SecondType] = None
-        self.fourth_type: Optional[FourthType] = None
-        self.sixth_type: Optional[SixthType] = None
-        self.seventh_type: Optional[SeventhType] = None
-        self.ninth_type: Optional[NinthType] = None
-        self.eleventh_type: Optional[EleventhType] = None
-        self.thirteenth_type: Optional[ThirteenthType] = None
+            Chord: The chord with exactly the interval types provided.
         
-        # Calculates the note and interval attributes for all interval types.
-        self.initialise_notes_and_intervals()
+        """
+
+        chord = cls(tuning)
+
+        for interval_name in INTERVAL_SLOT_NAMES:
+
+            chord._types[interval_name] = interval_types.get(interval_name)
+
+        return chord
+
+    def get_interval_types(self) -> Dict[str, Optional["Chord.IntervalType"]]:
+
+        """
+        Returns a copy of the interval types for the root note and all interval names, in INTERVAL_SLOT_NAMES order.
+        
+        """
+
+        return dict(self._types)
 
 
 
     # Defines a generic variable Type Hint for Enum interval types used across various methods.
     IntervalType = TypeVar("IntervalType", SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType) 
 
-    def initialise_notes_and_intervals(self) -> None:
+    def _get_interval_type(self, 
+                           interval_name: str
+                           ) -> Optional[IntervalType]:
+        
+        """
+        Returns the interval type recorded for the interval name.
+
+        Args:
 
+            interval_name (str): The name of the interval type (e.g., "thirteenth").
+        
         """
-        Determines if an interval type has been set for each interval name in the list of interval names.
+
+        return self._types[interval_name]
+
+    def _set_interval_type(self, 
+                           interval_name: str, 
+                           interval_type: Optional[IntervalType]
+                           ) -> None:
         
         """
+        Records the interval type for the interval name, and marks its note and interval attributes as dirty.
 
-        for interval_name in INTERVAL_NAMES:
+        A new root note marks every note attribute as dirty, as all notes are relative to the root note; the interval attributes are unchanged.
 
-            # Retrieves the interval type attribute.
-            interval_type = getattr(self, f"{interval_name}_type")
+        Args:
 
-            # Sets the corresponding note and interval attributes, based on the interval type attribute.
-            self._process_note_and_interval(interval_name, interval_type)
+            interval_name (str): The name of the interval type (e.g., "thirteenth").
+            interval_type (Optional[IntervalType]): The interval type Enum that refers to the interval name, or None.
+        
+        """
+
+        previous_interval_type = self._types[interval_name]
+
+        self._types[interval_name] = interval_type
+
+        # Invalidates the note signature and the interval signature above the bass note; they are regenerated from the cached attributes on the next access.
+        self._note_signature = None
+        self._bass_interval_signature = None
+
+        if interval_name == "root":
+
+            # Invalidates the root note index position and all note attributes.
+            self._root_index = None
+            self._notes.clear()
+
+            # Retains the interval attributes, unless the root note has been added or removed.
+            if (previous_interval_type is None) == (interval_type is None):
+
+                return
+
+        else:
+
+            # Invalidates the note attribute for the interval name only.
+            self._notes.pop(interval_name, None)
+
+        # Invalidates the interval attribute for the interval name only, and the interval signature.
+        self._intervals.pop(interval_name, None)
+        self._interval_signature = None
+
+    def _get_note(self, 
+                  interval_name: str
+                  ) -> Optional[str]:
+        
+        """
+        Returns the note attribute for the interval name, calculating it on first access after the interval type or root note has changed.
+
+        Args:
+
+            interval_name (str): The name of the interval type (e.g., "thirteenth").
+        
+        """
+
+        try:
+
+            return self._notes[interval_name]
+        
+        except KeyError:
+
+            self._process_note_and_interval(interval_name, self._types[interval_name])
+
+            return self._notes[interval_name]
+
+    def _get_interval(self, 
+                      interval_name: str
+                      ) -> Optional[int]:
+        
+        """
+        Returns the interval attribute for the interval name, calculating it on first access after the interval type has changed.
+
+        Args:
+
+            interval_name (str): The name of the interval type (e.g., "thirteenth").
+        
+        """
+
+        try:
+
+            return self._intervals[interval_name]
+        
+        except KeyError:
+
+            self._process_note_and_interval(interval_name, self._types[interval_name])
+
+            return self._intervals[interval_name]
+
+    @property
+    def root_index(self) -> Optional[int]:
+
+        """
+        The position of the root note in the tuning's scale, represented as an index; None if the root note has been removed.
+        
+        """
+
+        if self._root_index is None and self._types["root"] is not None:
+
+            root_type = self._types["root"]
+
+            self._root_index = root_type.index if self.tuning is TWELVE_TET else self.tuning.note_index(root_type.value)
+
+        return self._root_index
 
     def _process_note_and_interval(self, 
                                    interval_name: str, 
@@ -91,7 +271,7 @@ class Chord:
                                    ) -> None:
         
         """
-        Sets the note and interval attributes, based on the interval type attribute.
+        Calculates and caches the note and interval attributes, based on the interval type attribute.
 
         Args:
 
@@ -101,19 +281,24 @@ class Chord:
         
         """
 
-        if interval_type:
+        if interval_type and (interval_name == "root" or self._types["root"] is not None):
 
-            # Calculates the note and interval relative to the root note, if the interval type has been provided.
+            # Calculates the note and interval relative to the root note, if the interval type and the root note have been provided.
             note, interval = self.calculate_note_and_interval(interval_type)
         
+        elif interval_type:
+
+            # Calculates the interval only, if the root note has been removed.
+            note, interval = None, interval_type.semitones if self.tuning is TWELVE_TET else self.tuning.interval_steps[interval_type.value]
+
         else:
 
             # Sets the note and interval relative to the root note to None, if the interval type has not been provided.
             note, interval = None, None
 
-        setattr(self, f"{interval_name}_note", note)
+        self._notes[interval_name] = note
 
-        setattr(self, f"{interval_name}_interval", interval)
+        self._intervals[interval_name] = interval
 
 
 
@@ -121,30 +306,22 @@ class Chord:
         
         """
         Determines if an interval type has been set that requires additional interval dependencies.
+
+        The interval types that have been set are resolved against DEPENDENCY_RESOLUTION_TABLE in a single lookup, 
+        and every required interval type that is currently set to None is set to its default value.
         
         """
 
-        for interval_name, dependencies in INTERVAL_DEPENDENCIES_DICT.items():
-
-            # Retrieves the interval type attribute.
-            interval_type = getattr(self, f"{interval_name}_type")
-
-            if interval_type:
+        # Retrieves the dependent interval names that have an interval type set.
+        requested = frozenset(interval_name for interval_name in DEPENDENT_INTERVAL_NAMES if self._types[interval_name] is not None)
 
-                for dependency in dependencies:
+        for dependency, default_interval_type in DEPENDENCY_RESOLUTION_TABLE[requested]:
 
-                    # Retrieves the dependency interval type attribute.
-                    interval_dependency_type = getattr(self, f"{dependency}_type")
+            # Sets the dependency interval type attribute to a default value, if the interval type has not been provided.
+            if self._types[dependency] is None:
 
-                    # Sets the dependency interval type attribute to a default value, if the interval type has not been provided.
-                    if interval_dependency_type is None:
-
-                        default_interval_type = DEFAULT_INTERVAL_TYPES.get(dependency)
-                        
-                        # Sets the corresponding note and interval attributes, based on the dependency interval type attribute.
-                        self._add_interval_type_and_attributes(dependency, default_interval_type)
-
-                break
+                # Records the dependency interval type; its note and interval attributes are calculated on first access.
+                self._add_interval_type_and_attributes(dependency, default_interval_type)
 
     def _add_interval_type_and_attributes(self, 
                                           interval_name: str, 
@@ -152,7 +329,7 @@ class Chord:
                                           ) -> None:
         
         """
-        Sets the interval type with its note and interval attributes.
+        Sets the interval type; its note and interval attributes are calculated on first access.
 
         Args:
 
@@ -162,19 +339,7 @@ class Chord:
         
         """
 
-        # Calculates the note and interval relative to the root note for the corresponding interval type.
-        note, interval = self.calculate_note_and_interval(interval_type)
-
-        setattr(self, f"{interval_name}_type", interval_type)
-
-        setattr(self, f"{interval_name}_note", note)
-
-        setattr(self, f"{interval_name}_interval", interval)
-
-        # Ensures that the root interval type is fully added.
-        if interval_name == "root":
-
-            setattr(self, f"{interval_name}_index", CHROMATIC_SCALE.index(self.root_note))
+        self._set_interval_type(interval_name, interval_type)
 
 
 
@@ -183,9 +348,9 @@ class Chord:
                      ) -> None:
 
         """
-        Updates the root note and recalculates the note and interval attributes for all other assigned interval types.
+        Updates the root note and marks the note attributes for all other assigned interval types as dirty.
 
-        Sets a new root note for the chord, and recalculates all other assigned interval types, relative to the new root note.
+        Sets a new root note for the chord; all other assigned notes are recalculated relative to the new root note on first access.
 
         Args:
 
@@ -193,15 +358,7 @@ class Chord:
         
         """
 
-        # Initialises the fundamental tone of the chord.
-        self.root_type: RootType = new_root_type
-        # Initialises the string representation of the new root note.
-        self.root_note: str = self.root_type.value
-        # Initialises the new root index position in the chromatic scale.
-        self.root_index: int = CHROMATIC_SCALE.index(self.root_note)
-
-        # Calculates the note and interval attributes for all interval types provided.
-        self.initialise_notes_and_intervals()
+        self._set_interval_type("root", new_root_type)
 
 
 
@@ -220,26 +377,26 @@ class Chord:
         
         Returns:
 
-            str: The note in the chromatic scale that corresponds to the root note index position and the interval type.
-            int: The interval in the chromatic scale that corresponds to the root note index position and the note.
+            str: The note that corresponds to the root note and the interval type, spelled from the root note's letter name (e.g., "D#" as the major third of "B").
+            int: The interval in steps of the chord's tuning that corresponds to the root note index position and the note.
         
         """
 
         if interval_type.__class__ == RootType:
 
-            # Retrieves the interval as a value in semitones between the root note and the target note.
-            interval: int = INTERVAL_DICT["unison"]
+            # Retrieves the interval as a value in steps between the root note and the target note.
+            interval: int = 0
 
             # Accesses the string representation from the RootType value directly.
             note: str = interval_type.value
         
         else:
 
-            # Retrieves the interval as a value in semitones between the root note and the target note.
-            interval: int = INTERVAL_DICT[interval_type.value]
+            # Retrieves the interval as a value in steps of the chord's tuning between the root note and the target note; in 12-TET, steps are the interval type's integer semitones.
+            interval: int = interval_type.semitones if self.tuning is TWELVE_TET else self.tuning.interval_steps[interval_type.value]
 
-            # Calculates the string representation of the interval.
-            note: str = CHROMATIC_SCALE[(self.root_index + interval) % CHROMATIC_LEN]
+            # Retrieves the string representation of the interval, spelled from the root note's letter name and the interval's generic size.
+            note: str = SPELLING_TABLE[self._types["root"]][interval_type.value]
 
         return note, interval
     
@@ -264,17 +421,18 @@ class Chord:
         
         """
 
-        valid_enum_types = (RootType, SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType)
+        # Resolves the interval name with a single lookup in the registry of interval type Enums (see app/registry.py).
+        family = INTERVAL_FAMILIES.get(interval_type.__class__)
 
-        if not isinstance(interval_type, valid_enum_types):
+        if family is None:
 
             raise ValueError(f"Invalid interval_type: {interval_type} must be an instance of a valid Enum type.")
         
 
 
-        interval_name = self._extract_name_from_type(interval_type)
+        interval_name = family.interval_name
 
-        if interval_type == getattr(self, f"{interval_name}_type"):
+        if interval_type == self._types[interval_name]:
 
             # Removes the interval type and its note and interval attributes, if the interval type is already present in the chord.
             self._remove_interval_type_and_attributes(interval_name)
@@ -284,7 +442,7 @@ class Chord:
             # Adds the interval type and its note and interval attributes, if the interval type is not already present in the chord.
             self._add_interval_type_and_attributes(interval_name, interval_type)
 
-            # Calculates the note and interval attributes for all interval types dependencies that are currently set to None values.
+            # Records the default interval types for all interval types dependencies that are currently set to None values.
             self.initialise_dependencies()
 
     def _remove_interval_type_and_attributes(self, 
@@ -300,14 +458,7 @@ class Chord:
         
         """
 
-        setattr(self, f"{interval_name}_type", None)
-        setattr(self, f"{interval_name}_note", None)
-        setattr(self, f"{interval_name}_interval", None)
-
-        # Ensures that the root interval type is fully removed.
-        if interval_name == "root":
-
-            setattr(self, f"{interval_name}_index", None)
+        self._set_interval_type(interval_name, None)
 
 
 
@@ -317,6 +468,7 @@ class Chord:
         Generates a list of string representations for all notes in the chord.
 
         Aggregates the note attributes for all assigned interval types, ordered relative to the root note in the chromatic scale.
+        The signature is cached until an interval type or the root note changes; only the dirty note attributes are recalculated.
 
         Returns:
 
@@ -324,24 +476,15 @@ class Chord:
 
         """
 
-        # Stores all note attributes from the chord, including None values.
-        note_signature = [
-            
-            self.root_note, 
-            self.second_note, 
-            self.third_note, 
-            self.fourth_note, 
-            self.fifth_note, 
-            self.sixth_note, 
-            self.seventh_note, 
-            self.ninth_note, 
-            self.eleventh_note, 
-            self.thirteenth_note
-            
-            ]
+        if self._note_signature is None:
 
-        # Returns an ordered list comprehension containing the notes from the chord, with any None values removed.
-        return [note for note in note_signature if note is not None]
+            # Stores all note attributes from the chord, including None values.
+            note_signature = [self._get_note(interval_name) for interval_name in INTERVAL_SLOT_NAMES]
+
+            # Stores an ordered list comprehension containing the notes from the chord, with any None values removed.
+            self._note_signature = [note for note in note_signature if note is not None]
+
+        return list(self._note_signature)
 
     def get_interval_signature(self) -> List[int]:
 
@@ -349,6 +492,7 @@ class Chord:
         Generates a list of intervals for all notes in the chord.
 
         Aggregates the interval attributes for all assigned interval types, ordered relative to the root note in the chromatic scale.
+        The signature is cached until an interval type changes; only the dirty interval attributes are recalculated.
         
         Returns:
 
@@ -356,23 +500,218 @@ class Chord:
 
         """
 
-        interval_signature = [
+        if self._interval_signature is None:
 
-            self.root_interval,
-            self.second_interval, 
-            self.third_interval,
-            self.fourth_interval,
-            self.fifth_interval, 
-            self.sixth_interval, 
-            self.seventh_interval, 
-            self.ninth_interval, 
-            self.eleventh_interval, 
-            self.thirteenth_interval
-            
-            ]
+            # Stores all interval attributes from the chord, including None values.
+            interval_signature = [self._get_interval(interval_name) for interval_name in INTERVAL_SLOT_NAMES]
+        
+            # Stores an ordered list comprehension containing the intervals from the chord, with any None values removed.
+            self._interval_signature = [interval for interval in interval_signature if interval is not None]
+
+        return list(self._interval_signature)
+
+    def get_cents_signature(self) -> List[float]:
+
+        """
+        Generates a list of the sizes in cents of all intervals in the chord, from the chord's tuning.
+
+        Unlike the interval signature, the cents signature distinguishes tunings that share the same steps (e.g., a just major third of 386.3 cents in 5-limit just intonation).
+
+        Returns:
+
+            List[float]: An ordered list containing the size in cents of each assigned interval type, starting from the root note (0.0).
+
+        """
+
+        interval_cents = self.tuning.interval_cents
+
+        return [0.0 if interval_name == "root" else interval_cents[interval_type.value] 
+                for interval_name, interval_type in self._types.items() if interval_type is not None]
+
+
+
+    def _get_bass_note(self) -> Optional[str]:
+
+        """
+        Spells the bass note from the root note, if an inversion or a slash bass note has been set; None if the root note is in the bass.
+
+        An inversion whose chord tone has been removed, or a chord whose root note has been removed, returns to root position.
+        
+        """
+
+        if self._bass_slot is not None:
+
+            return self._get_note(self._bass_slot)
+
+        if self._bass_fifths is not None and self._types["root"] is not None:
+
+            return note_at_position(line_of_fifths_position(self._types["root"].value) + self._bass_fifths)
+
+        return None
+
+    @property
+    def bass_note(self) -> Optional[str]:
+
+        """
+        The lowest note of the chord; the root note, unless a slash bass note or an inversion has been set.
+        
+        """
+
+        bass_note = self._get_bass_note()
+
+        return self._get_note("root") if bass_note is None else bass_note
+
+    @property
+    def bass_index(self) -> Optional[int]:
+
+        """
+        The position of the bass note in the tuning's scale, represented as an index; None if there is no bass note.
+        
+        """
+
+        bass_note = self._get_bass_note()
+
+        return self.root_index if bass_note is None else self.tuning.note_index(bass_note)
+
+    def set_bass(self, 
+                 bass: Optional[Union[RootType, str]]
+                 ) -> None:
+        
+        """
+        Sets a slash bass note below the chord (e.g., RootType.E for C/E, or "C" for D/C); None restores the root note to the bass.
+
+        The bass note is recorded relative to the root note, so a new root note moves it with the chord (e.g., C/E becomes D/F#).
+
+        Args:
+
+            bass (Optional[Union[RootType, str]]): The bass note, as a RootType or a spelled note with any number of accidentals (e.g., "F##", or "Bbbb" in a Cb diminished seventh chord).
+        
+        """
+
+        bass_note = bass.value if isinstance(bass, RootType) else bass
+
+        if bass_note is not None and (not isinstance(bass_note, str) or NOTE_PATTERN.fullmatch(bass_note) is None):
+
+            raise ValueError(f"Invalid bass note: {bass!r} must be a RootType or a spelled note (e.g., 'E', 'Bb', 'F##').")
+
+        if bass_note is not None and self._types["root"] is None:
+
+            raise ValueError(f"Invalid bass note: {bass!r} cannot be set, as the chord has no root note.")
+
+        fifths = None if bass_note is None else line_of_fifths_position(bass_note) - line_of_fifths_position(self._types["root"].value)
+
+        # Records the root note itself as root position.
+        self._bass_slot, self._bass_fifths = None, fifths or None
+
+        self._bass_interval_signature = None
+
+    def invert(self, 
+               inversion: int
+               ) -> None:
+        
+        """
+        Puts a chord tone in the bass, as the n-th note of the note signature (e.g., 1 for the first inversion of a triad, with the third in the bass); 0 restores root position.
+
+        The inversion is recorded as the interval name of the chord tone, so it follows a new root note or interval type (e.g., C/E becomes D/F#, or Cm/Eb).
+
+        Args:
+
+            inversion (int): The position of the bass note in the note signature.
         
-        # Returns an ordered list comprehension containing the intervals from the chord, with any None values removed.
-        return [interval for interval in interval_signature if interval is not None]
+        """
+
+        if self._types["root"] is None:
+
+            raise ValueError("Invalid chord: the chord must have a root note.")
+
+        # Stores the interval names of the notes in the note signature, in order.
+        interval_names = [interval_name for interval_name in INTERVAL_SLOT_NAMES if self._get_note(interval_name) is not None]
+
+        if not 0 <= inversion < len(interval_names):
+
+            raise ValueError(f"Invalid inversion: {inversion} must be from 0 to {len(interval_names) - 1}.")
+
+        self._bass_slot, self._bass_fifths = None if inversion == 0 else interval_names[inversion], None
+
+        self._bass_interval_signature = None
+
+    @property
+    def inversion(self) -> Optional[int]:
+
+        """
+        The position of the bass note in the note signature; 0 in root position, and None if the bass note is not a chord tone (e.g., D/C).
+        
+        """
+
+        if self._get_bass_note() is None:
+
+            return 0
+
+        if self._bass_slot is not None:
+
+            return [interval_name for interval_name in INTERVAL_SLOT_NAMES if self._get_note(interval_name) is not None].index(self._bass_slot)
+
+        bass_index = self.bass_index
+
+        for position, note in enumerate(self.get_note_signature()):
+
+            if self.tuning.note_index(note) == bass_index:
+
+                return position
+
+        return None
+
+    def get_bass_interval_signature(self) -> List[int]:
+
+        """
+        Generates a list of intervals for all notes in the chord relative to the bass note, in close position.
+
+        The root position interval signature is rotated to start from the bass note (see utils.invert_interval_signature), rather than rebuilding the chord;
+        the signature is cached until an interval type, the root note or the bass note changes.
+
+        Returns:
+
+            List[int]: An ordered list of intervals above the bass note, starting from the bass note (0); the interval signature in root position.
+
+        """
+
+        if self._bass_interval_signature is None:
+
+            interval_signature = self.get_interval_signature()
+
+            if self._get_bass_note() is not None:
+
+                interval_signature = invert_interval_signature(interval_signature, self.bass_index - self.root_index, self.tuning.divisions)
+
+            self._bass_interval_signature = interval_signature
+
+        return list(self._bass_interval_signature)
+
+    def get_bass_note_signature(self) -> List[str]:
+
+        """
+        Generates a list of string representations for all notes in the chord, starting from the bass note in close position (e.g., ["E", "G", "C"] for C/E).
+        
+        """
+
+        note_signature = self.get_note_signature()
+
+        bass_note = self._get_bass_note()
+
+        if bass_note is None:
+
+            return note_signature
+
+        bass_index, divisions = self.bass_index, self.tuning.divisions
+
+        notes = sorted(note_signature, key=lambda note: (self.tuning.note_index(note) - bass_index) % divisions)
+
+        # Adds the bass note below the chord, if it is not a chord tone.
+        if self.inversion is None:
+
+            notes.insert(0, bass_note)
+
+        return notes
 
 
 
@@ -381,24 +720,247 @@ class Chord:
                                 ) -> str:
         
         """
-        Extracts and formats the interval name from the interval type (e.g., ThirteenthType -> "thirteenth").
+        Looks up the interval name of the interval type in the registry of interval type Enums (e.g., ThirteenthType -> "thirteenth").
 
         Args:
 
-            interval_type (Optional[IntervalType]): The interval type Enum to have its interval name extracted and formatted.
+            interval_type (Optional[IntervalType]): The interval type Enum to have its interval name looked up.
 
         Returns:
 
-            str: The name of the interval type, reformatted as a lowercase string (e.g., "thirteenth").
+            str: The interval name of the interval type (e.g., "thirteenth").
                     
         """
 
-        interval_name: str = interval_type.__class__.__name__.lower().replace("type", "")
+        interval_name: str = interval_family(interval_type).interval_name
 
         return interval_name
 
 
 
+    def to_bytes(self) -> bytes:
+
+        """
+        Packs the root note and interval types into four bytes, as the chord ID of their small-integer codes (see app/library/codes.py).
+
+        The root note keeps its spelling (e.g., RootType.D_FLAT rather than RootType.C_SHARP); the tuning and any slash bass note are not packed.
+
+        Returns:
+
+            bytes: The packed chord.
+
+        """
+
+        return CHORD_STRUCT.pack(self.snapshot())
+
+    @classmethod
+    def from_bytes(cls, 
+                   data: bytes,
+                   tuning: Optional[Tuning] = None
+                   ) -> "Chord":
+
+        """
+        Unpacks a chord packed by to_bytes().
+
+        Args:
+
+            data (bytes): The packed chord; any bytes-like object of four bytes.
+            tuning (Optional[Tuning]): The tuning that the intervals are measured in; defaults to 12-TET.
+
+        Returns:
+
+            Chord: The chord with the packed root note and interval types.
+
+        """
+
+        if len(data) != CHORD_STRUCT.size:
+
+            raise ValueError(f"Invalid data: {len(data)} bytes provided, expected {CHORD_STRUCT.size}.")
+
+        (chord_id,) = CHORD_STRUCT.unpack(data)
+
+        if chord_id >= CHORD_ID_COUNT:
+
+            raise ValueError(f"Invalid data: {chord_id} is not a valid chord ID.")
+
+        return cls.from_interval_types(decode_interval_types(unpack_codes(chord_id)), tuning)
+
+    def snapshot(self) -> int:
+
+        """
+        Returns an immutable snapshot of the root note and interval types, as the chord ID packed by to_bytes().
+        
+        """
+
+        return pack_codes(encode_interval_types(self._types))
+
+    def restore(self, 
+                snapshot: int
+                ) -> None:
+
+        """
+        Restores the root note and interval types from a snapshot; only the interval names that differ are marked as dirty.
+
+        Args:
+
+            snapshot (int): A snapshot returned by snapshot().
+        
+        """
+
+        for interval_name, interval_type in decode_interval_types(unpack_codes(snapshot)).items():
+
+            if self._types[interval_name] != interval_type:
+
+                self._set_interval_type(interval_name, interval_type)
+
+    def state(self) -> int:
+
+        """
+        Returns an immutable snapshot of the root note, interval types and bass note, as a single integer: the chord ID plus CHORD_ID_COUNT times the bass code.
+
+        The bass code is 0 in root position, the index in INTERVAL_SLOT_NAMES of the chord tone in the bass for an inversion, or BASS_SLASH_CODE plus the zigzag-encoded
+        distance in fifths from the root note for a slash bass note; a chord in root position has the same state as its snapshot().
+
+        """
+
+        if self._bass_slot is not None:
+
+            bass_code = INTERVAL_SLOT_NAMES.index(self._bass_slot)
+
+        elif self._bass_fifths is not None:
+
+            # Maps positive distances to even numbers and negative distances to odd numbers, so that every distance has a non-negative code.
+            bass_code = BASS_SLASH_CODE + (2 * self._bass_fifths if self._bass_fifths > 0 else -2 * self._bass_fifths - 1)
+
+        else:
+
+            bass_code = 0
+
+        return self.snapshot() + CHORD_ID_COUNT * bass_code
+
+    def restore_state(self, 
+                      state: int
+                      ) -> None:
+
+        """
+        Restores the root note, interval types and bass note from a state returned by state(); only the interval names that differ are marked as dirty.
+
+        """
+
+        bass_code, snapshot = divmod(state, CHORD_ID_COUNT)
+
+        self.restore(snapshot)
+
+        if bass_code >= BASS_SLASH_CODE:
+
+            zigzag = bass_code - BASS_SLASH_CODE
+
+            self._bass_slot, self._bass_fifths = None, zigzag // 2 if zigzag % 2 == 0 else -(zigzag + 1) // 2
+
+        else:
+
+            self._bass_slot, self._bass_fifths = INTERVAL_SLOT_NAMES[bass_code] if bass_code else None, None
+
+        self._bass_interval_signature = None
+
+    @classmethod
+    def from_state(cls, 
+                   state: int,
+                   tuning: Optional[Tuning] = None
+                   ) -> "Chord":
+
+        """
+        Constructs a chord from a state returned by state().
+
+        """
+
+        chord = cls.from_interval_types(decode_interval_types(unpack_codes(state % CHORD_ID_COUNT)), tuning)
+
+        chord.restore_state(state)
+
+        return chord
+
+    def __reduce__(self) -> Tuple[object, Tuple[bytes, Optional[Union[str, Tuning]], Optional[str], Optional[int]]]:
+
+        """
+        Pickles the chord in its packed form, with its tuning unless it is 12-TET and any inversion or slash bass note, rather than with its attribute dictionaries.
+
+        A registered tuning (see tuning.is_registered) is pickled by name; any other tuning (e.g., a Tuning constructed directly) is pickled whole, so that it is restored rather than looked up.
+        
+        """
+
+        tuning = None if self.tuning is TWELVE_TET else self.tuning.name if is_registered(self.tuning) else self.tuning
+
+        return _unpickle_chord, (self.to_bytes(), tuning, self._bass_slot, self._bass_fifths)
+
+
+
+def _unpickle_chord(data: bytes, 
+                    tuning: Optional[Union[str, Tuning]],
+                    bass_slot: Optional[str] = None,
+                    bass_fifths: Optional[int] = None
+                    ) -> Chord:
+
+    """
+    Restores a chord pickled by Chord.__reduce__().
+    
+    """
+
+    chord = Chord.from_bytes(data, get_tuning(tuning) if isinstance(tuning, str) else tuning)
+
+    chord._bass_slot, chord._bass_fifths = bass_slot, bass_fifths
+
+    return chord
+
+def _interval_type_property(interval_name: str) -> property:
+
+    """
+    Creates the interval type attribute for the interval name (e.g., "thirteenth_type"); assigning to it marks the note and interval attributes as dirty.
+    
+    """
+
+    return property(lambda self: self._get_interval_type(interval_name), 
+                    lambda self, interval_type: self._set_interval_type(interval_name, interval_type))
+
+def _interval_note_property(interval_name: str) -> property:
+
+    """
+    Creates the lazily calculated note attribute for the interval name (e.g., "thirteenth_note").
+    
+    """
+
+    return property(lambda self: self._get_note(interval_name))
+
+def _interval_interval_property(interval_name: str) -> property:
+
+    """
+    Creates the lazily calculated interval attribute for the interval name (e.g., "thirteenth_interval").
+    
+    """
+
+    return property(lambda self: self._get_interval(interval_name))
+
+# Adds the type, note and interval attributes for the root note and all interval names to the Chord class.
+for _interval_name in INTERVAL_SLOT_NAMES:
+
+    setattr(Chord, f"{_interval_name}_type", _interval_type_property(_interval_name))
+    setattr(Chord, f"{_interval_name}_note", _interval_note_property(_interval_name))
+    setattr(Chord, f"{_interval_name}_interval", _interval_interval_property(_interval_name))
+
+
+# Registers the chord engine methods for opt-in instrumentation; the original methods are used while instrumentation is disabled.
+instrument_methods(Chord, 
+                   ["__init__", "set_new_root", "calculate_note_and_interval", "add_or_remove_interval_type_and_attributes", "get_note_signature", "get_interval_signature", "_get_note", "_get_interval"],
+                   cache_probes={
+                       
+                       "get_note_signature": lambda self: self._note_signature is not None,
+                       "get_interval_signature": lambda self: self._interval_signature is not None,
+                       "_get_note": lambda self, interval_name: interval_name in self._notes,
+                       "_get_interval": lambda self, interval_name: interval_name in self._intervals
+
+                       })
+
+
 if __name__ == "__main__":
 
     print("--------------------")
@@ -0,0 +1,295 @@
+import numpy as np
+
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Union
+
+from app.chord import Chord
+from app.library.codes import SLOT_TYPES, SLOT_MEMBERS, SLOT_CODES, SLOT_SEMITONES, SLOT_SIZES, ROOT_TYPES_BY_INDEX, encode_interval_types, decode_interval_types
+from app.spelling import SPELLING_TABLE
+from config.config import CHROMATIC_LEN, INTERVAL_NAMES, INTERVAL_SLOT_NAMES, DEFAULT_INTERVAL_TYPES
+
+# Stores the value in semitones for each code of each interval name as lookup arrays; -1 marks an interval type that has not been set.
+_SEMITONE_TABLES: Dict[str, np.ndarray] = {
+
+    interval_name: np.array([-1, *semitones[1:]], dtype=np.int8)
+    for interval_name, semitones in zip(INTERVAL_SLOT_NAMES, SLOT_SEMITONES) if interval_name != "root"
+
+}
+
+# Stores the root note code of the RootType spelled as in CHROMATIC_SCALE for each chromatic scale index, with index -1 (the last entry) mapping to code 0.
+_CANONICAL_ROOT_CODES: np.ndarray = np.array([*(SLOT_CODES[0][root_type] for root_type in ROOT_TYPES_BY_INDEX), 0], dtype=np.uint8)
+
+def _build_spelled_names() -> np.ndarray:
+
+    """
+    Builds the spelled note for every (root note code, slot, interval type code) triple, so that note names are converted with a single lookup.
+
+    Returns:
+
+        np.ndarray: An object array of shape (root note codes, slots, interval type codes); None where there is no note.
+
+    """
+
+    spelled_names = np.full((SLOT_SIZES[0], len(INTERVAL_SLOT_NAMES), max(SLOT_SIZES)), None, dtype=object)
+
+    for root_type, root_code in SLOT_CODES[0].items():
+
+        spelled_names[root_code, 0, :] = root_type.value
+
+        for slot_index in range(1, len(INTERVAL_SLOT_NAMES)):
+
+            for code, member in enumerate(SLOT_MEMBERS[slot_index], start=1):
+
+                spelled_names[root_code, slot_index, code] = SPELLING_TABLE[root_type][member.value]
+
+    return spelled_names
+
+_SPELLED_NAMES: np.ndarray = _build_spelled_names()
+
+class ChordArray:
+
+    """
+    A columnar container for many chords, storing a root index column and one small-integer code column per interval name.
+
+    Each chord costs eleven bytes, rather than a Chord instance with its own dictionaries, and the transposition, signature and filtering operations are vectorised.
+
+    Attributes:
+
+        root_index (np.ndarray): The position of each root note in the chromatic scale, as int8; -1 where the root note has been removed.
+        codes (Dict[str, np.ndarray]): The interval type code of each chord, as uint8, keyed by the names in INTERVAL_SLOT_NAMES (see app/library/codes.py); 0 where the interval type has not been set.
+                                       The "root" column records the spelling of the root note (e.g., RootType.D_FLAT rather than RootType.C_SHARP).
+
+    """
+
+    def __init__(self,
+                 root_index: np.ndarray,
+                 codes: Dict[str, np.ndarray]
+                 ):
+
+        self.root_index: np.ndarray = np.asarray(root_index, dtype=np.int8)
+
+        # Spells each root note as in CHROMATIC_SCALE, if the root note codes have not been provided.
+        root_codes = codes["root"] if "root" in codes else _CANONICAL_ROOT_CODES[self.root_index]
+
+        self.codes: Dict[str, np.ndarray] = {interval_name: np.asarray(root_codes if interval_name == "root" else codes[interval_name], dtype=np.uint8) for interval_name in INTERVAL_SLOT_NAMES}
+
+        for interval_name, column in self.codes.items():
+
+            if column.shape != self.root_index.shape:
+
+                raise ValueError(f"Invalid column: {interval_name} has shape {column.shape}, expected {self.root_index.shape}.")
+
+    @classmethod
+    def empty(cls,
+              length: int
+              ) -> "ChordArray":
+
+        """
+        Constructs a container of C Major chords.
+
+        Args:
+
+            length (int): The number of chords.
+
+        """
+
+        codes = {interval_name: np.zeros(length, dtype=np.uint8) for interval_name in INTERVAL_SLOT_NAMES}
+
+        codes["root"][:] = SLOT_CODES[0][DEFAULT_INTERVAL_TYPES["root"]]
+        codes["third"][:] = SLOT_CODES[INTERVAL_SLOT_NAMES.index("third")][DEFAULT_INTERVAL_TYPES["third"]]
+        codes["fifth"][:] = SLOT_CODES[INTERVAL_SLOT_NAMES.index("fifth")][DEFAULT_INTERVAL_TYPES["fifth"]]
+
+        return cls(np.zeros(length, dtype=np.int8), codes)
+
+    @classmethod
+    def from_chords(cls,
+                    chords: Iterable[Chord]
+                    ) -> "ChordArray":
+
+        """
+        Constructs a container from individual Chord objects.
+
+        Args:
+
+            chords (Iterable[Chord]): The chords to store.
+
+        """
+
+        # Indexes each root note in the chromatic scale, whatever the chord's tuning.
+        rows = [(-1 if chord.root_type is None else chord.root_type.index, encode_interval_types(chord.get_interval_types())) for chord in chords]
+
+        root_index = np.fromiter((row[0] for row in rows), dtype=np.int8, count=len(rows))
+
+        codes = np.array([row[1] for row in rows], dtype=np.uint8).reshape(len(rows), len(INTERVAL_SLOT_NAMES))
+
+        return cls(root_index, {interval_name: codes[:, slot_index] for slot_index, interval_name in enumerate(INTERVAL_SLOT_NAMES)})
+
+    def to_chords(self) -> List[Chord]:
+
+        """
+        Converts the container to individual Chord objects.
+
+        """
+
+        return [self[index] for index in range(len(self))]
+
+    def __len__(self) -> int:
+
+        return len(self.root_index)
+
+    def __getitem__(self,
+                    key: Union[int, slice, np.ndarray]
+                    ) -> Union[Chord, "ChordArray"]:
+
+        """
+        Returns a Chord object for an integer index, or a new container for a slice, index array or boolean mask.
+
+        """
+
+        if isinstance(key, (int, np.integer)):
+
+            return Chord.from_interval_types(decode_interval_types([int(self.codes[interval_name][key]) for interval_name in INTERVAL_SLOT_NAMES]))
+
+        return ChordArray(self.root_index[key], {interval_name: column[key] for interval_name, column in self.codes.items()})
+
+
+
+    def transpose(self,
+                  semitones: int
+                  ) -> "ChordArray":
+
+        """
+        Transposes every chord by a number of semitones; chords without a root note are unchanged, and transposed root notes are spelled as in CHROMATIC_SCALE.
+
+        Args:
+
+            semitones (int): The number of semitones to transpose by, positive or negative.
+
+        """
+
+        root_index = np.where(self.root_index < 0, self.root_index, (self.root_index.astype(np.int16) + semitones) % CHROMATIC_LEN).astype(np.int8)
+
+        return ChordArray(root_index, {interval_name: column.copy() for interval_name, column in self.codes.items() if interval_name != "root"})
+
+    def interval_signatures(self) -> np.ndarray:
+
+        """
+        Generates the interval attributes of every chord in a single array.
+
+        Returns:
+
+            np.ndarray: An int8 array of shape (len(self), 10), with one column per name in INTERVAL_SLOT_NAMES; -1 where the interval type has not been set.
+
+        """
+
+        signatures = np.empty((len(self), len(INTERVAL_SLOT_NAMES)), dtype=np.int8)
+
+        signatures[:, 0] = np.where(self.root_index < 0, -1, 0)
+
+        for slot_index, interval_name in enumerate(INTERVAL_NAMES, start=1):
+
+            signatures[:, slot_index] = _SEMITONE_TABLES[interval_name][self.codes[interval_name]]
+
+        return signatures
+
+    def note_signatures(self) -> np.ndarray:
+
+        """
+        Generates the note indices in the chromatic scale of every chord in a single array.
+
+        Returns:
+
+            np.ndarray: An int8 array of shape (len(self), 10), with one column per name in INTERVAL_SLOT_NAMES; -1 where there is no note.
+
+        """
+
+        intervals = self.interval_signatures()
+
+        notes = (intervals.astype(np.int16) + self.root_index[:, None]) % CHROMATIC_LEN
+
+        return np.where((intervals < 0) | (self.root_index[:, None] < 0), -1, notes).astype(np.int8)
+
+    def note_names(self) -> List[List[str]]:
+
+        """
+        Generates the note signature of every chord, matching Chord.get_note_signature().
+
+        """
+
+        codes = np.stack([self.codes[interval_name] for interval_name in INTERVAL_SLOT_NAMES], axis=1)
+
+        names = _SPELLED_NAMES[self.codes["root"][:, None], np.arange(len(INTERVAL_SLOT_NAMES))[None, :], codes]
+
+        return [[name for name in row if name is not None] for row in names.tolist()]
+
+    def pitch_class_masks(self) -> np.ndarray:
+
+        """
+        Generates a 12-bit mask of the pitch classes in every chord, with bit n set for the note at index n in the chromatic scale.
+
+        Returns:
+
+            np.ndarray: A uint16 array of shape (len(self),).
+
+        """
+
+        notes = self.note_signatures()
+
+        bits = np.where(notes < 0, 0, np.left_shift(1, np.where(notes < 0, 0, notes).astype(np.uint16)))
+
+        return np.bitwise_or.reduce(bits.astype(np.uint16), axis=1)
+
+
+
+    def filter(self,
+               mask: Optional[np.ndarray] = None,
+               **interval_types: Optional[Enum]
+               ) -> "ChordArray":
+
+        """
+        Selects the chords that match a boolean mask and/or interval types (e.g., root=RootType.C, seventh=SeventhType.MINOR, ninth=None).
+
+        Args:
+
+            mask (Optional[np.ndarray]): A boolean array of shape (len(self),); defaults to None.
+            **interval_types (Optional[Enum]): The interval type that each selected chord must have, keyed by interval name; None selects chords without the interval type.
+
+        Returns:
+
+            ChordArray: A new container with the selected chords.
+
+        """
+
+        selected = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+
+        for interval_name, interval_type in interval_types.items():
+
+            if interval_name not in INTERVAL_SLOT_NAMES:
+
+                raise ValueError(f"Invalid interval name: {interval_name} must be one of {INTERVAL_SLOT_NAMES}.")
+
+            if interval_name == "root":
+
+                selected &= self.root_index == (-1 if interval_type is None else interval_type.index)
+
+            else:
+
+                slot_index = INTERVAL_SLOT_NAMES.index(interval_name)
+
+                if interval_type is not None and not isinstance(interval_type, SLOT_TYPES[slot_index]):
+
+                    raise ValueError(f"Invalid interval_type: {interval_type} must be an instance of {SLOT_TYPES[slot_index].__name__}.")
+
+                selected &= self.codes[interval_name] == (0 if interval_type is None else SLOT_CODES[slot_index][interval_type])
+
+        return self[selected]
+
+    @property
+    def nbytes(self) -> int:
+
+        """
+        The number of bytes used by the columns.
+
+        """
+
+        return self.root_index.nbytes + sum(column.nbytes for column in self.codes.values())
@@ -0,0 +1,292 @@
+import threading
+
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Dict, Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+from app.chord import Chord
+from app.symbols import parse_chord
+from config.config import INTERVAL_SLOT_NAMES
+
+# Defines generic variable Type Hints for the keys and values of the cache.
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+class FrozenChord(NamedTuple):
+
+    """
+    An immutable snapshot of a chord, with every note and interval calculated before it is published, so that it can be shared between threads without locks.
+
+    Attributes:
+
+        chord_id (int): The chord ID of the interval types (see Chord.snapshot()).
+        notes (Tuple[str, ...]): The note signature.
+        intervals (Tuple[int, ...]): The interval signature.
+        interval_types (Tuple[Optional[Enum], ...]): The interval type of the root note and each interval name, in INTERVAL_SLOT_NAMES order.
+        bass (Optional[str]): The lowest note (see Chord.bass_note); the root note, unless a slash bass note or an inversion has been set.
+
+    """
+
+    chord_id: int
+    notes: Tuple[str, ...]
+    intervals: Tuple[int, ...]
+    interval_types: Tuple[Optional[Enum], ...]
+    bass: Optional[str] = None
+
+    @classmethod
+    def from_chord(cls,
+                   chord: Chord
+                   ) -> "FrozenChord":
+
+        interval_types = chord.get_interval_types()
+
+        return cls(chord.snapshot(), tuple(chord.get_note_signature()), tuple(chord.get_interval_signature()), tuple(interval_types[interval_name] for interval_name in INTERVAL_SLOT_NAMES), chord.bass_note)
+
+    @classmethod
+    def from_chord_id(cls,
+                      chord_id: int
+                      ) -> "FrozenChord":
+
+        """
+        Constructs the snapshot of a chord ID, or of a chord state with a bass note (see Chord.state()); a chord ID is the state of a chord in root position.
+
+        """
+
+        return cls.from_chord(Chord.from_state(chord_id))
+
+    @property
+    def root_note(self) -> Optional[str]:
+
+        return self.notes[0] if self.interval_types[0] is not None else None
+
+    def to_chord(self) -> Chord:
+
+        """
+        Constructs a new, mutable chord with the snapshot's interval types and bass note.
+
+        """
+
+        chord = Chord.from_interval_types(dict(zip(INTERVAL_SLOT_NAMES, self.interval_types)))
+
+        if self.bass != self.root_note:
+
+            chord.set_bass(self.bass)
+
+        return chord
+
+
+
+class _Flight:
+
+    """
+    A fill in progress, which threads that miss the same key wait on.
+
+    """
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+
+        self.done: threading.Event = threading.Event()
+
+        self.value: object = None
+
+        self.error: Optional[BaseException] = None
+
+class SingleFlightCache(Generic[Key, Value]):
+
+    """
+    A thread-safe cache with lock-free reads and serialized, single-flight fills.
+
+    A hit is a single dictionary lookup, without a lock. On a miss, the first thread registers a fill and calculates the value outside the lock,
+    while every other thread that misses the same key waits for that fill rather than calculating the value again; fills for different keys run concurrently.
+
+    Values must be immutable (e.g., FrozenChord), as they are shared between threads.
+
+    Attributes:
+
+        factory (Callable[[Key], Value]): The function that calculates the value for a key.
+        maxsize (Optional[int]): The maximum number of values kept, after which the oldest value is evicted; None keeps every value.
+        fills (int): The number of values calculated by the factory.
+
+    """
+
+    def __init__(self,
+                 factory: Callable[[Key], Value],
+                 maxsize: Optional[int] = None
+                 ):
+
+        if maxsize is not None and maxsize < 1:
+
+            raise ValueError(f"Invalid maxsize: {maxsize} must be at least 1.")
+
+        self.factory: Callable[[Key], Value] = factory
+
+        self.maxsize: Optional[int] = maxsize
+
+        self.fills: int = 0
+
+        # Stores the published values; only written while holding the lock, and read without it.
+        self._values: Dict[Key, Value] = {}
+
+        # Stores the fills in progress, keyed by the key being filled.
+        self._flights: Dict[Key, _Flight] = {}
+
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self,
+            key: Key
+            ) -> Value:
+
+        """
+        Returns the value for a key, calculating it once on the first miss.
+
+        Args:
+
+            key (Key): The key.
+
+        Returns:
+
+            Value: The value; if the factory raises an exception, every thread waiting on the fill raises it, and the next lookup retries.
+
+        """
+
+        try:
+
+            return self._values[key]
+
+        except KeyError:
+
+            pass
+
+        with self._lock:
+
+            if key in self._values:
+
+                return self._values[key]
+
+            flight = self._flights.get(key)
+
+            is_leader = flight is None
+
+            if is_leader:
+
+                flight = self._flights[key] = _Flight()
+
+        if not is_leader:
+
+            flight.done.wait()
+
+            if flight.error is not None:
+
+                raise flight.error
+
+            return flight.value
+
+        try:
+
+            flight.value = self.factory(key)
+
+        except BaseException as error:
+
+            flight.error = error
+
+            with self._lock:
+
+                del self._flights[key]
+
+            raise
+
+        finally:
+
+            flight.done.set()
+
+        with self._lock:
+
+            self._values[key] = flight.value
+
+            self.fills += 1
+
+            if self.maxsize is not None and len(self._values) > self.maxsize:
+
+                # Evicts the oldest value, as dictionaries keep their insertion order.
+                del self._values[next(iter(self._values))]
+
+            del self._flights[key]
+
+        return flight.value
+
+    def __contains__(self,
+                     key: Key
+                     ) -> bool:
+
+        return key in self._values
+
+    def __len__(self) -> int:
+
+        return len(self._values)
+
+    def clear(self) -> None:
+
+        with self._lock:
+
+            self._values = {}
+
+
+
+class ChordLookup:
+
+    """
+    A class to share published chord snapshots between threads, keyed by chord symbol or spec (see app/symbols.py) and by chord state.
+
+    The chord state includes the bass note (see Chord.state()), so a slash chord (e.g., "C/E") is published apart from its chord in root position (e.g., "C"),
+    while the state of a chord in root position is its chord ID.
+
+    Attributes:
+
+        by_symbol (SingleFlightCache[str, FrozenChord]): The snapshots, keyed by chord symbol or spec.
+        by_id (SingleFlightCache[int, FrozenChord]): The snapshots, keyed by chord state.
+
+    """
+
+    def __init__(self,
+                 maxsize: Optional[int] = None
+                 ):
+
+        self.by_id: SingleFlightCache[int, FrozenChord] = SingleFlightCache(FrozenChord.from_chord_id, maxsize)
+
+        self.by_symbol: SingleFlightCache[str, FrozenChord] = SingleFlightCache(lambda line: self.by_id.get(parse_chord(line).state()), maxsize)
+
+    def lookup(self,
+               line: str
+               ) -> FrozenChord:
+
+        """
+        Returns the published snapshot for a chord symbol (e.g., "F#m7") or spec (e.g., "root=F# third=MINOR").
+
+        """
+
+        return self.by_symbol.get(line)
+
+    def lookup_id(self,
+                  chord_id: int
+                  ) -> FrozenChord:
+
+        """
+        Returns the published snapshot for a chord ID, or for a chord state with a bass note (see Chord.state()).
+
+        """
+
+        return self.by_id.get(chord_id)
+
+
+
+@lru_cache(maxsize=None)
+def get_lookup() -> ChordLookup:
+
+    """
+    Returns the shared chord lookup, constructed on first use.
+
+    """
+
+    return ChordLookup()
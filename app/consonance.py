@@ -0,0 +1,279 @@
+import numpy as np
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Union
+
+from app.chord import Chord
+from app.chord_array import ChordArray
+from app.library.intervals import IntervalRow, load_intervals_table
+from app.utils import mask_bits, quality_mask
+from config.config import CHROMATIC_LEN, INTERVAL_SLOT_NAMES
+
+# Defines the tension of each sound characteristic in the intervals table, from 0.0 (consonant) to 1.0 (dissonant).
+SOUND_CHARACTERISTIC_TENSION: Dict[str, float] = {
+
+    "open_consonance": 0.0,
+    "soft_consonance": 0.2,
+    "consonance_or_dissonance": 0.4,
+    "mild_dissonance": 0.6,
+    "neutral_or_restless": 0.8,
+    "sharp_dissonance": 1.0
+
+}
+
+# Defines the number of distinct pitch class masks.
+MASK_COUNT: int = 1 << CHROMATIC_LEN
+
+# Defines the Plomp-Levelt roughness curve constants, as parameterised by Sethares.
+_ROUGHNESS_B1, _ROUGHNESS_B2 = 3.5, 5.75
+_ROUGHNESS_S1, _ROUGHNESS_S2 = 0.0207, 18.96
+_ROUGHNESS_DSTAR = 0.24
+
+def interval_vectors() -> np.ndarray:
+
+    """
+    Calculates the interval class vector of every pitch class mask with matrix operations.
+
+    Returns:
+
+        np.ndarray: A (4096, 6) array with the number of pairs of notes at each interval class (1 to 6 semitones) for each mask.
+
+    """
+
+    bits = mask_bits()
+
+    vectors = np.stack([(bits * np.roll(bits, -interval_class, axis=1)).sum(axis=1) for interval_class in range(1, 7)], axis=1)
+
+    # Counts each tritone pair once, as rotating by six semitones visits it twice.
+    vectors[:, 5] //= 2
+
+    return vectors
+
+class ConsonanceModel:
+
+    """
+    A class to score chords by tension and psychoacoustic roughness.
+
+    Tension is the mean tension of every pair of notes, weighted by the sound_characteristic column of the intervals table, and is precomputed for every pitch class mask.
+    Roughness applies the Plomp-Levelt model, as parameterised by Sethares, to every pair of harmonic partials of the voiced interval signature, for all chords at once.
+
+    Attributes:
+
+        interval_class_tension (np.ndarray): The tension of each interval class (1 to 6 semitones).
+        tension_table (np.ndarray): The tension of every pitch class mask, indexed by mask.
+        base_frequency (float): The frequency of the root note, in Hz, used for roughness.
+        partials (int): The number of harmonic partials of each note, used for roughness.
+
+    """
+
+    def __init__(self,
+                 rows: Optional[Sequence[IntervalRow]] = None,
+                 base_frequency: float = 261.63,
+                 partials: int = 6
+                 ):
+
+        tension_by_distance = {}
+
+        for row in (load_intervals_table() if rows is None else rows):
+
+            tension_by_distance.setdefault(row.interval_distance, SOUND_CHARACTERISTIC_TENSION[row.sound_characteristic])
+
+        # Averages the tension of an interval and its inversion, as a pitch class pair has no direction.
+        self.interval_class_tension: np.ndarray = np.array([(tension_by_distance[interval_class] + tension_by_distance[CHROMATIC_LEN - interval_class]) / 2
+                                                            for interval_class in range(1, 7)])
+
+        vectors = interval_vectors()
+
+        pair_counts = vectors.sum(axis=1)
+
+        self.tension_table: np.ndarray = np.divide(vectors @ self.interval_class_tension, pair_counts, out=np.zeros(MASK_COUNT), where=pair_counts > 0)
+
+        self.base_frequency: float = base_frequency
+
+        self.partials: int = partials
+
+        # Stores the roughness of every pitch class mask, once it has been calculated.
+        self._roughness_table: Optional[np.ndarray] = None
+
+    def _masks(self,
+               chords: Union[Sequence[Chord], ChordArray]
+               ) -> np.ndarray:
+
+        """
+        Returns the pitch class mask of every chord: relative to its root note for a sequence of chords, from the interval types' semitones so that it is the same in every tuning
+        (see utils.quality_mask), and absolute for a ChordArray; the tension of a mask does not change with transposition, so either can be looked up.
+
+        """
+
+        if isinstance(chords, ChordArray):
+
+            return chords.pitch_class_masks().astype(np.int64)
+
+        return np.fromiter((quality_mask(chord) for chord in chords), dtype=np.int64, count=len(chords))
+
+    def tension(self,
+                chords: Union[Sequence[Chord], ChordArray]
+                ) -> np.ndarray:
+
+        """
+        Scores every chord by tension, with a single table lookup per chord.
+
+        Args:
+
+            chords (Union[Sequence[Chord], ChordArray]): The candidate chords.
+
+        Returns:
+
+            np.ndarray: The tension of each chord, from 0.0 (consonant) to 1.0 (dissonant).
+
+        """
+
+        return self.tension_table[self._masks(chords)]
+
+    def roughness_of_signatures(self,
+                                signatures: np.ndarray
+                                ) -> np.ndarray:
+
+        """
+        Calculates the roughness of padded interval signatures, summed over every pair of partials, as a single set of array operations.
+
+        Args:
+
+            signatures (np.ndarray): A (chords, notes) array of semitones above the root note, fractional for intervals between the semitones of 12-TET; NaN where there is no note.
+
+        Returns:
+
+            np.ndarray: The roughness of each interval signature.
+
+        """
+
+        harmonics = np.arange(1, self.partials + 1)
+
+        # Calculates the frequency and amplitude of every partial of every note, as (chords, notes * partials) arrays.
+        frequencies = (self.base_frequency * 2.0 ** (signatures[:, :, None] / CHROMATIC_LEN) * harmonics[None, None, :]).reshape(len(signatures), -1)
+
+        amplitudes = np.where(np.isnan(frequencies), 0.0, np.tile(0.88 ** (harmonics - 1), signatures.shape[1])[None, :])
+
+        frequencies = np.nan_to_num(frequencies, nan=1.0)
+
+        lower = np.minimum(frequencies[:, :, None], frequencies[:, None, :])
+        difference = np.abs(frequencies[:, :, None] - frequencies[:, None, :])
+
+        scale = _ROUGHNESS_DSTAR / (_ROUGHNESS_S1 * lower + _ROUGHNESS_S2)
+
+        pair_roughness = amplitudes[:, :, None] * amplitudes[:, None, :] * (np.exp(-_ROUGHNESS_B1 * scale * difference) - np.exp(-_ROUGHNESS_B2 * scale * difference))
+
+        # Halves the sum, as every pair of partials is counted in both orders.
+        return pair_roughness.sum(axis=(1, 2)) / 2
+
+    def roughness(self,
+                  chords: Sequence[Chord]
+                  ) -> np.ndarray:
+
+        """
+        Scores every chord by the roughness of its voiced intervals, from the sizes in cents in the chord's tuning (see Chord.get_cents_signature),
+        with each interval raised by octaves until it is above the previous one, as in utils.interval_signature.
+
+        Args:
+
+            chords (Sequence[Chord]): The candidate chords.
+
+        Returns:
+
+            np.ndarray: The roughness of each chord.
+
+        """
+
+        signatures = np.full((len(chords), len(INTERVAL_SLOT_NAMES)), np.nan)
+
+        for row, chord in enumerate(chords):
+
+            voiced_cents = []
+
+            for cents in chord.get_cents_signature():
+
+                # Ensures the intervals remain in sequence above the root note, as in the voiced interval signature.
+                while voiced_cents and cents <= voiced_cents[-1]:
+
+                    cents += 1200
+
+                voiced_cents.append(cents)
+
+            signatures[row, :len(voiced_cents)] = [cents / 100 for cents in voiced_cents]
+
+        return self.roughness_of_signatures(signatures)
+
+    @property
+    def roughness_table(self) -> np.ndarray:
+
+        """
+        The roughness of every pitch class mask in close position above the root note, calculated on first access.
+
+        """
+
+        if self._roughness_table is None:
+
+            bits = mask_bits().astype(bool)
+
+            signatures = np.where(bits, np.arange(CHROMATIC_LEN, dtype=float)[None, :], np.nan)
+
+            self._roughness_table = np.concatenate([self.roughness_of_signatures(signatures[start:start + 256]) for start in range(0, MASK_COUNT, 256)])
+
+        return self._roughness_table
+
+    def rank(self,
+             chords: Sequence[Chord],
+             by: str = "tension"
+             ) -> List[int]:
+
+        """
+        Ranks chords from the most consonant to the most dissonant.
+
+        Args:
+
+            chords (Sequence[Chord]): The candidate chords.
+            by (str): The score to rank by, either "tension" or "roughness"; defaults to "tension".
+
+        Returns:
+
+            List[int]: The indices of the chords, in ranked order.
+
+        """
+
+        if by not in ("tension", "roughness"):
+
+            raise ValueError(f"Invalid score: {by} must be either 'tension' or 'roughness'.")
+
+        scores = self.tension(chords) if by == "tension" else self.roughness(chords)
+
+        return np.argsort(scores, kind="stable").tolist()
+
+
+
+@lru_cache(maxsize=None)
+def get_model() -> ConsonanceModel:
+
+    """
+    Returns the shared consonance model, constructed on first use.
+
+    """
+
+    return ConsonanceModel()
+
+def tension_scores(chords: Union[Sequence[Chord], ChordArray]) -> np.ndarray:
+
+    """
+    Scores every chord by tension, using the shared consonance model.
+
+    """
+
+    return get_model().tension(chords)
+
+def roughness_scores(chords: Sequence[Chord]) -> np.ndarray:
+
+    """
+    Scores every chord by roughness, using the shared consonance model.
+
+    """
+
+    return get_model().roughness(chords)
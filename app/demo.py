@@ -1,9 +1,3 @@
-import sys
-from pathlib import Path
-
-# Adds the project root directory to the Python path
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-
 from typing import List, Tuple, Dict, Optional, TypeVar
 
 from app.library.enums import RootType, SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType
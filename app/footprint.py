@@ -0,0 +1,260 @@
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from array import array
+from itertools import cycle, islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from app.chord import Chord
+from app.concurrency import FrozenChord, SingleFlightCache
+from app.library.codes import CHORD_ID_COUNT, SLOT_SIZES, decode_interval_types, unpack_codes
+from app.progression import Progression
+
+# Defines the numbers of objects measured by default, from a thousand to a million.
+BENCHMARK_COUNTS: Sequence[int] = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+# Defines the maximum bytes per object of each benchmark, enforced by the test suite; each budget leaves at least 25% headroom over the 64-bit CPython 3.11 measurements
+# (513, 1111, 460, 4.5 and 13.3 bytes, at the least favourable count from 10^3 to 10^5).
+FOOTPRINT_BUDGETS: Dict[str, int] = {
+
+    "chord": 640,
+    "warm_chord": 1408,
+    "cache_entry": 576,
+    "progression": 8,
+    "chord_array": 16
+
+}
+
+class Footprint(NamedTuple):
+
+    """
+    The memory measured for a number of objects.
+
+    Attributes:
+
+        name (str): The name of the benchmark (e.g., "chord").
+        count (int): The number of objects measured.
+        total_bytes (int): The bytes allocated by the objects and the container that holds them, as traced by tracemalloc.
+        bytes_per_object (float): The total bytes divided by the number of objects.
+
+    """
+
+    name: str
+    count: int
+    total_bytes: int
+    bytes_per_object: float
+
+def sample_chord_ids(count: int) -> Iterator[int]:
+
+    """
+    Yields distinct chord IDs that have a root note, in ascending order, from the first ID up.
+
+    """
+
+    # Skips the IDs whose root note code, the least significant digit, is 0 (no root note).
+    return islice((chord_id for chord_id in range(CHORD_ID_COUNT) if chord_id % SLOT_SIZES[0]), count)
+
+# Stores the number of distinct chord IDs with a root note, which bounds the number of distinct cache entries.
+CACHE_KEY_COUNT: int = CHORD_ID_COUNT - CHORD_ID_COUNT // SLOT_SIZES[0]
+
+def _interval_types(count: int) -> Iterator[Dict]:
+
+    """
+    Yields the interval types of count chords, cycling through a thousand distinct chords so that they are decoded before tracing starts.
+
+    """
+
+    samples = [decode_interval_types(unpack_codes(chord_id)) for chord_id in sample_chord_ids(min(count, 1000))]
+
+    return islice(cycle(samples), count)
+
+def _build_chords(count: int) -> Callable[[], List[Chord]]:
+
+    interval_types = list(_interval_types(count))
+
+    return lambda: [Chord.from_interval_types(types) for types in interval_types]
+
+def _build_warm_chords(count: int) -> Callable[[], List[Chord]]:
+
+    interval_types = list(_interval_types(count))
+
+    def build() -> List[Chord]:
+
+        chords = [Chord.from_interval_types(types) for types in interval_types]
+
+        # Fills each chord's lazy note and interval caches, as a chord that has been read once holds them.
+        for chord in chords:
+
+            chord.get_note_signature()
+            chord.get_interval_signature()
+
+        return chords
+
+    return build
+
+def _build_cache_entries(count: int) -> Callable[[], SingleFlightCache]:
+
+    if count > CACHE_KEY_COUNT:
+
+        raise ValueError(f"Invalid count: {count} cache entries requested, but only {CACHE_KEY_COUNT} distinct chord IDs have a root note.")
+
+    chord_ids = list(sample_chord_ids(count))
+
+    def build() -> SingleFlightCache:
+
+        cache = SingleFlightCache(FrozenChord.from_chord_id)
+
+        for chord_id in chord_ids:
+
+            cache.get(chord_id)
+
+        return cache
+
+    return build
+
+def _build_progression(count: int) -> Callable[[], Progression]:
+
+    chord_ids = list(islice(cycle(sample_chord_ids(1000)), count))
+
+    return lambda: Progression(array("I", chord_ids))
+
+def _build_chord_array(count: int) -> Callable[[], object]:
+
+    progression = _build_progression(count)()
+
+    return progression.to_chord_array
+
+# Maps each benchmark to a function that prepares its inputs for a number of objects, and returns the function that builds the objects.
+BENCHMARKS: Dict[str, Callable[[int], Callable[[], object]]] = {
+
+    "chord": _build_chords,
+    "warm_chord": _build_warm_chords,
+    "cache_entry": _build_cache_entries,
+    "progression": _build_progression,
+    "chord_array": _build_chord_array
+
+}
+
+def measure_footprint(name: str,
+                      count: int
+                      ) -> Footprint:
+
+    """
+    Measures the bytes per object of a benchmark with tracemalloc.
+
+    The inputs are prepared and a few objects are built before tracing starts, so that lazily compiled tables (e.g., tunings and spellings) are not counted;
+    the objects are then built while tracing, and only the memory that they still hold once built is counted.
+
+    Args:
+
+        name (str): The name of the benchmark, in BENCHMARKS.
+        count (int): The number of objects.
+
+    Returns:
+
+        Footprint: The memory measured.
+
+    """
+
+    if name not in BENCHMARKS:
+
+        raise ValueError(f"Invalid benchmark: {name} must be one of {tuple(BENCHMARKS)}.")
+
+    if count < 1:
+
+        raise ValueError(f"Invalid count: {count} must be at least 1.")
+
+    BENCHMARKS[name](min(count, 10))()
+
+    build = BENCHMARKS[name](count)
+
+    gc.collect()
+
+    was_tracing = tracemalloc.is_tracing()
+
+    if not was_tracing:
+
+        tracemalloc.start()
+
+    try:
+
+        before = tracemalloc.get_traced_memory()[0]
+
+        objects = build()
+
+        total_bytes = tracemalloc.get_traced_memory()[0] - before
+
+    finally:
+
+        if not was_tracing:
+
+            tracemalloc.stop()
+
+    del objects
+
+    return Footprint(name, count, total_bytes, total_bytes / count)
+
+def run_benchmark(counts: Iterable[int] = BENCHMARK_COUNTS,
+                  names: Optional[Iterable[str]] = None
+                  ) -> List[Footprint]:
+
+    """
+    Measures every benchmark at every count; the cache entries are capped at CACHE_KEY_COUNT.
+
+    Args:
+
+        counts (Iterable[int]): The numbers of objects; defaults to BENCHMARK_COUNTS.
+        names (Optional[Iterable[str]]): The names of the benchmarks; defaults to every benchmark in BENCHMARKS.
+
+    Returns:
+
+        List[Footprint]: The memory measured for each benchmark and count.
+
+    """
+
+    counts = list(counts)
+
+    return [measure_footprint(name, min(count, CACHE_KEY_COUNT) if name == "cache_entry" else count)
+            for name in (BENCHMARKS if names is None else names) for count in counts]
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+
+    """
+    Runs the command-line entry point, printing the bytes per object of each benchmark against its budget.
+
+    Args:
+
+        argv (Optional[Iterable[str]]): The command-line arguments; defaults to sys.argv[1:].
+
+    Returns:
+
+        int: The exit status; 1 if any benchmark is over its budget.
+
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m app.footprint", description="Measures the bytes per Chord, cache entry and stored progression chord with tracemalloc.")
+
+    parser.add_argument("--counts", type=int, nargs="+", default=list(BENCHMARK_COUNTS), help="the numbers of objects to measure (default: 1000 to 1000000)")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=None, help="the benchmarks to run (default: all)")
+
+    arguments = parser.parse_args(None if argv is None else list(argv))
+
+    over_budget = False
+
+    print(f"{'benchmark':<12} {'count':>9} {'total bytes':>13} {'bytes/object':>13} {'budget':>7}")
+
+    for footprint in run_benchmark(arguments.counts, arguments.benchmarks):
+
+        budget = FOOTPRINT_BUDGETS[footprint.name]
+
+        over_budget |= footprint.bytes_per_object > budget
+
+        print(f"{footprint.name:<12} {footprint.count:>9} {footprint.total_bytes:>13} {footprint.bytes_per_object:>13.1f} {budget:>7}")
+
+    return 1 if over_budget else 0
+
+if __name__ == "__main__":
+
+    sys.exit(main())
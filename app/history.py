@@ -0,0 +1,577 @@
+from array import array
+from collections import deque
+from typing import Deque, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from app.chord import Chord
+from app.library.codes import CHORD_ID_COUNT
+from app.library.enums import RootType
+from app.progression import Progression
+from app.tuning import Tuning
+
+# Defines the target number of chord states in each chunk of a progression snapshot; a chunk is split once it holds twice as many.
+CHUNK_SIZE: int = 64
+
+# Defines the default number of snapshots kept for undo, after which the oldest snapshot is evicted.
+DEFAULT_HISTORY_LIMIT: int = 1000
+
+# Defines a generic variable Type Hint for immutable snapshots.
+Snapshot = TypeVar("Snapshot")
+
+class History(Generic[Snapshot]):
+
+    """
+    A class to keep a bounded undo/redo history of immutable snapshots.
+
+    Snapshots are never copied, so each entry costs only the state that its snapshot does not share with its neighbours; undo and redo are O(1).
+
+    Attributes:
+
+        current (Snapshot): The current snapshot.
+        limit (int): The maximum number of snapshots kept for undo.
+
+    """
+
+    def __init__(self,
+                 initial: Snapshot,
+                 limit: int = DEFAULT_HISTORY_LIMIT
+                 ):
+
+        if limit < 1:
+
+            raise ValueError(f"Invalid limit: {limit} must be at least 1.")
+
+        self.current: Snapshot = initial
+
+        self.limit: int = limit
+
+        # Stores the previous snapshots, most recent last; the oldest snapshot is evicted once the limit is reached.
+        self._undo: Deque[Snapshot] = deque(maxlen=limit)
+
+        # Stores the undone snapshots, most recently undone last.
+        self._redo: List[Snapshot] = []
+
+    def commit(self,
+               snapshot: Snapshot
+               ) -> None:
+
+        """
+        Records a new current snapshot, and clears the redo history; an unchanged snapshot is not recorded.
+
+        """
+
+        if snapshot == self.current:
+
+            return
+
+        self._undo.append(self.current)
+
+        self._redo.clear()
+
+        self.current = snapshot
+
+    @property
+    def can_undo(self) -> bool:
+
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+
+        return bool(self._redo)
+
+    def undo(self) -> bool:
+
+        """
+        Makes the previous snapshot current.
+
+        Returns:
+
+            bool: Whether there was a snapshot to undo to.
+
+        """
+
+        if not self._undo:
+
+            return False
+
+        self._redo.append(self.current)
+
+        self.current = self._undo.pop()
+
+        return True
+
+    def redo(self) -> bool:
+
+        """
+        Makes the most recently undone snapshot current.
+
+        Returns:
+
+            bool: Whether there was a snapshot to redo to.
+
+        """
+
+        if not self._redo:
+
+            return False
+
+        self._undo.append(self.current)
+
+        self.current = self._redo.pop()
+
+        return True
+
+    def __len__(self) -> int:
+
+        """
+        The number of snapshots kept, including the current snapshot.
+
+        """
+
+        return len(self._undo) + 1 + len(self._redo)
+
+
+
+class ChordHistory:
+
+    """
+    A class to edit a chord with undo and redo.
+
+    Each snapshot is the state of the chord's interval types and bass note (see Chord.state()), so every edit records a single integer rather than a copy of the chord,
+    and undo marks as dirty only the interval names that it changes.
+
+    Attributes:
+
+        chord (Chord): The chord being edited.
+        history (History[int]): The snapshots of the chord.
+
+    """
+
+    def __init__(self,
+                 chord: Chord,
+                 limit: int = DEFAULT_HISTORY_LIMIT
+                 ):
+
+        self.chord: Chord = chord
+
+        self.history: History[int] = History(chord.state(), limit)
+
+    def record(self) -> None:
+
+        """
+        Records the chord's current state, after it has been edited directly rather than through this history.
+
+        """
+
+        self.history.commit(self.chord.state())
+
+    def add_or_remove_interval_type_and_attributes(self,
+                                                   interval_type: Optional[Chord.IntervalType]
+                                                   ) -> None:
+
+        """
+        Adds or removes an interval type (see Chord.add_or_remove_interval_type_and_attributes), and records the edit.
+
+        """
+
+        self.chord.add_or_remove_interval_type_and_attributes(interval_type)
+
+        self.record()
+
+    def set_new_root(self,
+                     new_root_type: RootType
+                     ) -> None:
+
+        """
+        Updates the root note (see Chord.set_new_root), and records the edit.
+
+        """
+
+        self.chord.set_new_root(new_root_type)
+
+        self.record()
+
+    def set_bass(self,
+                 bass: Optional[Union[RootType, str]]
+                 ) -> None:
+
+        """
+        Sets a slash bass note (see Chord.set_bass), and records the edit.
+
+        """
+
+        self.chord.set_bass(bass)
+
+        self.record()
+
+    def invert(self,
+               inversion: int
+               ) -> None:
+
+        """
+        Puts a chord tone in the bass (see Chord.invert), and records the edit.
+
+        """
+
+        self.chord.invert(inversion)
+
+        self.record()
+
+    def undo(self) -> bool:
+
+        """
+        Restores the chord to its state before the last edit.
+
+        Returns:
+
+            bool: Whether there was an edit to undo.
+
+        """
+
+        if not self.history.undo():
+
+            return False
+
+        self.chord.restore_state(self.history.current)
+
+        return True
+
+    def redo(self) -> bool:
+
+        """
+        Restores the chord to its state after the last undone edit.
+
+        Returns:
+
+            bool: Whether there was an edit to redo.
+
+        """
+
+        if not self.history.redo():
+
+            return False
+
+        self.chord.restore_state(self.history.current)
+
+        return True
+
+
+
+class ProgressionSnapshot:
+
+    """
+    An immutable sequence of chord states, split into chunks of about CHUNK_SIZE chord states, with the tuning that they are constructed in.
+
+    Each chord state packs the interval types and the bass note of a chord (see Chord.state()); the state of a chord in root position is its chord ID.
+    Every edit returns a new snapshot that copies only the edited chunk and the tuple of chunk references, sharing all other chunks with the original snapshot.
+
+    Attributes:
+
+        chunks (Tuple[Tuple[int, ...], ...]): The chunks of chord states, in order.
+        tuning (Optional[Tuning]): The tuning of the chords; defaults to 12-TET.
+
+    """
+
+    __slots__ = ("chunks", "tuning", "_len")
+
+    def __init__(self,
+                 chunks: Tuple[Tuple[int, ...], ...] = (),
+                 tuning: Optional[Tuning] = None
+                 ):
+
+        self.chunks: Tuple[Tuple[int, ...], ...] = chunks
+
+        self.tuning: Optional[Tuning] = tuning
+
+        self._len: int = sum(len(chunk) for chunk in chunks)
+
+    @classmethod
+    def from_chord_ids(cls,
+                       chord_ids: Iterable[int],
+                       tuning: Optional[Tuning] = None
+                       ) -> "ProgressionSnapshot":
+
+        """
+        Constructs a snapshot from chord IDs or chord states (see Chord.state()).
+
+        """
+
+        chord_ids = tuple(chord_ids)
+
+        return cls(tuple(chord_ids[start:start + CHUNK_SIZE] for start in range(0, len(chord_ids), CHUNK_SIZE)), tuning)
+
+    def with_tuning(self,
+                    tuning: Optional[Tuning]
+                    ) -> "ProgressionSnapshot":
+
+        """
+        Returns a snapshot of the same chord states in another tuning, sharing every chunk.
+
+        """
+
+        return ProgressionSnapshot(self.chunks, tuning)
+
+    def __len__(self) -> int:
+
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+
+        for chunk in self.chunks:
+
+            yield from chunk
+
+    def __eq__(self,
+               other: object
+               ) -> bool:
+
+        """
+        Compares two snapshots chunk by chunk; chunks shared by both snapshots are equal by identity, so comparing a snapshot with its edit costs only the chunks that the edit copied.
+
+        """
+
+        if not isinstance(other, ProgressionSnapshot):
+
+            return NotImplemented
+
+        if self.tuning is not other.tuning or self._len != other._len:
+
+            return False
+
+        if self.chunks is other.chunks:
+
+            return True
+
+        if len(self.chunks) == len(other.chunks) and all(len(chunk) == len(other_chunk) for chunk, other_chunk in zip(self.chunks, other.chunks)):
+
+            return all(chunk is other_chunk or chunk == other_chunk for chunk, other_chunk in zip(self.chunks, other.chunks))
+
+        # Compares the chord states in order, as the chunks are split differently.
+        return all(state == other_state for state, other_state in zip(self, other))
+
+    def _locate(self,
+                index: int,
+                inserting: bool = False
+                ) -> Tuple[int, int]:
+
+        """
+        Returns the chunk and the position within the chunk for an index; when inserting, an index equal to the length is the end of the last chunk.
+
+        """
+
+        if index < 0:
+
+            index += self._len
+
+        if not 0 <= index < self._len + inserting:
+
+            raise IndexError(f"Invalid index: {index} is out of range for {self._len} chords.")
+
+        for chunk_index, chunk in enumerate(self.chunks):
+
+            if index < len(chunk) + (inserting and chunk_index == len(self.chunks) - 1):
+
+                return chunk_index, index
+
+            index -= len(chunk)
+
+        # Inserts into an empty snapshot as a new chunk.
+        return len(self.chunks), 0
+
+    def _replace_chunk(self,
+                       chunk_index: int,
+                       chunk: Tuple[int, ...]
+                       ) -> "ProgressionSnapshot":
+
+        """
+        Returns a snapshot with one chunk replaced, splitting the chunk if it has grown to twice CHUNK_SIZE and dropping it if it is empty.
+
+        """
+
+        replacement = (chunk[:CHUNK_SIZE], chunk[CHUNK_SIZE:]) if len(chunk) >= 2 * CHUNK_SIZE else (chunk,) if chunk else ()
+
+        return ProgressionSnapshot(self.chunks[:chunk_index] + replacement + self.chunks[chunk_index + 1:], self.tuning)
+
+    def __getitem__(self,
+                    index: int
+                    ) -> int:
+
+        chunk_index, position = self._locate(index)
+
+        return self.chunks[chunk_index][position]
+
+    def set(self,
+            index: int,
+            chord_id: int
+            ) -> "ProgressionSnapshot":
+
+        chunk_index, position = self._locate(index)
+
+        chunk = self.chunks[chunk_index]
+
+        return self._replace_chunk(chunk_index, chunk[:position] + (chord_id,) + chunk[position + 1:])
+
+    def insert(self,
+               index: int,
+               chord_id: int
+               ) -> "ProgressionSnapshot":
+
+        chunk_index, position = self._locate(index, inserting=True)
+
+        chunk = self.chunks[chunk_index] if chunk_index < len(self.chunks) else ()
+
+        return self._replace_chunk(chunk_index, chunk[:position] + (chord_id,) + chunk[position:])
+
+    def delete(self,
+               index: int
+               ) -> "ProgressionSnapshot":
+
+        chunk_index, position = self._locate(index)
+
+        chunk = self.chunks[chunk_index]
+
+        return self._replace_chunk(chunk_index, chunk[:position] + chunk[position + 1:])
+
+
+
+class ProgressionHistory:
+
+    """
+    A class to edit a progression with undo and redo.
+
+    The progression is held as a ProgressionSnapshot of chord states and the tuning, so every edit records a new snapshot that shares all unchanged chunks with the previous one,
+    and undo restores the bass note of each chord and the tuning as well as the interval types.
+
+    Attributes:
+
+        history (History[ProgressionSnapshot]): The snapshots of the progression.
+
+    """
+
+    def __init__(self,
+                 chords: Iterable[Chord] = (),
+                 limit: int = DEFAULT_HISTORY_LIMIT,
+                 tuning: Optional[Tuning] = None
+                 ):
+
+        self.history: History[ProgressionSnapshot] = History(ProgressionSnapshot.from_chord_ids((chord.state() for chord in chords), tuning), limit)
+
+    @property
+    def snapshot(self) -> ProgressionSnapshot:
+
+        return self.history.current
+
+    @property
+    def tuning(self) -> Optional[Tuning]:
+
+        """
+        The tuning of the chords that are constructed; defaults to 12-TET.
+
+        """
+
+        return self.history.current.tuning
+
+    def set_tuning(self,
+                   tuning: Optional[Tuning]
+                   ) -> None:
+
+        """
+        Sets the tuning of the chords that are constructed, and records the edit.
+
+        """
+
+        self.history.commit(self.history.current.with_tuning(tuning))
+
+    def __len__(self) -> int:
+
+        return len(self.history.current)
+
+    def chord(self,
+              index: int
+              ) -> Chord:
+
+        """
+        Constructs the chord at an index; editing it does not change the progression (see set_chord).
+
+        """
+
+        return Chord.from_state(self.history.current[index], self.tuning)
+
+    def chords(self) -> List[Chord]:
+
+        return [Chord.from_state(state, self.tuning) for state in self.history.current]
+
+    def to_progression(self) -> Progression:
+
+        """
+        Constructs a progression of the chord IDs; a progression does not store bass notes, so each chord is in root position.
+
+        """
+
+        return Progression(array("I", (state % CHORD_ID_COUNT for state in self.history.current)), self.tuning)
+
+    def set_chord(self,
+                  index: int,
+                  chord: Chord
+                  ) -> None:
+
+        self.history.commit(self.history.current.set(index, chord.state()))
+
+    def insert_chord(self,
+                     index: int,
+                     chord: Chord
+                     ) -> None:
+
+        self.history.commit(self.history.current.insert(index, chord.state()))
+
+    def append_chord(self,
+                     chord: Chord
+                     ) -> None:
+
+        self.insert_chord(len(self), chord)
+
+    def remove_chord(self,
+                     index: int
+                     ) -> None:
+
+        self.history.commit(self.history.current.delete(index))
+
+    def add_or_remove_interval_type_and_attributes(self,
+                                                   index: int,
+                                                   interval_type: Optional[Chord.IntervalType]
+                                                   ) -> None:
+
+        """
+        Adds or removes an interval type on the chord at an index (see Chord.add_or_remove_interval_type_and_attributes), and records the edit.
+
+        """
+
+        chord = self.chord(index)
+
+        chord.add_or_remove_interval_type_and_attributes(interval_type)
+
+        self.set_chord(index, chord)
+
+    def set_new_root(self,
+                     index: int,
+                     new_root_type: RootType
+                     ) -> None:
+
+        """
+        Updates the root note of the chord at an index (see Chord.set_new_root), and records the edit.
+
+        """
+
+        chord = self.chord(index)
+
+        chord.set_new_root(new_root_type)
+
+        self.set_chord(index, chord)
+
+    def undo(self) -> bool:
+
+        return self.history.undo()
+
+    def redo(self) -> bool:
+
+        return self.history.redo()
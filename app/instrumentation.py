@@ -0,0 +1,307 @@
+import json
+import os
+import time
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Defines the environment variable that enables instrumentation when the package is imported (e.g., CHORD_PROFILE=1).
+PROFILE_ENV_VARIABLE: str = "CHORD_PROFILE"
+
+# Defines the maximum number of latency samples kept per operation for percentile calculations.
+SAMPLE_LIMIT: int = 4096
+
+# Defines the latency percentiles included in the report.
+PERCENTILES: Tuple[int, ...] = (50, 90, 99)
+
+class OperationStats:
+
+    """
+    A class to collect the call count, latencies and cache hits for a single instrumented operation.
+
+    Attributes:
+
+        calls (int): The number of calls to the operation.
+        total_seconds (float): The cumulative latency of all calls, in seconds.
+        samples (Deque[float]): The most recent latencies, in seconds, bounded to SAMPLE_LIMIT.
+        cache_hits (int): The number of calls answered from a cache.
+        cache_misses (int): The number of calls that had to calculate their result.
+
+    """
+
+    __slots__ = ("calls", "total_seconds", "samples", "cache_hits", "cache_misses")
+
+    def __init__(self):
+
+        self.calls: int = 0
+        self.total_seconds: float = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_LIMIT)
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    def record(self,
+               seconds: float,
+               cache_hit: Optional[bool] = None
+               ) -> None:
+
+        """
+        Records a single call to the operation.
+
+        Args:
+
+            seconds (float): The latency of the call, in seconds.
+            cache_hit (Optional[bool]): Whether the call was answered from a cache; None if the operation is not cached.
+
+        """
+
+        self.calls += 1
+        self.total_seconds += seconds
+        self.samples.append(seconds)
+
+        if cache_hit is True:
+
+            self.cache_hits += 1
+
+        elif cache_hit is False:
+
+            self.cache_misses += 1
+
+    def summary(self) -> Dict[str, Any]:
+
+        """
+        Summarises the operation as a JSON-serialisable dictionary, with latencies in microseconds.
+
+        """
+
+        ordered = sorted(self.samples)
+
+        summary = {
+
+            "calls": self.calls,
+            "total_us": self.total_seconds * 1e6,
+            "mean_us": (self.total_seconds / self.calls) * 1e6 if self.calls else 0.0,
+
+        }
+
+        for percentile in PERCENTILES:
+
+            # Selects the nearest-rank percentile from the retained samples.
+            summary[f"p{percentile}_us"] = ordered[min(len(ordered) - 1, (len(ordered) * percentile) // 100)] * 1e6 if ordered else 0.0
+
+        lookups = self.cache_hits + self.cache_misses
+
+        if lookups:
+
+            summary["cache_hits"] = self.cache_hits
+            summary["cache_misses"] = self.cache_misses
+            summary["cache_hit_rate"] = self.cache_hits / lookups
+
+        return summary
+
+
+
+# Stores the collected statistics, keyed by operation name (e.g., "Chord.set_new_root").
+_STATS: Dict[str, OperationStats] = {}
+
+# Stores the registered methods as (class, method name, original function, cache probe) entries.
+_REGISTERED_METHODS: List[Tuple[type, str, Callable, Optional[Callable]]] = []
+
+# Stores whether the instrumented wrappers are currently installed.
+_enabled: bool = False
+
+def _wrap(operation: str,
+          function: Callable,
+          cache_probe: Optional[Callable]
+          ) -> Callable:
+
+    """
+    Creates the instrumented wrapper that times the function and records whether its result was cached.
+
+    Args:
+
+        operation (str): The name of the operation (e.g., "Chord.get_note_signature").
+        function (Callable): The original function.
+        cache_probe (Optional[Callable]): A function called with the same arguments before the call, returning True if the result is already cached.
+
+    Returns:
+
+        Callable: The instrumented wrapper.
+
+    """
+
+    stats = _STATS.setdefault(operation, OperationStats())
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+
+        cache_hit = cache_probe(*args, **kwargs) if cache_probe is not None else None
+
+        start = time.perf_counter()
+
+        try:
+
+            return function(*args, **kwargs)
+
+        finally:
+
+            stats.record(time.perf_counter() - start, cache_hit)
+
+    return wrapper
+
+def instrument_methods(cls: type,
+                       method_names: List[str],
+                       cache_probes: Optional[Dict[str, Callable]] = None
+                       ) -> None:
+
+    """
+    Registers the methods of a class for instrumentation.
+
+    The original methods are left in place while instrumentation is disabled, so disabled instrumentation costs nothing per call.
+
+    Args:
+
+        cls (type): The class that defines the methods (e.g., Chord).
+        method_names (List[str]): The names of the methods to instrument.
+        cache_probes (Optional[Dict[str, Callable]]): Functions, keyed by method name, reporting whether a call will be answered from a cache.
+
+    """
+
+    cache_probes = cache_probes or {}
+
+    for method_name in method_names:
+
+        _REGISTERED_METHODS.append((cls, method_name, cls.__dict__[method_name], cache_probes.get(method_name)))
+
+        if _enabled:
+
+            setattr(cls, method_name, _wrap(f"{cls.__name__}.{method_name}", cls.__dict__[method_name], cache_probes.get(method_name)))
+
+def enable() -> None:
+
+    """
+    Installs the instrumented wrappers for all registered methods.
+
+    """
+
+    global _enabled
+
+    if not _enabled:
+
+        for cls, method_name, function, cache_probe in _REGISTERED_METHODS:
+
+            setattr(cls, method_name, _wrap(f"{cls.__name__}.{method_name}", function, cache_probe))
+
+        _enabled = True
+
+def disable() -> None:
+
+    """
+    Restores the original methods; the collected statistics are kept until reset() is called.
+
+    """
+
+    global _enabled
+
+    if _enabled:
+
+        for cls, method_name, function, _ in _REGISTERED_METHODS:
+
+            setattr(cls, method_name, function)
+
+        _enabled = False
+
+def is_enabled() -> bool:
+
+    return _enabled
+
+def reset() -> None:
+
+    """
+    Clears all collected statistics.
+
+    """
+
+    for stats in _STATS.values():
+
+        stats.__init__()
+
+@contextmanager
+def profiling(reset_stats: bool = True) -> Iterator[Dict[str, OperationStats]]:
+
+    """
+    Enables instrumentation for the duration of the context, restoring the previous state on exit.
+
+    Args:
+
+        reset_stats (bool): Whether to clear the collected statistics on entry; defaults to True.
+
+    Yields:
+
+        Dict[str, OperationStats]: The live statistics, keyed by operation name.
+
+    """
+
+    was_enabled = _enabled
+
+    if reset_stats:
+
+        reset()
+
+    enable()
+
+    try:
+
+        yield _STATS
+
+    finally:
+
+        if not was_enabled:
+
+            disable()
+
+def report() -> Dict[str, Dict[str, Any]]:
+
+    """
+    Summarises all operations that have been called at least once.
+
+    Returns:
+
+        Dict[str, Dict[str, Any]]: The summary of each operation, keyed by operation name.
+
+    """
+
+    return {operation: stats.summary() for operation, stats in sorted(_STATS.items()) if stats.calls}
+
+def export_json(path: Optional[str] = None) -> str:
+
+    """
+    Exports the report as JSON, optionally writing it to a file.
+
+    Args:
+
+        path (Optional[str]): The path of the file to write; defaults to None.
+
+    Returns:
+
+        str: The JSON representation of the report.
+
+    """
+
+    content = json.dumps(report(), indent=2, sort_keys=True)
+
+    if path is not None:
+
+        with open(path, "w", encoding="utf-8") as file:
+
+            file.write(content)
+
+    return content
+
+
+
+# Enables instrumentation at import, if requested through the environment variable.
+if os.environ.get(PROFILE_ENV_VARIABLE, "").lower() in ("1", "true", "yes", "on"):
+
+    enable()
@@ -0,0 +1,149 @@
+import numpy as np
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from app.chord import Chord
+from app.consonance import MASK_COUNT
+from app.library.codes import SLOT_CODES, ROOT_TYPES_BY_INDEX, decode_interval_types
+from app.transitions import Chords, chord_masks
+from app.utils import enumerate_shapes, mask_bits, rotate_mask, rotate_masks, shape_cost
+from config.config import CHROMATIC_LEN
+
+@lru_cache(maxsize=None)
+def _quality_shapes() -> Dict[int, Tuple[int, ...]]:
+
+    """
+    Returns the interval type codes of the simplest chord for each quality mask (see utils.enumerate_shapes), enumerated once.
+
+    """
+
+    return enumerate_shapes()
+
+@lru_cache(maxsize=None)
+def inversion_masks() -> np.ndarray:
+
+    """
+    Rotates every pitch class mask to start from each of its notes, so that every inversion of every mask is a single lookup.
+
+    Returns:
+
+        np.ndarray: A read-only (4096, 12) uint16 array; entry [mask, pitch_class] is the mask with that pitch class rotated to bit 0, or 0 if the pitch class is not in the mask.
+
+    """
+
+    rotations = rotate_masks(np.arange(MASK_COUNT)[:, None], (CHROMATIC_LEN - np.arange(CHROMATIC_LEN)[None, :]) % CHROMATIC_LEN)
+
+    masks = np.where(mask_bits() == 1, rotations, 0).astype(np.uint16)
+
+    masks.flags.writeable = False
+
+    return masks
+
+def all_inversions(chords: Chords) -> np.ndarray:
+
+    """
+    Generates the pitch class mask of every inversion of every chord, relative to its bass note, with vectorised lookups.
+
+    Args:
+
+        chords (Chords): The chords, as Chord objects, a ChordArray or a Progression.
+
+    Returns:
+
+        np.ndarray: A (len(chords), 12) uint16 array; entry [chord, interval] is the mask of the inversion with the note that many semitones above the root note in the bass,
+                    with bit 0 as the bass note, or 0 if that note is not a chord tone.
+
+    """
+
+    masks, root_indices = chord_masks(chords)
+
+    # Reorders the columns from absolute bass notes to bass notes relative to each root note.
+    bass_indices = (np.maximum(root_indices, 0)[:, None].astype(np.int16) + np.arange(CHROMATIC_LEN)[None, :]) % CHROMATIC_LEN
+
+    return np.take_along_axis(inversion_masks()[masks], bass_indices, axis=1)
+
+@lru_cache(maxsize=None)
+def inversion_catalog() -> Dict[int, Tuple[Tuple[int, int], ...]]:
+
+    """
+    Precomputes every inversion of every chord quality that a chord can hold.
+
+    Returns:
+
+        Dict[int, Tuple[Tuple[int, int], ...]]: A dictionary mapping each pitch class mask relative to its bass note (bit 0) to the chords that produce it,
+                                                 as (interval from the bass note up to the root note, quality mask) pairs; the simplest chords first, then root position.
+
+    """
+
+    shapes = _quality_shapes()
+
+    catalog: Dict[int, List[Tuple[int, int]]] = {}
+
+    for quality_mask in shapes:
+
+        for pitch_class in range(CHROMATIC_LEN):
+
+            if quality_mask >> pitch_class & 1:
+
+                catalog.setdefault(rotate_mask(quality_mask, -pitch_class), []).append(((CHROMATIC_LEN - pitch_class) % CHROMATIC_LEN, quality_mask))
+
+    return {mask: tuple(sorted(candidates, key=lambda candidate: (shape_cost(shapes[candidate[1]]), candidate[0] != 0)))
+            for mask, candidates in catalog.items()}
+
+def identify(mask: int,
+             bass_index: int
+             ) -> List[Chord]:
+
+    """
+    Identifies the chords that produce a pitch class mask over a bass note, including every inversion and slash chord.
+
+    Args:
+
+        mask (int): The 12-bit pitch class mask of the notes, including the bass note.
+        bass_index (int): The index position of the bass note in the chromatic scale.
+
+    Returns:
+
+        List[Chord]: The chords with the bass note set, the simplest chords first, then root position (see utils.shape_cost);
+                     if no chord produces the mask, the chords producing the notes above the bass note with the bass note as a slash bass note (e.g., D/C).
+
+    """
+
+    if not mask >> bass_index & 1:
+
+        raise ValueError(f"Invalid bass_index: {bass_index} is not in the mask {mask:012b}.")
+
+    shapes, catalog = _quality_shapes(), inversion_catalog()
+
+    relative_mask = rotate_mask(mask, -bass_index)
+
+    candidates = catalog.get(relative_mask)
+
+    if candidates is None:
+
+        # Reads the bass note as a slash bass note below a chord of the remaining notes.
+        candidates = tuple((root_interval, quality_mask) for root_interval, quality_mask in catalog.get(relative_mask & ~1, ()) if root_interval)
+
+    chords = []
+
+    for root_interval, quality_mask in candidates:
+
+        root_index = (bass_index + root_interval) % CHROMATIC_LEN
+
+        chord = Chord.from_interval_types(decode_interval_types((SLOT_CODES[0][ROOT_TYPES_BY_INDEX[root_index]], *shapes[quality_mask])))
+
+        # Spells the bass note from the root note, if it is a chord tone.
+        positions = [position for position, note in enumerate(chord.get_note_signature()) if chord.tuning.note_index(note) == bass_index]
+
+        if positions:
+
+            chord.invert(positions[0])
+
+        else:
+
+            chord.set_bass(ROOT_TYPES_BY_INDEX[bass_index])
+
+        chords.append(chord)
+
+    return chords
@@ -0,0 +1,252 @@
+from collections import deque
+from math import sqrt
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.chord import Chord
+from app.utils import pitch_classes
+from config.config import CHROMATIC_SCALE, CHROMATIC_LEN
+
+class Key(NamedTuple):
+
+    """
+    A musical key, defined by the index position of its tonic in the chromatic scale and its mode.
+
+    Attributes:
+
+        tonic_index (int): The index position of the tonic in the chromatic scale (e.g., 9 for A).
+        mode (str): The mode of the key, either "major" or "minor".
+
+    """
+
+    tonic_index: int
+    mode: str
+
+    @property
+    def name(self) -> str:
+
+        return f"{CHROMATIC_SCALE[self.tonic_index]} {self.mode}"
+
+# Defines the Krumhansl-Kessler key profiles, relative to the tonic.
+KEY_PROFILES: Dict[str, Tuple[float, ...]] = {
+
+    "major": (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88),
+    "minor": (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+}
+
+# Stores all 24 keys, major keys first, in chromatic scale order.
+KEYS: Tuple[Key, ...] = tuple(Key(tonic_index, mode) for mode in KEY_PROFILES for tonic_index in range(CHROMATIC_LEN))
+
+# Stores the key profile weight of each pitch class for each key, as KEY_WEIGHTS[pitch_class][key_index].
+KEY_WEIGHTS: Tuple[Tuple[float, ...], ...] = tuple(tuple(KEY_PROFILES[key.mode][(pitch_class - key.tonic_index) % CHROMATIC_LEN] for key in KEYS)
+                                                   for pitch_class in range(CHROMATIC_LEN))
+
+# Stores the sum and the centred spread of each key profile, which are constant for the Pearson correlation.
+_PROFILE_SUMS: Tuple[float, ...] = tuple(sum(KEY_PROFILES[key.mode]) for key in KEYS)
+_PROFILE_SPREADS: Tuple[float, ...] = tuple(sqrt(CHROMATIC_LEN * sum(weight * weight for weight in KEY_PROFILES[key.mode]) - sum(KEY_PROFILES[key.mode]) ** 2) for key in KEYS)
+
+def chord_pitch_classes(chord: Chord) -> List[int]:
+
+    """
+    Returns the index positions in the chromatic scale of the notes in the chord's note signature.
+
+    """
+
+    return pitch_classes(chord.get_note_signature())
+
+class KeyFinder:
+
+    """
+    A class to keep a running key estimate over a sliding window of chords.
+
+    The pitch class histogram of the window, its sum and sum of squares, and its dot product with every key profile are updated incrementally as chords enter and leave the window,
+    so each chord costs a constant number of operations regardless of the window size.
+
+    Attributes:
+
+        window (int): The maximum number of chords in the window.
+        histogram (List[float]): The number of occurrences of each pitch class in the window.
+
+    """
+
+    def __init__(self,
+                 window: int = 8
+                 ):
+
+        if window < 1:
+
+            raise ValueError(f"Invalid window: {window} must be at least 1.")
+
+        self.window: int = window
+
+        self.histogram: List[float] = [0.0] * CHROMATIC_LEN
+
+        # Stores the pitch classes of each chord in the window, oldest first.
+        self._chords: Deque[List[int]] = deque()
+
+        # Stores the running sum and sum of squares of the histogram, and its dot product with every key profile.
+        self._sum: float = 0.0
+        self._sum_of_squares: float = 0.0
+        self._dot_products: List[float] = [0.0] * len(KEYS)
+
+    def _update(self,
+                pitch_class_list: List[int],
+                weight: float
+                ) -> None:
+
+        """
+        Adds (weight 1) or removes (weight -1) the pitch classes of a chord from the running statistics.
+
+        """
+
+        histogram = self.histogram
+
+        dot_products = self._dot_products
+
+        for pitch_class in pitch_class_list:
+
+            count = histogram[pitch_class]
+
+            histogram[pitch_class] = count + weight
+
+            self._sum += weight
+            self._sum_of_squares += 2 * count * weight + weight * weight
+
+            for key_index, key_weight in enumerate(KEY_WEIGHTS[pitch_class]):
+
+                dot_products[key_index] += weight * key_weight
+
+    def push(self,
+             chord: Chord
+             ) -> Optional[Key]:
+
+        """
+        Adds a chord to the window, removing the oldest chord once the window is full, and returns the updated key estimate.
+
+        Args:
+
+            chord (Chord): The next chord in the progression.
+
+        Returns:
+
+            Optional[Key]: The key with the highest correlation, or None if the window contains no notes.
+
+        """
+
+        pitch_class_list = chord_pitch_classes(chord)
+
+        self._chords.append(pitch_class_list)
+
+        self._update(pitch_class_list, 1.0)
+
+        if len(self._chords) > self.window:
+
+            self._update(self._chords.popleft(), -1.0)
+
+        return self.key
+
+    def scores(self) -> Dict[Key, float]:
+
+        """
+        Calculates the Pearson correlation between the window's pitch class histogram and every key profile.
+
+        Returns:
+
+            Dict[Key, float]: The correlation for each key; all 0.0 if the window contains no notes, or all notes are equally frequent.
+
+        """
+
+        histogram_spread_squared = CHROMATIC_LEN * self._sum_of_squares - self._sum * self._sum
+
+        if histogram_spread_squared <= 1e-9:
+
+            return {key: 0.0 for key in KEYS}
+
+        histogram_spread = sqrt(histogram_spread_squared)
+
+        return {key: (CHROMATIC_LEN * dot_product - self._sum * profile_sum) / (histogram_spread * profile_spread)
+                for key, dot_product, profile_sum, profile_spread in zip(KEYS, self._dot_products, _PROFILE_SUMS, _PROFILE_SPREADS)}
+
+    @property
+    def key(self) -> Optional[Key]:
+
+        """
+        The key with the highest correlation, or None if the window contains no notes.
+
+        """
+
+        if self._sum <= 0:
+
+            return None
+
+        scores = self.scores()
+
+        return max(scores, key=scores.get)
+
+    def reset(self) -> None:
+
+        """
+        Empties the window.
+
+        """
+
+        self.__init__(self.window)
+
+    def stream(self,
+               chords: Iterable[Chord]
+               ) -> Iterator[Optional[Key]]:
+
+        """
+        Consumes a stream of chords, yielding the key estimate after each chord.
+
+        Args:
+
+            chords (Iterable[Chord]): The chords of the progression, in order.
+
+        """
+
+        for chord in chords:
+
+            yield self.push(chord)
+
+
+
+def find_keys(progressions: Sequence[Sequence[Chord]]) -> List[Optional[Key]]:
+
+    """
+    Estimates the key of many progressions at once, correlating every pitch class histogram against every key profile with matrix operations.
+
+    Args:
+
+        progressions (Sequence[Sequence[Chord]]): The chords of each progression (e.g., one progression per song).
+
+    Returns:
+
+        List[Optional[Key]]: The key with the highest correlation for each progression, or None if it contains no notes.
+
+    """
+
+    # Imports NumPy on first use, so that the incremental key finder does not depend on it.
+    import numpy as np
+
+    histograms = np.zeros((len(progressions), CHROMATIC_LEN))
+
+    for row, progression in enumerate(progressions):
+
+        for chord in progression:
+
+            np.add.at(histograms[row], chord_pitch_classes(chord), 1.0)
+
+    # Centres and normalises the histograms and the key profiles, so that their matrix product is the Pearson correlation.
+    profiles = np.array(KEY_WEIGHTS)
+
+    centred_histograms = histograms - histograms.mean(axis=1, keepdims=True)
+    centred_profiles = profiles - profiles.mean(axis=0, keepdims=True)
+
+    norms = np.linalg.norm(centred_histograms, axis=1, keepdims=True)
+
+    correlations = (centred_histograms / np.where(norms == 0, 1.0, norms)) @ (centred_profiles / np.linalg.norm(centred_profiles, axis=0, keepdims=True))
+
+    best = correlations.argmax(axis=1)
+
+    return [KEYS[key_index] if norm > 0 else None for key_index, norm in zip(best.tolist(), norms[:, 0].tolist())]
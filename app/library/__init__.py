@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import Any
+
 from app.library.enums import RootType, ThirdType, FifthType, SeventhType, NinthType, EleventhType, ThirteenthType, AddType
 
 __all__ = [
@@ -12,3 +15,24 @@ __all__ = [
     "AddType"
     
 ]
+
+def __getattr__(name: str) -> Any:
+
+    """
+    Imports the intervals database module on first access, so importing the library has no side effects.
+
+    Args:
+
+        name (str): The name of the attribute being accessed (e.g., "intervals").
+
+    Returns:
+
+        Any: The submodule.
+    
+    """
+
+    if name == "intervals":
+
+        return import_module("app.library.intervals")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
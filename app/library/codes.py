@@ -0,0 +1,110 @@
+from enum import Enum
+from math import prod
+from typing import Dict, Optional, Sequence, Tuple
+
+from app.library.enums import RootType, SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType
+from config.config import CHROMATIC_SCALE, INTERVAL_SLOT_NAMES
+
+# Stores the interval type Enum for the root note and each interval name, in INTERVAL_SLOT_NAMES order.
+SLOT_TYPES: Tuple[type, ...] = (RootType, SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType)
+
+# Stores the distinct members of each interval type Enum; aliases (e.g., NinthType.ADD9) resolve to their canonical member.
+SLOT_MEMBERS: Tuple[Tuple[Enum, ...], ...] = tuple(tuple(slot_type) for slot_type in SLOT_TYPES)
+
+# Maps each member to its small-integer code within its slot; code 0 is reserved for an interval type that has not been set.
+SLOT_CODES: Tuple[Dict[Enum, int], ...] = tuple({member: code for code, member in enumerate(members, start=1)} for members in SLOT_MEMBERS)
+
+# Stores the value in semitones for each code of each interval name, read from the members' integer semitones; code 0 and the root note map to 0.
+SLOT_SEMITONES: Tuple[Tuple[int, ...], ...] = tuple((0, *(member.semitones for member in members)) for members in SLOT_MEMBERS)
+
+# Stores the index position in the chromatic scale for each root note code, with code 0 (no root note) mapping to -1.
+ROOT_INDICES: Tuple[int, ...] = (-1, *(root_type.index for root_type in SLOT_MEMBERS[0]))
+
+# Stores the number of codes for each slot, including code 0.
+SLOT_SIZES: Tuple[int, ...] = tuple(len(members) + 1 for members in SLOT_MEMBERS)
+
+# Maps each chromatic scale index to the RootType whose value is spelled as in CHROMATIC_SCALE.
+ROOT_TYPES_BY_INDEX: Tuple[RootType, ...] = tuple(RootType(note) for note in CHROMATIC_SCALE)
+
+def encode_interval_types(interval_types: Dict[str, Optional[Enum]]) -> Tuple[int, ...]:
+
+    """
+    Encodes the interval types of a chord as one small-integer code per slot.
+
+    Args:
+
+        interval_types (Dict[str, Optional[Enum]]): A dictionary mapping each name in INTERVAL_SLOT_NAMES to its interval type, or None.
+
+    Returns:
+
+        Tuple[int, ...]: The code for each slot, in INTERVAL_SLOT_NAMES order; 0 where the interval type has not been set.
+
+    """
+
+    try:
+
+        return tuple(0 if interval_types.get(interval_name) is None else codes[interval_types[interval_name]]
+                     for interval_name, codes in zip(INTERVAL_SLOT_NAMES, SLOT_CODES))
+
+    except KeyError as error:
+
+        # Plug-in interval types (see app/registry.py) have no code in their slot.
+        raise ValueError(f"Invalid interval_type: {error.args[0]} has no code, so it cannot be packed.") from None
+
+def decode_interval_types(codes: Sequence[int]) -> Dict[str, Optional[Enum]]:
+
+    """
+    Decodes one small-integer code per slot into the interval types of a chord.
+
+    Args:
+
+        codes (Sequence[int]): The code for each slot, in INTERVAL_SLOT_NAMES order.
+
+    Returns:
+
+        Dict[str, Optional[Enum]]: A dictionary mapping each name in INTERVAL_SLOT_NAMES to its interval type, or None.
+
+    """
+
+    return {interval_name: members[code - 1] if code else None
+            for interval_name, members, code in zip(INTERVAL_SLOT_NAMES, SLOT_MEMBERS, codes)}
+
+# Stores the place value of each slot in a chord ID, with the root note code as the least significant digit.
+SLOT_RADICES: Tuple[int, ...] = tuple(prod(SLOT_SIZES[:slot_index]) for slot_index in range(len(SLOT_SIZES)))
+
+# Stores the number of distinct chord IDs; every ID fits in an unsigned 32-bit integer.
+CHORD_ID_COUNT: int = prod(SLOT_SIZES)
+
+def pack_codes(codes: Sequence[int]) -> int:
+
+    """
+    Packs one small-integer code per slot into a single chord ID, as a mixed-radix integer.
+
+    Args:
+
+        codes (Sequence[int]): The code for each slot, in INTERVAL_SLOT_NAMES order.
+
+    Returns:
+
+        int: The chord ID, from 0 to CHORD_ID_COUNT - 1.
+
+    """
+
+    return sum(code * radix for code, radix in zip(codes, SLOT_RADICES))
+
+def unpack_codes(chord_id: int) -> Tuple[int, ...]:
+
+    """
+    Unpacks a chord ID into one small-integer code per slot.
+
+    Args:
+
+        chord_id (int): The chord ID, from 0 to CHORD_ID_COUNT - 1.
+
+    Returns:
+
+        Tuple[int, ...]: The code for each slot, in INTERVAL_SLOT_NAMES order.
+
+    """
+
+    return tuple(chord_id // radix % size for radix, size in zip(SLOT_RADICES, SLOT_SIZES))
@@ -0,0 +1,107 @@
+from itertools import combinations
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from config.config import INTERVAL_SLOT_NAMES, INTERVAL_DEPENDENCIES_DICT, DEFAULT_INTERVAL_TYPES
+
+def _resolve_closure(interval_name: str) -> FrozenSet[str]:
+
+    """
+    Resolves the transitive closure of interval dependencies for an interval name (e.g., "thirteenth" -> {"seventh", "ninth", "eleventh"}).
+
+    Args:
+
+        interval_name (str): The name of the interval type (e.g., "thirteenth").
+
+    Returns:
+
+        FrozenSet[str]: The names of all interval types required by the interval name, excluding the interval name itself.
+    
+    """
+
+    required = set()
+
+    pending = list(INTERVAL_DEPENDENCIES_DICT.get(interval_name, []))
+
+    while pending:
+
+        dependency = pending.pop()
+
+        if dependency not in required:
+
+            required.add(dependency)
+
+            # Follows the dependencies of the dependency, so that chained requirements are resolved.
+            pending.extend(INTERVAL_DEPENDENCIES_DICT.get(dependency, []))
+
+    required.discard(interval_name)
+
+    return frozenset(required)
+
+# Maps each interval name to the full set of interval names that it requires.
+INTERVAL_DEPENDENCY_CLOSURE: Dict[str, FrozenSet[str]] = {interval_name: _resolve_closure(interval_name) for interval_name in INTERVAL_SLOT_NAMES}
+
+# Stores the interval names that require additional interval dependencies (e.g., "ninth", "eleventh" and "thirteenth").
+DEPENDENT_INTERVAL_NAMES: FrozenSet[str] = frozenset(interval_name for interval_name, closure in INTERVAL_DEPENDENCY_CLOSURE.items() if closure)
+
+def _build_resolution_table() -> Dict[FrozenSet[str], Tuple[Tuple[str, object], ...]]:
+
+    """
+    Builds the dependency resolution table for every combination of dependent interval names.
+
+    Returns:
+
+        Dict[FrozenSet[str], Tuple[Tuple[str, object], ...]]: A dictionary mapping each combination of dependent interval names to the required interval names and their default interval types, 
+                                                              ordered as they appear in INTERVAL_SLOT_NAMES.
+    
+    """
+
+    resolution_table = {}
+
+    for size in range(len(DEPENDENT_INTERVAL_NAMES) + 1):
+
+        for requested in combinations(sorted(DEPENDENT_INTERVAL_NAMES), size):
+
+            required = set().union(*(INTERVAL_DEPENDENCY_CLOSURE[interval_name] for interval_name in requested))
+
+            resolution_table[frozenset(requested)] = tuple((interval_name, DEFAULT_INTERVAL_TYPES[interval_name]) for interval_name in INTERVAL_SLOT_NAMES if interval_name in required)
+
+    return resolution_table
+
+# Maps each combination of dependent interval names to the required interval names and their default interval types.
+DEPENDENCY_RESOLUTION_TABLE: Dict[FrozenSet[str], Tuple[Tuple[str, object], ...]] = _build_resolution_table()
+
+def resolve_dependencies(interval_names: Iterable[str]) -> Dict[str, object]:
+
+    """
+    Resolves the interval names required by a set of requested interval names, with their default interval types.
+
+    The requested interval names are reduced to their dependent interval names and resolved with a single lookup in DEPENDENCY_RESOLUTION_TABLE.
+
+    Args:
+
+        interval_names (Iterable[str]): The requested interval names (e.g., ["third", "fifth", "thirteenth"]).
+
+    Returns:
+
+        Dict[str, object]: A dictionary mapping each required interval name to its default interval type from DEFAULT_INTERVAL_TYPES.
+    
+    """
+
+    return dict(DEPENDENCY_RESOLUTION_TABLE[DEPENDENT_INTERVAL_NAMES.intersection(interval_names)])
+
+def resolve_dependencies_batch(interval_names_list: Iterable[Iterable[str]]) -> List[Dict[str, object]]:
+
+    """
+    Resolves the required interval names for many sets of requested interval names.
+
+    Args:
+
+        interval_names_list (Iterable[Iterable[str]]): The requested interval names for each chord.
+
+    Returns:
+
+        List[Dict[str, object]]: The required interval names and their default interval types for each chord.
+    
+    """
+
+    return [resolve_dependencies(interval_names) for interval_names in interval_names_list]
@@ -1,73 +1,125 @@
 from enum import Enum
 
-class RootType(Enum):
+class NoteEnum(Enum):
 
-    C = "C"
-    C_SHARP = "C#"
-    D_FLAT = C_SHARP
-    D = "D"
-    E_FLAT = "Eb"
-    D_SHARP = E_FLAT
-    E = "E"
-    F = "F"
-    F_SHARP = "F#"
-    G_FLAT = F_SHARP
-    G = "G"
-    A_FLAT = "Ab"
-    G_SHARP = A_FLAT
-    A = "A"
-    B_Flat = "Bb"
-    A_SHARP = B_Flat
-    B = "B"
+    """
+    A base Enum for root notes; each member is defined as (spelled note, index position in the chromatic scale).
 
-class SecondType(Enum):
+    The value remains the spelled note (e.g., RootType.D_FLAT.value == "Db"), and the index position is carried as an integer (e.g., RootType.D_FLAT.index == 1).
 
-    ADD2 = "major_second"
+    """
 
-class ThirdType(Enum):
+    def __new__(cls,
+                value: str,
+                index: int
+                ):
 
-    SUS2 = "major_second"
-    MINOR = "minor_third"
-    MAJOR = "major_third"
-    SUS4 = "perfect_fourth"
+        member = object.__new__(cls)
 
-class FourthType(Enum):
+        member._value_ = value
 
-    ADD4 = "perfect_fourth"
+        member.index = index
 
-class FifthType(Enum):
+        # Stores the size of the root note above itself, so that every interval type carries its semitones.
+        member.semitones = 0
 
-    DIMINISHED = "diminished_fifth"
-    PERFECT = "perfect_fifth"
-    AUGMENTED = "augmented_fifth"
+        return member
 
-class SixthType(Enum):
+class IntervalEnum(Enum):
 
-    ADD6 = "major_sixth"
+    """
+    A base Enum for interval types; each member is defined as (interval name, size in semitones above the root note).
 
-class SeventhType(Enum):
+    The value remains the interval name in INTERVAL_DICT (e.g., ThirdType.MAJOR.value == "major_third"), and the size is carried as an integer (e.g., ThirdType.MAJOR.semitones == 4),
+    so that interval arithmetic does not hash the interval name.
 
-    DIMINISHED = "diminished_seventh"
-    MINOR = "minor_seventh"
-    MAJOR = "major_seventh"
+    """
 
-class NinthType(Enum):
+    def __new__(cls,
+                value: str,
+                semitones: int
+                ):
 
-    MINOR = "minor_ninth"
-    MAJOR = "major_ninth"
-    ADD9 = "major_ninth"
+        member = object.__new__(cls)
 
-class EleventhType(Enum):
+        member._value_ = value
 
-    PERFECT = "perfect_eleventh"
-    AUGMENTED = "augmented_eleventh"
-    ADD11 = "perfect_eleventh"
+        member.semitones = semitones
 
-class ThirteenthType(Enum):
+        return member
 
-    MINOR = "minor_thirteenth"
-    MAJOR = "major_thirteenth"
-    ADD13 = "major_thirteenth"
+class RootType(NoteEnum):
+
+    C_FLAT = "Cb", 11
+    C = "C", 0
+    C_SHARP = "C#", 1
+    D_FLAT = "Db", 1
+    D = "D", 2
+    D_SHARP = "D#", 3
+    E_FLAT = "Eb", 3
+    E = "E", 4
+    E_SHARP = "E#", 5
+    F_FLAT = "Fb", 4
+    F = "F", 5
+    F_SHARP = "F#", 6
+    G_FLAT = "Gb", 6
+    G = "G", 7
+    G_SHARP = "G#", 8
+    A_FLAT = "Ab", 8
+    A = "A", 9
+    A_SHARP = "A#", 10
+    B_Flat = "Bb", 10
+    B = "B", 11
+    B_SHARP = "B#", 0
+
+class SecondType(IntervalEnum):
+
+    ADD2 = "major_second", 2
+
+class ThirdType(IntervalEnum):
+
+    SUS2 = "major_second", 2
+    MINOR = "minor_third", 3
+    MAJOR = "major_third", 4
+    SUS4 = "perfect_fourth", 5
+
+class FourthType(IntervalEnum):
+
+    ADD4 = "perfect_fourth", 5
+
+class FifthType(IntervalEnum):
+
+    DIMINISHED = "diminished_fifth", 6
+    PERFECT = "perfect_fifth", 7
+    AUGMENTED = "augmented_fifth", 8
+
+class SixthType(IntervalEnum):
+
+    ADD6 = "major_sixth", 9
+
+class SeventhType(IntervalEnum):
+
+    DIMINISHED = "diminished_seventh", 9
+    MINOR = "minor_seventh", 10
+    MAJOR = "major_seventh", 11
+
+class NinthType(IntervalEnum):
+
+    MINOR = "minor_ninth", 13
+    MAJOR = "major_ninth", 14
+    ADD9 = "major_ninth", 14
+
+class EleventhType(IntervalEnum):
+
+    PERFECT = "perfect_eleventh", 17
+    AUGMENTED = "augmented_eleventh", 18
+    ADD11 = "perfect_eleventh", 17
+
+class ThirteenthType(IntervalEnum):
+
+    MINOR = "minor_thirteenth", 20
+    MAJOR = "major_thirteenth", 21
+    ADD13 = "major_thirteenth", 21
 
 class ExtensionType(Enum):
 
@@ -79,11 +131,11 @@ class ExtensionType(Enum):
     ELEVENTH = "eleventh"
     THIRTEENTH = "thirteenth"
 
-class AddType(Enum):
+class AddType(IntervalEnum):
 
-    ADD2 = "major_second"
-    ADD4 = "perfect_fourth"
-    ADD6 = "major_sixth"
-    ADD9 = "major_ninth"
-    ADD11 = "perfect_eleventh"
-    ADD13 = "major_thirteenth"
+    ADD2 = "major_second", 2
+    ADD4 = "perfect_fourth", 5
+    ADD6 = "major_sixth", 9
+    ADD9 = "major_ninth", 14
+    ADD11 = "perfect_eleventh", 17
+    ADD13 = "major_thirteenth", 21
@@ -1,22 +1,19 @@
 import sqlite3
 
-# Connects to SQLite3 and creates the database if it does not already exist
-conn = sqlite3.connect("intervals.db")
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
 
-# Creates a cursor object
-cursor = conn.cursor()
+# Defines the intervals table, if it does not already exist
+INTERVALS_TABLE_SCHEMA: str = """CREATE TABLE IF NOT EXISTS intervals (
+                                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                 numerical_symbol TEXT,
+                                 degree TEXT,
+                                 interval_distance INTEGER,
+                                 interval_name TEXT,
+                                 sound_characteristic TEXT)
+                                 """
 
-# Creates the table if it does not already exist
-cursor.execute("""CREATE TABLE IF NOT EXISTS intervals (
-               id INTEGER PRIMARY KEY AUTOINCREMENT,
-               numerical_symbol TEXT,
-               degree TEXT,
-               interval_distance INTEGER,
-               interval_name TEXT,
-               sound_characteristic TEXT)
-               """)
-
-intervals_data = [
+INTERVALS_DATA: List[Tuple[str, str, int, str, str]] = [
 
     ("I", "tonic", 0, "unison", "open_consonance"),
     ("ii", "supertonic", 1, "minor_second", "sharp_dissonance"),
@@ -36,23 +33,105 @@ intervals_data = [
 
 ]
 
-# Inserts the data into the table
-cursor.executemany("""
-                   INSERT INTO intervals (numerical_symbol, degree, interval_distance, interval_name, sound_characteristic)
-                   VALUES (?, ?, ?, ?, ?)
-                   """, intervals_data)
+def create_intervals_database(database: str = "intervals.db") -> sqlite3.Connection:
+
+    """
+    Connects to SQLite3, creating the database and the intervals table if they do not already exist.
+
+    The intervals data is inserted only if the intervals table is empty, so repeated calls do not duplicate rows.
 
-# Commits the changes
-conn.commit()
+    Args:
 
-# Verifies the insertion by selecting all data from the table
-cursor.execute("SELECT * FROM intervals")
-rows = cursor.fetchall()
+        database (str): The path of the SQLite3 database file, or ":memory:" for an in-memory database; defaults to "intervals.db".
 
-# Prints the data to confirm the insertion
-for row in rows:
+    Returns:
+
+        sqlite3.Connection: The open connection to the database.
     
-    print(row)
+    """
+
+    # Connects to SQLite3 and creates the database if it does not already exist
+    conn = sqlite3.connect(database)
+
+    # Creates the table if it does not already exist
+    conn.execute(INTERVALS_TABLE_SCHEMA)
+
+    # Inserts the data into the table, if the table is empty
+    if conn.execute("SELECT COUNT(*) FROM intervals").fetchone()[0] == 0:
+
+        conn.executemany("""
+                         INSERT INTO intervals (numerical_symbol, degree, interval_distance, interval_name, sound_characteristic)
+                         VALUES (?, ?, ?, ?, ?)
+                         """, INTERVALS_DATA)
+
+        # Commits the changes
+        conn.commit()
+
+    return conn
+
+class IntervalRow(NamedTuple):
+
+    """
+    A row of the intervals table.
+
+    """
+
+    id: int
+    numerical_symbol: str
+    degree: str
+    interval_distance: int
+    interval_name: str
+    sound_characteristic: str
+
+def fetch_intervals(conn: sqlite3.Connection) -> List[Tuple[int, str, str, int, str, str]]:
+
+    """
+    Selects all rows from the intervals table.
+
+    Args:
+
+        conn (sqlite3.Connection): An open connection to a database containing the intervals table.
+
+    Returns:
+
+        List[Tuple[int, str, str, int, str, str]]: All rows from the intervals table, ordered by id.
+    
+    """
+
+    return conn.execute("SELECT * FROM intervals ORDER BY id").fetchall()
+
+@lru_cache(maxsize=None)
+def load_intervals_table() -> Tuple[IntervalRow, ...]:
+
+    """
+    Loads the intervals table into memory once, from an in-memory database, so that analysis never queries the database per chord.
+
+    Returns:
+
+        Tuple[IntervalRow, ...]: All rows from the intervals table, ordered by id.
+    
+    """
+
+    conn = create_intervals_database(":memory:")
+
+    try:
+
+        return tuple(IntervalRow(*row) for row in fetch_intervals(conn))
+    
+    finally:
+
+        conn.close()
+
+
+
+if __name__ == "__main__":
+
+    conn = create_intervals_database()
+
+    # Prints the data to confirm the insertion
+    for row in fetch_intervals(conn):
+        
+        print(row)
 
-# Closes the connection
-conn.close()
+    # Closes the connection
+    conn.close()
@@ -1,5 +1,197 @@
+import argparse
+import json
+import sys
+
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence
+
 from app.chord import Chord
+from app.symbols import parse_chord
+from config.config import INTERVAL_SLOT_NAMES
+
+# Defines the number of lines sent to a worker process in each batch.
+BATCH_SIZE: int = 4096
+
+# Defines the size of the stdout write buffer, in bytes.
+OUTPUT_BUFFER_SIZE: int = 1 << 16
+
+def describe_chord(line: str) -> str:
+
+    """
+    Describes the chord for a line of input as a JSON object.
+
+    Args:
+
+        line (str): A chord symbol (e.g., "F#m7") or chord spec (e.g., "root=F# third=MINOR seventh=MINOR"); see app/symbols.py.
+
+    Returns:
+
+        str: A JSON object with the input, the spelled notes, the intervals, the bass note and the interval type of each interval name that has been set;
+             or the input and an error message, if the line could not be parsed.
+
+    """
+
+    try:
+
+        chord: Chord = parse_chord(line)
+
+    except ValueError as error:
+
+        return json.dumps({"input": line, "error": str(error)}, ensure_ascii=False)
+
+    interval_types = chord.get_interval_types()
+
+    return json.dumps({
+
+        "input": line,
+        "notes": chord.get_note_signature(),
+        "intervals": chord.get_interval_signature(),
+        "bass": chord.bass_note,
+        "interval_types": {interval_name: interval_types[interval_name].name for interval_name in INTERVAL_SLOT_NAMES if interval_types[interval_name] is not None}
+
+        }, ensure_ascii=False)
+
+# Stores the line processor of the current process, with its cache; set by _initialise_processor().
+_process_line: Callable[[str], str] = describe_chord
+
+def _initialise_processor(cache_size: int) -> None:
+
+    """
+    Sets the line processor of the current process, caching the descriptions of the most recent distinct lines unless the cache size is 0.
+
+    """
+
+    global _process_line
+
+    _process_line = lru_cache(maxsize=cache_size)(describe_chord) if cache_size > 0 else describe_chord
+
+def _process_batch(lines: Sequence[str]) -> bytes:
+
+    """
+    Describes a batch of lines as newline-delimited JSON, encoded as UTF-8.
+
+    """
+
+    return "".join([f"{_process_line(line)}\n" for line in lines]).encode("utf-8")
+
+def _read_batches(stdin: BinaryIO) -> Iterator[List[str]]:
+
+    """
+    Reads non-empty lines from a binary stream, in batches of BATCH_SIZE lines.
+
+    Bytes that are not valid UTF-8 are replaced with U+FFFD, so an undecodable line is described with an error object rather than stopping the stream.
+
+    """
+
+    lines = (raw_line.decode("utf-8", errors="replace").strip() for raw_line in stdin)
+
+    lines = (line for line in lines if line)
+
+    while True:
+
+        batch = list(islice(lines, BATCH_SIZE))
+
+        if not batch:
+
+            return
+
+        yield batch
+
+def run(stdin: BinaryIO,
+        stdout: BinaryIO,
+        workers: int = 1,
+        cache_size: int = 4096
+        ) -> None:
+
+    """
+    Streams JSON-lines chord descriptions for newline-delimited chord symbols or specs.
+
+    Lines are processed in batches, and with more than one worker the batches are described in parallel, with at most two batches per worker in flight; the output keeps the input order.
+
+    Args:
+
+        stdin (BinaryIO): The binary stream to read lines from.
+        stdout (BinaryIO): The binary stream to write JSON lines to.
+        workers (int): The number of processes; defaults to 1 (no worker processes).
+        cache_size (int): The number of distinct lines whose descriptions are cached by each process; defaults to 4096, and 0 disables the cache.
+
+    """
+
+    if workers < 1:
+
+        raise ValueError(f"Invalid workers: {workers} must be at least 1.")
+
+    if cache_size < 0:
+
+        raise ValueError(f"Invalid cache_size: {cache_size} must be at least 0.")
+
+    batches = _read_batches(stdin)
+
+    if workers == 1:
+
+        _initialise_processor(cache_size)
+
+        for batch in batches:
+
+            stdout.write(_process_batch(batch))
+
+        return
+
+    with Pool(workers, initializer=_initialise_processor, initargs=(cache_size,)) as pool:
+
+        while True:
+
+            window = list(islice(batches, 2 * workers))
+
+            if not window:
+
+                break
+
+            for output in pool.map(_process_batch, window, chunksize=1):
+
+                stdout.write(output)
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+
+    """
+    Runs the command-line entry point, reading chord symbols or specs from stdin and writing JSON lines to stdout.
+
+    Args:
+
+        argv (Optional[Iterable[str]]): The command-line arguments; defaults to sys.argv[1:].
+
+    Returns:
+
+        int: The exit status.
+
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m app.main", description="Reads newline-delimited chord symbols (e.g., 'F#m7') or specs (e.g., 'root=F# third=MINOR') from stdin, and writes JSON lines to stdout.")
+
+    parser.add_argument("--workers", type=int, default=1, help="the number of worker processes (default: 1)")
+    parser.add_argument("--cache-size", type=int, default=4096, help="the number of distinct lines cached per process; 0 disables the cache (default: 4096)")
+
+    arguments = parser.parse_args(None if argv is None else list(argv))
+
+    with open(sys.stdout.fileno(), "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False) as stdout:
+
+        try:
+
+            run(sys.stdin.buffer, stdout, workers=arguments.workers, cache_size=arguments.cache_size)
+
+        except ValueError as error:
+
+            parser.error(str(error))
+
+        except BrokenPipeError:
+
+            # Stops quietly when the reader closes the pipe early (e.g., piping into head).
+            return 0
+
+    return 0
 
 if __name__ == "__main__":
 
-    pass
+    sys.exit(main())
@@ -0,0 +1,395 @@
+import random
+import struct
+
+from collections import defaultdict
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from app.chord import Chord
+from app.key_finding import Key
+from app.library.codes import ROOT_INDICES, SLOT_SEMITONES, CHORD_ID_COUNT, encode_interval_types, decode_interval_types, pack_codes, unpack_codes
+from app.roman_numerals import MODE_SCALES
+from app.utils import pitch_class_mask
+
+# Defines the token that pads the context at the start of every sequence; it is never a chord ID.
+START_ID: int = CHORD_ID_COUNT
+
+# Defines the header of the binary model format: magic bytes, format version, n-gram order and number of contexts.
+_FILE_MAGIC: bytes = b"CHMK"
+_FILE_VERSION: int = 1
+_HEADER_FORMAT: str = "<4sBBI"
+
+# Stores an alias table as (outcomes, acceptance probabilities, aliases).
+AliasTable = Tuple[Tuple[int, ...], Tuple[float, ...], Tuple[int, ...]]
+
+def chord_id(chord: Chord) -> int:
+
+    """
+    Derives the compact ID of a chord from its root note and interval types (see app/library/codes.py).
+
+    """
+
+    return pack_codes(encode_interval_types(chord.get_interval_types()))
+
+def chord_from_id(chord_id: int) -> Chord:
+
+    """
+    Constructs the chord with a compact ID.
+
+    """
+
+    return Chord.from_interval_types(decode_interval_types(unpack_codes(chord_id)))
+
+def chord_id_mask(chord_id: int) -> int:
+
+    """
+    Returns the 12-bit pitch class mask of the chord with a compact ID; 0 if the chord has no root note.
+
+    """
+
+    codes = unpack_codes(chord_id)
+
+    if not codes[0]:
+
+        return 0
+
+    root_index = ROOT_INDICES[codes[0]]
+
+    return pitch_class_mask([root_index, *(root_index + semitones[code] for semitones, code in zip(SLOT_SEMITONES[1:], codes[1:]) if code)])
+
+def build_alias_table(weights: Dict[int, float]) -> AliasTable:
+
+    """
+    Builds an alias table with Vose's method, so that an outcome is drawn with one random index and one random comparison.
+
+    Args:
+
+        weights (Dict[int, float]): The weight of each outcome; all weights must be positive.
+
+    Returns:
+
+        AliasTable: The outcomes, the probability of accepting each outcome's own column, and the alias of each column.
+
+    """
+
+    outcomes = tuple(weights)
+
+    total = sum(weights.values())
+
+    scaled = [weights[outcome] * len(outcomes) / total for outcome in outcomes]
+
+    probabilities = [1.0] * len(outcomes)
+    aliases = list(range(len(outcomes)))
+
+    small = [column for column, probability in enumerate(scaled) if probability < 1.0]
+    large = [column for column, probability in enumerate(scaled) if probability >= 1.0]
+
+    while small and large:
+
+        column, alias = small.pop(), large.pop()
+
+        probabilities[column] = scaled[column]
+        aliases[column] = alias
+
+        # Moves the remaining weight of the alias column into the column it has filled.
+        scaled[alias] -= 1.0 - scaled[column]
+
+        (small if scaled[alias] < 1.0 else large).append(alias)
+
+    return outcomes, tuple(probabilities), tuple(aliases)
+
+def sample_alias_table(table: AliasTable,
+                       draw: Callable[[], float]
+                       ) -> int:
+
+    """
+    Draws an outcome from an alias table in constant time.
+
+    Args:
+
+        table (AliasTable): The alias table.
+        draw (Callable[[], float]): A function returning uniform random numbers in [0, 1) (e.g., random.random).
+
+    Returns:
+
+        int: The drawn outcome.
+
+    """
+
+    outcomes, probabilities, aliases = table
+
+    column = int(draw() * len(outcomes))
+
+    return outcomes[column] if draw() < probabilities[column] else outcomes[aliases[column]]
+
+class MarkovGenerator:
+
+    """
+    A class to generate chord progressions from n-gram transition statistics over compact chord IDs.
+
+    Transition counts are kept for every context length up to the order, so that an unseen context backs off to a shorter one.
+    Each context is compiled into an alias table on first use, and each (context, constraint) pair into a filtered alias table, so every draw costs constant time.
+
+    Attributes:
+
+        order (int): The number of preceding chords that each transition is conditioned on.
+        counts (Dict[Tuple[int, ...], Dict[int, int]]): The number of times each chord ID followed each context of chord IDs, for context lengths 0 to order.
+
+    """
+
+    def __init__(self,
+                 order: int = 2,
+                 seed: Optional[int] = None
+                 ):
+
+        if not 1 <= order <= 255:
+
+            raise ValueError(f"Invalid order: {order} must be between 1 and 255.")
+
+        self.order: int = order
+
+        self.counts: Dict[Tuple[int, ...], Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+        self._random: random.Random = random.Random(seed)
+
+        # Stores the compiled alias tables, keyed by (context, key, tonic only); None where no chord satisfies the constraints.
+        self._tables: Dict[Tuple[Tuple[int, ...], Optional[Key], bool], Optional[AliasTable]] = {}
+
+        # Stores the pitch class mask of each chord ID, once it has been calculated.
+        self._masks: Dict[int, int] = {}
+
+    def train(self,
+              progressions: Iterable[Sequence[Union[Chord, int]]]
+              ) -> "MarkovGenerator":
+
+        """
+        Counts the transitions in chord progressions, for every context length up to the order.
+
+        Args:
+
+            progressions (Iterable[Sequence[Union[Chord, int]]]): The progressions, as chords or compact chord IDs.
+
+        Returns:
+
+            MarkovGenerator: The generator, for chaining.
+
+        """
+
+        for progression in progressions:
+
+            history = [START_ID] * self.order
+
+            for chord in progression:
+
+                current_id = chord if isinstance(chord, int) else chord_id(chord)
+
+                for context_len in range(self.order + 1):
+
+                    self.counts[tuple(history[len(history) - context_len:])][current_id] += 1
+
+                history.append(current_id)
+
+        # Invalidates the compiled alias tables.
+        self._tables.clear()
+
+        return self
+
+    def _mask(self,
+              current_id: int
+              ) -> int:
+
+        mask = self._masks.get(current_id)
+
+        if mask is None:
+
+            mask = self._masks[current_id] = chord_id_mask(current_id)
+
+        return mask
+
+    def _allows(self,
+                current_id: int,
+                key: Optional[Key],
+                tonic_only: bool
+                ) -> bool:
+
+        """
+        Checks a chord ID against the constraints: every note in the key's scale, and/or the root note on the key's tonic.
+
+        """
+
+        if key is None:
+
+            return True
+
+        mask = self._mask(current_id)
+
+        if not mask:
+
+            return False
+
+        scale_mask = pitch_class_mask(key.tonic_index + offset for offset in MODE_SCALES[key.mode])
+
+        if mask & ~scale_mask:
+
+            return False
+
+        return not tonic_only or ROOT_INDICES[unpack_codes(current_id)[0]] == key.tonic_index
+
+    def _table(self,
+               context: Tuple[int, ...],
+               key: Optional[Key],
+               tonic_only: bool
+               ) -> Optional[AliasTable]:
+
+        """
+        Returns the alias table for a context under the constraints, compiling it on first use.
+
+        """
+
+        lookup_key = (context, key, tonic_only)
+
+        if lookup_key not in self._tables:
+
+            weights = {current_id: count for current_id, count in self.counts.get(context, {}).items() if self._allows(current_id, key, tonic_only)}
+
+            self._tables[lookup_key] = build_alias_table(weights) if weights else None
+
+        return self._tables[lookup_key]
+
+    def _next_id(self,
+                 history: List[int],
+                 key: Optional[Key],
+                 tonic_only: bool
+                 ) -> int:
+
+        """
+        Draws the next chord ID, backing off to shorter contexts until a context has a chord that satisfies the constraints.
+
+        """
+
+        for context_len in range(self.order, -1, -1):
+
+            table = self._table(tuple(history[len(history) - context_len:]), key, tonic_only)
+
+            if table is not None:
+
+                return sample_alias_table(table, self._random.random)
+
+        raise ValueError(f"Invalid constraints: no trained chord satisfies key={key} with tonic_only={tonic_only}.")
+
+    def generate_ids(self,
+                     length: int,
+                     key: Optional[Key] = None,
+                     stay_in_key: bool = False,
+                     end_on_tonic: bool = False
+                     ) -> List[int]:
+
+        """
+        Generates a progression of compact chord IDs.
+
+        Args:
+
+            length (int): The number of chords.
+            key (Optional[Key]): The key for the constraints; required if either constraint is set.
+            stay_in_key (bool): Whether every chord must only contain notes of the key's scale; defaults to False.
+            end_on_tonic (bool): Whether the last chord must be a chord of the key with its root note on the tonic; defaults to False.
+
+        Returns:
+
+            List[int]: The chord IDs of the progression.
+
+        """
+
+        if (stay_in_key or end_on_tonic) and key is None:
+
+            raise ValueError("Invalid constraints: a key is required to stay in key or end on the tonic.")
+
+        history = [START_ID] * self.order
+
+        for position in range(length):
+
+            if end_on_tonic and position == length - 1:
+
+                history.append(self._next_id(history, key, True))
+
+            else:
+
+                history.append(self._next_id(history, key if stay_in_key else None, False))
+
+        return history[self.order:]
+
+    def generate(self,
+                 length: int,
+                 key: Optional[Key] = None,
+                 stay_in_key: bool = False,
+                 end_on_tonic: bool = False
+                 ) -> List[Chord]:
+
+        """
+        Generates a progression of chords (see generate_ids).
+
+        """
+
+        return [chord_from_id(current_id) for current_id in self.generate_ids(length, key, stay_in_key, end_on_tonic)]
+
+
+
+    def save(self,
+             file: BinaryIO
+             ) -> None:
+
+        """
+        Writes the transition counts in a compact binary form: a header, then for each context its length, chord IDs and transitions as little-endian unsigned 32-bit integers.
+
+        Args:
+
+            file (BinaryIO): The binary file to write to.
+
+        """
+
+        file.write(struct.pack(_HEADER_FORMAT, _FILE_MAGIC, _FILE_VERSION, self.order, len(self.counts)))
+
+        for context, transitions in self.counts.items():
+
+            file.write(struct.pack(f"<B{len(context)}II", len(context), *context, len(transitions)))
+
+            file.write(struct.pack(f"<{2 * len(transitions)}I", *(value for transition in transitions.items() for value in transition)))
+
+    @classmethod
+    def load(cls,
+             file: BinaryIO,
+             seed: Optional[int] = None
+             ) -> "MarkovGenerator":
+
+        """
+        Reads transition counts written by save().
+
+        Args:
+
+            file (BinaryIO): The binary file to read from.
+            seed (Optional[int]): The seed for the random number generator; defaults to None.
+
+        Returns:
+
+            MarkovGenerator: The generator, with its alias tables compiled on first use.
+
+        """
+
+        magic, version, order, context_count = struct.unpack(_HEADER_FORMAT, file.read(struct.calcsize(_HEADER_FORMAT)))
+
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+
+            raise ValueError(f"Invalid file: expected a version {_FILE_VERSION} chord Markov model.")
+
+        generator = cls(order, seed)
+
+        for _ in range(context_count):
+
+            (context_len,) = struct.unpack("<B", file.read(1))
+
+            *context, transition_count = struct.unpack(f"<{context_len}II", file.read(4 * (context_len + 1)))
+
+            values = struct.unpack(f"<{2 * transition_count}I", file.read(8 * transition_count))
+
+            generator.counts[tuple(context)] = defaultdict(int, zip(values[::2], values[1::2]))
+
+        return generator
@@ -0,0 +1,648 @@
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import XMLGenerator
+
+from app.chord import Chord
+from config.config import CHROMATIC_LEN, INTERVAL_SLOT_NAMES, NATURAL_NOTE_INDEX_DICT
+
+# Defines the document type declaration of a partwise MusicXML 4.0 score.
+MUSICXML_DOCTYPE: str = '<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">\n'
+
+# Defines the number of beats in each measure; the score is written in 4/4 time, with one division per beat.
+BEATS_PER_MEASURE: int = 4
+
+# Maps the duration of each chord in beats to its MusicXML note type.
+_NOTE_TYPES: Dict[int, str] = {4: "whole", 2: "half", 1: "quarter"}
+
+# Maps the ordinal of each interval name to its chord degree (e.g., "minor_ninth" -> 9).
+_DEGREE_NUMBERS: Dict[str, int] = {
+
+    "second": 2,
+    "third": 3,
+    "fourth": 4,
+    "fifth": 5,
+    "sixth": 6,
+    "seventh": 7,
+    "ninth": 9,
+    "eleventh": 11,
+    "thirteenth": 13
+
+}
+
+# Stores the semitones of each chord degree in a dominant chord (major and perfect intervals, except for a minor seventh), which MusicXML degree alterations are relative to.
+_DEGREE_SEMITONES: Dict[int, int] = {2: 2, 3: 4, 4: 5, 5: 7, 6: 9, 7: 10, 9: 14, 11: 17, 13: 21}
+
+class HarmonyKind(NamedTuple):
+
+    """
+    A MusicXML chord kind, and the chord degrees that it implies.
+
+    Attributes:
+
+        kind (str): The value of the kind element (e.g., "minor-seventh").
+        text (str): The chord symbol suffix written as the kind's text attribute (e.g., "m7").
+        degrees (Dict[int, int]): The semitones above the root note of each implied chord degree.
+
+    """
+
+    kind: str
+    text: str
+    degrees: Dict[int, int]
+
+# Defines the chord kinds that harmonies are described by, simplest first; a chord takes the first kind that needs the fewest degree elements.
+HARMONY_KINDS: Tuple[HarmonyKind, ...] = (
+
+    HarmonyKind("major", "", {3: 4, 5: 7}),
+    HarmonyKind("minor", "m", {3: 3, 5: 7}),
+    HarmonyKind("augmented", "+", {3: 4, 5: 8}),
+    HarmonyKind("diminished", "dim", {3: 3, 5: 6}),
+    HarmonyKind("suspended-fourth", "sus4", {4: 5, 5: 7}),
+    HarmonyKind("suspended-second", "sus2", {2: 2, 5: 7}),
+    HarmonyKind("power", "5", {5: 7}),
+    HarmonyKind("dominant", "7", {3: 4, 5: 7, 7: 10}),
+    HarmonyKind("major-seventh", "maj7", {3: 4, 5: 7, 7: 11}),
+    HarmonyKind("minor-seventh", "m7", {3: 3, 5: 7, 7: 10}),
+    HarmonyKind("diminished-seventh", "dim7", {3: 3, 5: 6, 7: 9}),
+    HarmonyKind("half-diminished", "ø7", {3: 3, 5: 6, 7: 10}),
+    HarmonyKind("augmented-seventh", "+7", {3: 4, 5: 8, 7: 10}),
+    HarmonyKind("major-minor", "m(maj7)", {3: 3, 5: 7, 7: 11}),
+    HarmonyKind("major-sixth", "6", {3: 4, 5: 7, 6: 9}),
+    HarmonyKind("minor-sixth", "m6", {3: 3, 5: 7, 6: 9}),
+    HarmonyKind("dominant-ninth", "9", {3: 4, 5: 7, 7: 10, 9: 14}),
+    HarmonyKind("major-ninth", "maj9", {3: 4, 5: 7, 7: 11, 9: 14}),
+    HarmonyKind("minor-ninth", "m9", {3: 3, 5: 7, 7: 10, 9: 14}),
+    HarmonyKind("dominant-11th", "11", {3: 4, 5: 7, 7: 10, 9: 14, 11: 17}),
+    HarmonyKind("major-11th", "maj11", {3: 4, 5: 7, 7: 11, 9: 14, 11: 17}),
+    HarmonyKind("minor-11th", "m11", {3: 3, 5: 7, 7: 10, 9: 14, 11: 17}),
+    HarmonyKind("dominant-13th", "13", {3: 4, 5: 7, 7: 10, 9: 14, 11: 17, 13: 21}),
+    HarmonyKind("major-13th", "maj13", {3: 4, 5: 7, 7: 11, 9: 14, 11: 17, 13: 21}),
+    HarmonyKind("minor-13th", "m13", {3: 3, 5: 7, 7: 10, 9: 14, 11: 17, 13: 21})
+
+)
+
+class Degree(NamedTuple):
+
+    """
+    A MusicXML degree element, adding, altering or subtracting a chord degree of the kind.
+
+    Attributes:
+
+        value (int): The chord degree (e.g., 9).
+        alter (int): The alteration in semitones, relative to the degree in a dominant chord (e.g., -1 for a minor ninth); 0 for a subtracted degree.
+        degree_type (str): Either "add", "alter" or "subtract".
+
+    """
+
+    value: int
+    alter: int
+    degree_type: str
+
+class Harmony(NamedTuple):
+
+    """
+    The content of a MusicXML harmony element, derived from the interval types of a chord.
+
+    Attributes:
+
+        root_step (str): The letter of the root note (e.g., "B").
+        root_alter (int): The alteration of the root note in semitones (e.g., -1 for Bb).
+        kind (HarmonyKind): The chord kind.
+        degrees (Tuple[Degree, ...]): The degrees that turn the kind into the chord, in ascending order.
+
+    """
+
+    root_step: str
+    root_alter: int
+    kind: HarmonyKind
+    degrees: Tuple[Degree, ...]
+
+def split_note(note: str) -> Tuple[str, int]:
+
+    """
+    Splits a spelled note into its letter and its alteration in semitones (e.g., "Bb" -> ("B", -1), "F##" -> ("F", 2)).
+
+    """
+
+    return note[0], note.count("#") - note.count("b")
+
+def _degree_of(interval_type: Enum) -> int:
+
+    """
+    Returns the chord degree of an interval type from the ordinal of its interval name (e.g., ThirdType.SUS4 -> 4).
+
+    """
+
+    return _DEGREE_NUMBERS[interval_type.value.rsplit("_", 1)[-1]]
+
+def _compare_degrees(chord_degrees: Dict[int, int],
+                     kind_degrees: Dict[int, int]
+                     ) -> List[Degree]:
+
+    """
+    Lists the degree elements that turn the chord degrees of a kind into the chord degrees of a chord.
+
+    """
+
+    degrees = []
+
+    for value in sorted(chord_degrees.keys() | kind_degrees.keys()):
+
+        if value not in kind_degrees:
+
+            degrees.append(Degree(value, chord_degrees[value] - _DEGREE_SEMITONES[value], "add"))
+
+        elif value not in chord_degrees:
+
+            degrees.append(Degree(value, 0, "subtract"))
+
+        elif chord_degrees[value] != kind_degrees[value]:
+
+            degrees.append(Degree(value, chord_degrees[value] - _DEGREE_SEMITONES[value], "alter"))
+
+    return degrees
+
+@lru_cache(maxsize=4096)
+def _describe_harmony(interval_types: Tuple[Optional[Enum], ...]) -> Harmony:
+
+    """
+    Describes the harmony of a root note and interval types, in INTERVAL_SLOT_NAMES order; memoised, as songbooks repeat a small number of chords.
+
+    """
+
+    root_type = interval_types[0]
+
+    chord_degrees = {_degree_of(interval_type): interval_type.semitones for interval_type in interval_types[1:] if interval_type is not None}
+
+    # Takes the kind that needs the fewest degree elements; min() keeps the earliest, and simplest, kind on a tie.
+    kind, degrees = min(((kind, _compare_degrees(chord_degrees, kind.degrees)) for kind in HARMONY_KINDS), key=lambda candidate: len(candidate[1]))
+
+    return Harmony(*split_note(root_type.value), kind, tuple(degrees))
+
+def describe_harmony(chord: Chord) -> Harmony:
+
+    """
+    Describes the harmony of a chord as a MusicXML root, kind and degree alterations, derived from its interval types.
+
+    Args:
+
+        chord (Chord): The chord; it must have a root note.
+
+    Returns:
+
+        Harmony: The content of the harmony element, without the bass note.
+
+    """
+
+    interval_types = chord.get_interval_types()
+
+    if interval_types["root"] is None:
+
+        raise ValueError("Invalid chord: the chord must have a root note.")
+
+    return _describe_harmony(tuple(interval_types[interval_name] for interval_name in INTERVAL_SLOT_NAMES))
+
+def voice_chord(chord: Chord,
+                octave: int = 4
+                ) -> List[Tuple[str, int, int]]:
+
+    """
+    Voices a chord in close position above its root note, with the bass note lowest if a slash bass note or an inversion has been set.
+
+    Args:
+
+        chord (Chord): The chord; it must have a root note.
+        octave (int): The octave of the root note, in scientific pitch notation; defaults to 4 (e.g., C4 is middle C).
+
+    Returns:
+
+        List[Tuple[str, int, int]]: The letter, alteration in semitones and octave of each note, from the lowest note up.
+
+    """
+
+    interval_types = chord.get_interval_types()
+
+    if interval_types["root"] is None:
+
+        raise ValueError("Invalid chord: the chord must have a root note.")
+
+    # Pairs each spelled note with its MIDI note number, from the semitones of its interval type rather than the tuning's steps.
+    root_step, root_alter = split_note(interval_types["root"].value)
+
+    root_number = (octave + 1) * CHROMATIC_LEN + NATURAL_NOTE_INDEX_DICT[root_step] + root_alter
+
+    semitones = [0 if interval_name == "root" else interval_type.semitones for interval_name, interval_type in interval_types.items() if interval_type is not None]
+
+    notes = [(note, root_number + interval) for note, interval in zip(chord.get_note_signature(), semitones)]
+
+    bass_note = chord.bass_note
+
+    if bass_note != notes[0][0]:
+
+        bass_numbers = [number for note, number in notes if note == bass_note]
+
+        if bass_numbers:
+
+            # Raises every note below the bass note by an octave.
+            notes = [(note, number + CHROMATIC_LEN if number < bass_numbers[0] else number) for note, number in notes]
+
+        else:
+
+            # Adds the slash bass note below the root note.
+            bass_step, bass_alter = split_note(bass_note)
+
+            notes.append((bass_note, root_number - (root_number - NATURAL_NOTE_INDEX_DICT[bass_step] - bass_alter) % CHROMATIC_LEN))
+
+    voicing = []
+
+    for note, number in sorted(notes, key=lambda pair: pair[1]):
+
+        step, alter = split_note(note)
+
+        # Takes the octave of the letter, so that a Cb sounding as B3 is written in octave 4.
+        voicing.append((step, alter, (number - NATURAL_NOTE_INDEX_DICT[step] - alter) // CHROMATIC_LEN - 1))
+
+    return voicing
+
+class MusicXMLWriter:
+
+    """
+    A class to write a chord progression as a partwise MusicXML score, one harmony element per chord, streaming each measure to the output as it is written.
+
+    No document tree is built, so the memory used is constant however many chords are written.
+    Each chord is followed by its notated voicing, or by a rest of the same duration.
+
+    Attributes:
+
+        title (Optional[str]): The title of the score.
+        chords_per_measure (int): The number of chords in each 4/4 measure; either 1, 2 or 4.
+        voicings (bool): Whether to notate a voicing of each chord (see voice_chord()), rather than a rest.
+        octave (int): The octave of the root note of each voicing.
+        chord_count (int): The number of chords written.
+
+    """
+
+    def __init__(self,
+                 stream: IO,
+                 title: Optional[str] = None,
+                 chords_per_measure: int = 1,
+                 voicings: bool = False,
+                 octave: int = 4
+                 ):
+
+        if chords_per_measure not in (1, 2, 4):
+
+            raise ValueError(f"Invalid chords_per_measure: {chords_per_measure} must be 1, 2 or 4.")
+
+        self._generator: XMLGenerator = XMLGenerator(stream, encoding="utf-8", short_empty_elements=True)
+
+        self.title: Optional[str] = title
+
+        self.chords_per_measure: int = chords_per_measure
+
+        self.voicings: bool = voicings
+
+        self.octave: int = octave
+
+        self.chord_count: int = 0
+
+        self._started: bool = False
+
+        self._closed: bool = False
+
+    def __enter__(self) -> "MusicXMLWriter":
+
+        self.start()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+
+        self.close()
+
+
+
+    def _start(self,
+               name: str,
+               attributes: Optional[Dict[str, str]] = None
+               ) -> None:
+
+        self._generator.startElement(name, attributes or {})
+
+    def _end(self,
+             name: str
+             ) -> None:
+
+        self._generator.endElement(name)
+
+    def _element(self,
+                 name: str,
+                 text: object,
+                 attributes: Optional[Dict[str, str]] = None
+                 ) -> None:
+
+        """
+        Writes an element with text content.
+
+        """
+
+        self._generator.startElement(name, attributes or {})
+
+        self._generator.characters(str(text))
+
+        self._generator.endElement(name)
+
+    def _empty(self,
+               name: str
+               ) -> None:
+
+        self._generator.startElement(name, {})
+
+        self._generator.endElement(name)
+
+    def _newline(self) -> None:
+
+        self._generator.ignorableWhitespace("\n")
+
+
+
+    def start(self) -> None:
+
+        """
+        Writes the XML declaration, the document type declaration and the score header, and opens the only part.
+
+        """
+
+        if self._started:
+
+            return
+
+        self._started = True
+
+        self._generator.startDocument()
+
+        # Writes the document type declaration as raw text, as XMLGenerator has no method for it.
+        self._generator.ignorableWhitespace(MUSICXML_DOCTYPE)
+
+        self._start("score-partwise", {"version": "4.0"})
+
+        self._newline()
+
+        if self.title is not None:
+
+            self._start("work")
+            self._element("work-title", self.title)
+            self._end("work")
+
+            self._newline()
+
+        self._start("part-list")
+        self._start("score-part", {"id": "P1"})
+        self._element("part-name", "Chords")
+        self._end("score-part")
+        self._end("part-list")
+
+        self._newline()
+
+        self._start("part", {"id": "P1"})
+
+        self._newline()
+
+    def _start_measure(self) -> None:
+
+        """
+        Opens the next measure; the first measure also sets the divisions, key, time signature and clef.
+
+        """
+
+        measure_number = self.chord_count // self.chords_per_measure + 1
+
+        self._start("measure", {"number": str(measure_number)})
+
+        if measure_number == 1:
+
+            self._start("attributes")
+            self._element("divisions", 1)
+            self._start("key")
+            self._element("fifths", 0)
+            self._end("key")
+            self._start("time")
+            self._element("beats", BEATS_PER_MEASURE)
+            self._element("beat-type", 4)
+            self._end("time")
+            self._start("clef")
+            self._element("sign", "G")
+            self._element("line", 2)
+            self._end("clef")
+            self._end("attributes")
+
+    def _end_measure(self) -> None:
+
+        self._end("measure")
+
+        self._newline()
+
+    def _write_harmony(self,
+                       chord: Chord
+                       ) -> None:
+
+        """
+        Writes the harmony element of a chord: the root note, the kind, the slash bass note and the degree alterations.
+
+        """
+
+        harmony = describe_harmony(chord)
+
+        self._start("harmony")
+
+        self._start("root")
+        self._element("root-step", harmony.root_step)
+
+        if harmony.root_alter:
+
+            self._element("root-alter", harmony.root_alter)
+
+        self._end("root")
+
+        self._element("kind", harmony.kind.kind, {"text": harmony.kind.text})
+
+        bass_note = chord.bass_note
+
+        if bass_note != chord.get_note_signature()[0]:
+
+            bass_step, bass_alter = split_note(bass_note)
+
+            self._start("bass")
+            self._element("bass-step", bass_step)
+
+            if bass_alter:
+
+                self._element("bass-alter", bass_alter)
+
+            self._end("bass")
+
+        for degree in harmony.degrees:
+
+            self._start("degree")
+            self._element("degree-value", degree.value)
+            self._element("degree-alter", degree.alter)
+            self._element("degree-type", degree.degree_type)
+            self._end("degree")
+
+        self._end("harmony")
+
+    def _write_notes(self,
+                     pitches: List[Tuple[str, int, int]],
+                     duration: int
+                     ) -> None:
+
+        """
+        Writes a voicing as notes sounding together, or a rest if there are no pitches.
+
+        """
+
+        if not pitches:
+
+            self._start("note")
+            self._empty("rest")
+            self._element("duration", duration)
+            self._element("type", _NOTE_TYPES[duration])
+            self._end("note")
+
+            return
+
+        for position, (step, alter, octave) in enumerate(pitches):
+
+            self._start("note")
+
+            if position:
+
+                self._empty("chord")
+
+            self._start("pitch")
+            self._element("step", step)
+
+            if alter:
+
+                self._element("alter", alter)
+
+            self._element("octave", octave)
+            self._end("pitch")
+
+            self._element("duration", duration)
+            self._element("type", _NOTE_TYPES[duration])
+            self._end("note")
+
+    def write(self,
+              chord: Chord
+              ) -> None:
+
+        """
+        Writes the harmony of a chord, followed by its voicing or a rest, and closes the measure once it is full.
+
+        Args:
+
+            chord (Chord): The chord; it must have a root note.
+
+        """
+
+        if self._closed:
+
+            raise ValueError("Invalid writer: the score has been closed.")
+
+        self.start()
+
+        if self.chord_count % self.chords_per_measure == 0:
+
+            self._start_measure()
+
+        duration = BEATS_PER_MEASURE // self.chords_per_measure
+
+        self._write_harmony(chord)
+
+        self._write_notes(voice_chord(chord, self.octave) if self.voicings else [], duration)
+
+        self.chord_count += 1
+
+        if self.chord_count % self.chords_per_measure == 0:
+
+            self._end_measure()
+
+    def write_chords(self,
+                     chords: Iterable[Chord]
+                     ) -> None:
+
+        """
+        Writes every chord of an iterable (e.g., a Progression), one at a time.
+
+        """
+
+        for chord in chords:
+
+            self.write(chord)
+
+    def close(self) -> None:
+
+        """
+        Fills the last measure with a rest if it is not full, and closes the part and the score; closing twice has no effect.
+
+        """
+
+        if self._closed:
+
+            return
+
+        self.start()
+
+        remainder = self.chord_count % self.chords_per_measure
+
+        if remainder:
+
+            # Fills the rest of the measure beat by beat, as each rest must have a note type.
+            for _ in range((self.chords_per_measure - remainder) * (BEATS_PER_MEASURE // self.chords_per_measure)):
+
+                self._write_notes([], 1)
+
+            self._end_measure()
+
+        self._end("part")
+
+        self._newline()
+
+        self._end("score-partwise")
+
+        self._newline()
+
+        self._generator.endDocument()
+
+        self._closed = True
+
+def write_musicxml(chords: Iterable[Chord],
+                   stream: IO,
+                   title: Optional[str] = None,
+                   chords_per_measure: int = 1,
+                   voicings: bool = False
+                   ) -> int:
+
+    """
+    Streams a chord progression to a binary or text stream as a MusicXML score, without building a document tree.
+
+    Args:
+
+        chords (Iterable[Chord]): The chords, as any iterable (e.g., a Progression or a generator), consumed one at a time.
+        stream (IO): The stream to write to.
+        title (Optional[str]): The title of the score; defaults to None.
+        chords_per_measure (int): The number of chords in each 4/4 measure; either 1, 2 or 4, and defaults to 1.
+        voicings (bool): Whether to notate a voicing of each chord, rather than a rest; defaults to False.
+
+    Returns:
+
+        int: The number of chords written.
+
+    """
+
+    with MusicXMLWriter(stream, title, chords_per_measure, voicings) as writer:
+
+        writer.write_chords(chords)
+
+    return writer.chord_count
@@ -0,0 +1,383 @@
+import heapq
+
+from abc import ABC, abstractmethod
+from itertools import cycle, tee
+from operator import attrgetter
+from typing import Iterable, Iterator, List, NamedTuple, Sequence, Tuple, Union
+
+from app.chord import Chord
+from app.utils import interval_signature
+from config.config import CHROMATIC_LEN
+
+# Defines the directions that an arpeggio can take through the voiced chord.
+ARPEGGIO_DIRECTIONS: Tuple[str, ...] = ("up", "down", "up_down")
+
+class NoteEvent(NamedTuple):
+
+    """
+    A timed note, as consumed by a playback engine; events compare by time first, so streams of events can be merged in time order.
+
+    Attributes:
+
+        time (float): The start of the note, in beats from the start of the progression.
+        pitch (int): The MIDI note number (e.g., 60 for middle C).
+        velocity (int): The MIDI velocity, from 1 to 127.
+        duration (float): The length of the note, in beats.
+        channel (int): The track the note belongs to; defaults to 0.
+
+    """
+
+    time: float
+    pitch: int
+    velocity: int
+    duration: float
+    channel: int = 0
+
+def voice_pitches(chord: Chord,
+                  octave: int = 4
+                  ) -> List[int]:
+
+    """
+    Stacks the notes of a chord upwards from its root note as MIDI note numbers, with the voiced interval signature (see utils.interval_signature()),
+    and puts the bass note lowest if a slash bass note or an inversion has been set, as musicxml.voice_chord() does.
+
+    Args:
+
+        chord (Chord): The chord; it must have a root note and a 12-TET tuning.
+        octave (int): The octave of the root note, in scientific pitch notation; defaults to 4 (e.g., C4 is MIDI note 60).
+
+    Returns:
+
+        List[int]: The MIDI note number of each note, in ascending order (e.g., [64, 67, 72] for the first inversion of C major).
+
+    """
+
+    if chord.root_index is None:
+
+        raise ValueError("Invalid chord: the chord must have a root note.")
+
+    if chord.tuning.divisions != CHROMATIC_LEN:
+
+        raise ValueError(f"Invalid chord: MIDI note numbers require a tuning with {CHROMATIC_LEN} divisions, not {chord.tuning.divisions}.")
+
+    root_number = (octave + 1) * CHROMATIC_LEN + chord.root_index
+
+    pitches = [root_number + interval for interval in interval_signature(chord)]
+
+    inversion = chord.inversion
+
+    if inversion is None:
+
+        # Adds the slash bass note below the root note.
+        pitches.append(root_number - (chord.root_index - chord.bass_index) % CHROMATIC_LEN)
+
+    elif inversion:
+
+        # Moves the chord tone in the bass to the first octave above the root note (e.g., the ninth of Cmaj9/D to D4), and raises every note below it by an octave.
+        bass_number = root_number + (chord.bass_index - chord.root_index) % CHROMATIC_LEN
+
+        del pitches[inversion]
+
+        pitches = [bass_number] + [pitch + CHROMATIC_LEN if pitch < bass_number else pitch for pitch in pitches]
+
+    return sorted(pitches)
+
+class Pattern(ABC):
+
+    """
+    A base class for the rhythmic patterns that a track plays over each chord.
+
+    Subclasses implement notes(), which yields the notes over one chord in time order.
+
+    Attributes:
+
+        velocity (int): The MIDI velocity of each note.
+        octave (int): The octave of the root note of each voiced chord.
+        channel (int): The channel of each note event.
+
+    """
+
+    def __init__(self,
+                 velocity: int = 80,
+                 octave: int = 4,
+                 channel: int = 0
+                 ):
+
+        if not 1 <= velocity <= 127:
+
+            raise ValueError(f"Invalid velocity: {velocity} must be from 1 to 127.")
+
+        self.velocity: int = velocity
+
+        self.octave: int = octave
+
+        self.channel: int = channel
+
+    @abstractmethod
+    def notes(self,
+              pitches: List[int],
+              length: float
+              ) -> Iterator[Tuple[float, int, int, float]]:
+
+        """
+        Yields the notes played over one chord, in time order.
+
+        Args:
+
+            pitches (List[int]): The MIDI note numbers of the voiced chord, in ascending order.
+            length (float): The length of the chord, in beats.
+
+        Returns:
+
+            Iterator[Tuple[float, int, int, float]]: The offset from the start of the chord, the pitch, the velocity and the duration of each note, in beats.
+
+        """
+
+class BrokenChord(Pattern):
+
+    """
+    A pattern that plays the notes of each chord one at a time, in a repeating order of positions in the voiced chord (e.g., (0, 2, 1, 2) for an Alberti bass).
+
+    A position past the last note repeats the voiced chord an octave higher, and a negative position an octave lower (e.g., 3 is the root note an octave up in a triad).
+
+    Attributes:
+
+        order (Tuple[int, ...]): The positions of the notes, cycled until the chord ends.
+        step (float): The time between notes, in beats.
+        gate (float): The length of each note, as a fraction of the step.
+        accent (int): The velocity added to the first note of each chord.
+
+    """
+
+    def __init__(self,
+                 order: Sequence[int] = (0, 2, 1, 2),
+                 step: float = 0.5,
+                 gate: float = 1.0,
+                 accent: int = 0,
+                 **kwargs: int
+                 ):
+
+        super().__init__(**kwargs)
+
+        if step <= 0 or gate <= 0:
+
+            raise ValueError(f"Invalid step: the step ({step}) and gate ({gate}) must be positive.")
+
+        self.order: Tuple[int, ...] = tuple(order)
+
+        self.step: float = step
+
+        self.gate: float = gate
+
+        self.accent: int = accent
+
+    def _order(self,
+               pitch_count: int
+               ) -> Tuple[int, ...]:
+
+        return self.order
+
+    def notes(self,
+              pitches: List[int],
+              length: float
+              ) -> Iterator[Tuple[float, int, int, float]]:
+
+        order = self._order(len(pitches))
+
+        if not order:
+
+            return
+
+        positions = cycle(order)
+
+        accented_velocity = min(self.velocity + self.accent, 127)
+
+        # Counts the steps, rather than adding up the offsets, so that float errors do not accumulate over a long chord.
+        for step_index in range(int(-(-length // self.step))):
+
+            octave, index = divmod(next(positions), len(pitches))
+
+            yield step_index * self.step, pitches[index] + octave * CHROMATIC_LEN, accented_velocity if step_index == 0 else self.velocity, self.step * self.gate
+
+class Arpeggio(BrokenChord):
+
+    """
+    A pattern that plays the notes of each chord one at a time, up, down or up and down through the voiced chord over a number of octaves.
+
+    Attributes:
+
+        direction (str): Either "up", "down" or "up_down"; "up_down" does not repeat the top and bottom notes.
+        octaves (int): The number of octaves that the arpeggio spans.
+
+    """
+
+    def __init__(self,
+                 direction: str = "up",
+                 octaves: int = 1,
+                 step: float = 0.5,
+                 **kwargs: Union[int, float]
+                 ):
+
+        if direction not in ARPEGGIO_DIRECTIONS:
+
+            raise ValueError(f"Invalid direction: {direction} must be one of {ARPEGGIO_DIRECTIONS}.")
+
+        if octaves < 1:
+
+            raise ValueError(f"Invalid octaves: {octaves} must be at least 1.")
+
+        super().__init__(order=(), step=step, **kwargs)
+
+        self.direction: str = direction
+
+        self.octaves: int = octaves
+
+    def _order(self,
+               pitch_count: int
+               ) -> Tuple[int, ...]:
+
+        ascending = tuple(range(pitch_count * self.octaves))
+
+        if self.direction == "up":
+
+            return ascending
+
+        if self.direction == "down":
+
+            return ascending[::-1]
+
+        return ascending + ascending[-2:0:-1]
+
+class Comping(Pattern):
+
+    """
+    A pattern that plays every note of each chord together, on a repeating rhythm.
+
+    Attributes:
+
+        rhythm (Tuple[Tuple[float, float], ...]): The offset and duration in beats of each hit, within a cycle, in time order.
+        cycle_length (float): The length of the rhythm's cycle, in beats; the rhythm restarts with each chord.
+
+    """
+
+    def __init__(self,
+                 rhythm: Sequence[Tuple[float, float]] = ((0.0, 1.0), (1.5, 0.5), (2.5, 1.0)),
+                 cycle_length: float = 4.0,
+                 **kwargs: int
+                 ):
+
+        super().__init__(**kwargs)
+
+        if cycle_length <= 0:
+
+            raise ValueError(f"Invalid cycle_length: {cycle_length} must be positive.")
+
+        for offset, duration in rhythm:
+
+            if not 0 <= offset < cycle_length or duration <= 0:
+
+                raise ValueError(f"Invalid rhythm: each hit must start within the cycle and have a positive duration, not ({offset}, {duration}).")
+
+        self.rhythm: Tuple[Tuple[float, float], ...] = tuple(sorted(rhythm))
+
+        self.cycle_length: float = cycle_length
+
+    def notes(self,
+              pitches: List[int],
+              length: float
+              ) -> Iterator[Tuple[float, int, int, float]]:
+
+        if not self.rhythm:
+
+            return
+
+        for cycle_index in range(int(-(-length // self.cycle_length))):
+
+            for offset, duration in self.rhythm:
+
+                offset += cycle_index * self.cycle_length
+
+                if offset >= length:
+
+                    return
+
+                for pitch in pitches:
+
+                    yield offset, pitch, self.velocity, duration
+
+def track_events(chords: Iterable[Chord],
+                 pattern: Pattern,
+                 beats: Union[float, Iterable[float]] = 4.0
+                 ) -> Iterator[NoteEvent]:
+
+    """
+    Plays a pattern over a progression, lazily: each chord is read, voiced and played only when the previous chord's events have been consumed.
+
+    Args:
+
+        chords (Iterable[Chord]): The chords, as any iterable (e.g., a Progression or a generator).
+        pattern (Pattern): The pattern to play over each chord.
+        beats (Union[float, Iterable[float]]): The length of every chord in beats, or of each chord in turn; defaults to 4.0.
+
+    Returns:
+
+        Iterator[NoteEvent]: The note events, in time order.
+
+    """
+
+    lengths = cycle((beats,)) if isinstance(beats, (int, float)) else iter(beats)
+
+    time = 0.0
+
+    for chord, length in zip(chords, lengths):
+
+        if length <= 0:
+
+            raise ValueError(f"Invalid beats: {length} must be positive.")
+
+        for offset, pitch, velocity, duration in pattern.notes(voice_pitches(chord, pattern.octave), length):
+
+            yield NoteEvent(time + offset, pitch, velocity, duration, pattern.channel)
+
+        time += length
+
+def merge_tracks(*tracks: Iterable[NoteEvent]) -> Iterator[NoteEvent]:
+
+    """
+    Merges time-ordered streams of note events into one time-ordered stream, holding only the next event of each stream; events at the same time keep the order of the tracks.
+
+    """
+
+    return heapq.merge(*tracks, key=attrgetter("time"))
+
+def perform(chords: Iterable[Chord],
+            patterns: Sequence[Pattern],
+            beats: Union[float, Iterable[float]] = 4.0
+            ) -> Iterator[NoteEvent]:
+
+    """
+    Plays several patterns over the same progression at once (e.g., a bass line, an arpeggio and comping), as a single lazy, time-ordered stream of note events.
+
+    The chords are read once, and each track buffers only the chords that it has not yet reached, so a song's events are never materialised up front.
+
+    Args:
+
+        chords (Iterable[Chord]): The chords, as any iterable (e.g., a Progression or a generator).
+        patterns (Sequence[Pattern]): The pattern of each track; set a different channel on each to tell the tracks apart.
+        beats (Union[float, Iterable[float]]): The length of every chord in beats, or of each chord in turn; defaults to 4.0.
+
+    Returns:
+
+        Iterator[NoteEvent]: The note events of every track, in time order.
+
+    """
+
+    if not patterns:
+
+        return iter(())
+
+    chord_streams = tee(chords, len(patterns))
+
+    length_streams = tee(beats, len(patterns)) if not isinstance(beats, (int, float)) else (beats,) * len(patterns)
+
+    return merge_tracks(*(track_events(chord_stream, pattern, length_stream) for chord_stream, pattern, length_stream in zip(chord_streams, patterns, length_streams)))
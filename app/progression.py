@@ -0,0 +1,196 @@
+import struct
+import sys
+
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Sequence, Union, overload
+
+from app.chord import Chord, CHORD_STRUCT
+from app.library.codes import ROOT_INDICES, SLOT_RADICES, SLOT_SIZES, CHORD_ID_COUNT, encode_interval_types, decode_interval_types, pack_codes, unpack_codes
+from app.tuning import Tuning
+from config.config import INTERVAL_SLOT_NAMES
+
+if TYPE_CHECKING:
+
+    from app.chord_array import ChordArray
+
+# Defines the header of the binary progression format: magic bytes, format version and number of chords, padded to keep the chord IDs four-byte aligned.
+PROGRESSION_HEADER: struct.Struct = struct.Struct("<4sII")
+
+_FILE_MAGIC: bytes = b"CHPR"
+_FILE_VERSION: int = 1
+
+class Progression:
+
+    """
+    A sequence of chords, stored as one chord ID (see app/library/codes.py) per chord.
+
+    The binary form is a twelve byte header followed by four bytes per chord, and from_bytes() decodes it without copying the chord IDs;
+    chords are constructed only when they are accessed.
+
+    Attributes:
+
+        chord_ids (Sequence[int]): The chord ID of each chord, as an array or a memoryview of unsigned 32-bit integers.
+        tuning (Optional[Tuning]): The tuning of the chords that are constructed; defaults to 12-TET.
+
+    """
+
+    def __init__(self,
+                 chord_ids: Union[Sequence[int], memoryview],
+                 tuning: Optional[Tuning] = None
+                 ):
+
+        self.chord_ids: Union[Sequence[int], memoryview] = chord_ids
+
+        self.tuning: Optional[Tuning] = tuning
+
+    @classmethod
+    def from_chords(cls,
+                    chords: Iterable[Chord],
+                    tuning: Optional[Tuning] = None
+                    ) -> "Progression":
+
+        """
+        Packs chords into a progression.
+
+        """
+
+        return cls(array("I", (pack_codes(encode_interval_types(chord.get_interval_types())) for chord in chords)), tuning)
+
+    def to_bytes(self) -> bytes:
+
+        """
+        Packs the progression into its binary form: the header, then each chord ID as a little-endian unsigned 32-bit integer.
+
+        """
+
+        chord_ids = array("I", self.chord_ids)
+
+        if sys.byteorder == "big":
+
+            chord_ids.byteswap()
+
+        return PROGRESSION_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(chord_ids)) + chord_ids.tobytes()
+
+    @classmethod
+    def from_bytes(cls,
+                   data: Union[bytes, bytearray, memoryview],
+                   tuning: Optional[Tuning] = None
+                   ) -> "Progression":
+
+        """
+        Unpacks a progression packed by to_bytes().
+
+        On little-endian platforms the chord IDs are a memoryview of the data, so no chord ID is copied or decoded until it is accessed.
+
+        Args:
+
+            data (Union[bytes, bytearray, memoryview]): The packed progression.
+            tuning (Optional[Tuning]): The tuning of the chords that are constructed; defaults to 12-TET.
+
+        Returns:
+
+            Progression: The progression.
+
+        """
+
+        view = memoryview(data).cast("B")
+
+        if len(view) < PROGRESSION_HEADER.size:
+
+            raise ValueError(f"Invalid data: {len(view)} bytes provided, expected at least {PROGRESSION_HEADER.size}.")
+
+        magic, version, count = PROGRESSION_HEADER.unpack_from(view)
+
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+
+            raise ValueError(f"Invalid data: expected a version {_FILE_VERSION} chord progression.")
+
+        end = PROGRESSION_HEADER.size + count * CHORD_STRUCT.size
+
+        if len(view) < end:
+
+            raise ValueError(f"Invalid data: {len(view)} bytes provided, expected {end} for {count} chords.")
+
+        if sys.byteorder == "little":
+
+            chord_ids = view[PROGRESSION_HEADER.size:end].cast("I")
+
+        else:
+
+            chord_ids = array("I", view[PROGRESSION_HEADER.size:end].tobytes())
+
+            chord_ids.byteswap()
+
+        return cls(chord_ids, tuning)
+
+    def to_chord_array(self) -> "ChordArray":
+
+        """
+        Unpacks every chord ID into a ChordArray with vectorised operations, reading the chord IDs without copying them.
+
+        """
+
+        # Imports NumPy on first use, as it is only required for ChordArray conversion.
+        import numpy as np
+
+        from app.chord_array import ChordArray
+
+        chord_ids = np.frombuffer(self.chord_ids, dtype=np.uint32) if isinstance(self.chord_ids, (memoryview, array)) else np.asarray(self.chord_ids, dtype=np.uint32)
+
+        codes = {interval_name: (chord_ids // radix % size).astype(np.uint8) for interval_name, radix, size in zip(INTERVAL_SLOT_NAMES, SLOT_RADICES, SLOT_SIZES)}
+
+        # Maps each root note code to its index position in the chromatic scale, with code 0 (no root note) mapping to -1.
+        root_indices = np.array(ROOT_INDICES, dtype=np.int8)
+
+        return ChordArray(root_indices[codes["root"]], codes)
+
+    def __len__(self) -> int:
+
+        return len(self.chord_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Chord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "Progression": ...
+
+    def __getitem__(self,
+                    index: Union[int, slice]
+                    ) -> Union[Chord, "Progression"]:
+
+        """
+        Constructs the chord at an index, or returns a progression of a slice of the chord IDs.
+
+        """
+
+        if isinstance(index, slice):
+
+            return Progression(self.chord_ids[index], self.tuning)
+
+        chord_id = self.chord_ids[index]
+
+        if chord_id >= CHORD_ID_COUNT:
+
+            raise ValueError(f"Invalid data: {chord_id} is not a valid chord ID.")
+
+        return Chord.from_interval_types(decode_interval_types(unpack_codes(chord_id)), self.tuning)
+
+    def __iter__(self) -> Iterator[Chord]:
+
+        for index in range(len(self)):
+
+            yield self[index]
+
+    def __eq__(self,
+               other: object
+               ) -> bool:
+
+        if not isinstance(other, Progression):
+
+            return NotImplemented
+
+        return list(self.chord_ids) == list(other.chord_ids)
+
+    def __repr__(self) -> str:
+
+        return f"Progression({len(self)} chords)"
@@ -0,0 +1,167 @@
+from enum import Enum
+from typing import Dict, FrozenSet, NamedTuple
+
+from app.library.codes import SLOT_TYPES
+from app.spelling import add_interval_spellings, remove_interval_spellings
+from app.tuning import compile_interval, remove_interval
+from config.config import CHROMATIC_LEN, INTERVAL_DICT, INTERVAL_FIFTHS_DICT, INTERVAL_SLOT_NAMES
+
+class IntervalFamily(NamedTuple):
+
+    """
+    The registration of an interval type Enum, built once so that a chord resolves any interval type with a single dictionary lookup.
+
+    Attributes:
+
+        enum_class (type): The interval type Enum (e.g., NinthType).
+        interval_name (str): The interval name that its members are stored under (e.g., "ninth").
+        slot_index (int): The index position of the interval name in INTERVAL_SLOT_NAMES.
+        semitones (Dict[Enum, int]): The size of each member in semitones above the root note; 0 for root notes.
+
+    """
+
+    enum_class: type
+    interval_name: str
+    slot_index: int
+    semitones: Dict[Enum, int]
+
+# Stores the built-in interval names, which cannot be unregistered.
+_BUILT_IN_INTERVAL_NAMES: FrozenSet[str] = frozenset(INTERVAL_DICT)
+
+# Maps each registered interval type Enum to its family (e.g., NinthType -> IntervalFamily(NinthType, "ninth", 7, {...})).
+INTERVAL_FAMILIES: Dict[type, IntervalFamily] = {}
+
+def register_interval_name(interval_name: str,
+                           semitones: int,
+                           fifths: int
+                           ) -> None:
+
+    """
+    Registers a new interval name (e.g., "augmented_ninth"), so that plug-in interval type members can use it as their value.
+
+    The interval name is added to INTERVAL_DICT and INTERVAL_FIFTHS_DICT, its spelling above every root note is added to SPELLING_TABLE,
+    and its size is compiled into every tuning.
+
+    Args:
+
+        interval_name (str): The interval name.
+        semitones (int): The size of the interval in semitones (e.g., 15 for an augmented ninth).
+        fifths (int): The position of the interval on the line of fifths, relative to the root note (e.g., 9 for an augmented ninth).
+
+    """
+
+    if (fifths * 7) % CHROMATIC_LEN != semitones % CHROMATIC_LEN:
+
+        raise ValueError(f"Invalid interval: {fifths} fifths from the root note is not {semitones} semitones above it.")
+
+    if INTERVAL_DICT.get(interval_name, semitones) != semitones or INTERVAL_FIFTHS_DICT.get(interval_name, fifths) != fifths:
+
+        raise ValueError(f"Invalid interval name: {interval_name!r} is already registered with a different size.")
+
+    INTERVAL_DICT[interval_name] = semitones
+
+    INTERVAL_FIFTHS_DICT[interval_name] = fifths
+
+    add_interval_spellings(interval_name)
+
+    compile_interval(interval_name)
+
+def unregister_interval_name(interval_name: str) -> None:
+
+    """
+    Removes an interval name added by register_interval_name() from INTERVAL_DICT, INTERVAL_FIFTHS_DICT, SPELLING_TABLE and every compiled tuning;
+    the built-in interval names cannot be removed.
+
+    Args:
+
+        interval_name (str): The interval name.
+
+    """
+
+    if interval_name in _BUILT_IN_INTERVAL_NAMES:
+
+        raise ValueError(f"Invalid interval name: {interval_name!r} is built in.")
+
+    INTERVAL_DICT.pop(interval_name, None)
+
+    INTERVAL_FIFTHS_DICT.pop(interval_name, None)
+
+    remove_interval_spellings(interval_name)
+
+    remove_interval(interval_name)
+
+def register_interval_family(enum_class: type,
+                             interval_name: str
+                             ) -> IntervalFamily:
+
+    """
+    Registers an interval type Enum under an interval name, without editing the Chord class (e.g., an altered ninth family with b9 and #9 members).
+
+    Plug-in members can be set on and spelled by a chord, but have no code in app/library/codes.py, so chords that use them cannot be packed into a chord ID.
+
+    Args:
+
+        enum_class (type): The interval type Enum (preferably an IntervalEnum); the value of each member must be in INTERVAL_DICT (see register_interval_name).
+        interval_name (str): The interval name in INTERVAL_SLOT_NAMES that its members are stored under (e.g., "ninth").
+
+    Returns:
+
+        IntervalFamily: The registered family.
+
+    """
+
+    if interval_name not in INTERVAL_SLOT_NAMES:
+
+        raise ValueError(f"Invalid interval name: {interval_name!r} must be one of {INTERVAL_SLOT_NAMES}.")
+
+    if interval_name != "root":
+
+        for member in enum_class:
+
+            if member.value not in INTERVAL_DICT:
+
+                raise ValueError(f"Invalid interval_type: {member} has the unregistered interval name {member.value!r}; see register_interval_name().")
+
+            # Carries the size in semitones on plug-in members that are not IntervalEnum members, as a chord reads it directly in 12-TET.
+            if not hasattr(member, "semitones"):
+
+                member.semitones = INTERVAL_DICT[member.value]
+
+    family = IntervalFamily(enum_class, interval_name, INTERVAL_SLOT_NAMES.index(interval_name), {member: member.semitones for member in enum_class})
+
+    INTERVAL_FAMILIES[enum_class] = family
+
+    return family
+
+def unregister_interval_family(enum_class: type) -> None:
+
+    """
+    Removes a plug-in interval type Enum; the built-in interval type Enums cannot be removed.
+
+    """
+
+    if enum_class in SLOT_TYPES:
+
+        raise ValueError(f"Invalid interval type Enum: {enum_class.__name__} is built in.")
+
+    INTERVAL_FAMILIES.pop(enum_class, None)
+
+def interval_family(interval_type: Enum) -> IntervalFamily:
+
+    """
+    Returns the family of an interval type.
+
+    """
+
+    family = INTERVAL_FAMILIES.get(interval_type.__class__)
+
+    if family is None:
+
+        raise ValueError(f"Invalid interval_type: {interval_type} must be an instance of a valid Enum type.")
+
+    return family
+
+# Registers the built-in interval type Enums.
+for _interval_name, _slot_type in zip(INTERVAL_SLOT_NAMES, SLOT_TYPES):
+
+    register_interval_family(_slot_type, _interval_name)
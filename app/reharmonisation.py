@@ -0,0 +1,484 @@
+import heapq
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from app.chord import Chord
+from app.key_finding import Key, find_keys
+from app.library.codes import SLOT_MEMBERS, ROOT_INDICES, ROOT_TYPES_BY_INDEX, encode_interval_types, pack_codes, unpack_codes
+from app.library.enums import RootType
+from app.markov import chord_from_id, chord_id_mask
+from app.roman_numerals import MODE_SCALES
+from app.similarity import nearest_distances
+from app.spelling import SPELLING_TABLE
+from app.utils import rotate_mask
+from config.config import CHROMATIC_LEN, INTERVAL_SLOT_NAMES
+
+# Stores a substituted chord as (root note index, intervals above the root note of its third, fifth and any seventh); None keeps the source chord.
+Shape = Optional[Tuple[int, Tuple[int, ...]]]
+
+# Defines the chord shapes that substitutions are built from, as intervals above the root note.
+MAJOR: Tuple[int, ...] = (4, 7)
+MINOR: Tuple[int, ...] = (3, 7)
+MAJOR_SEVENTH: Tuple[int, ...] = (4, 7, 11)
+MINOR_SEVENTH: Tuple[int, ...] = (3, 7, 10)
+DOMINANT_SEVENTH: Tuple[int, ...] = (4, 7, 10)
+
+# Defines the interval name of each offset above the tonic, used to spell substituted root notes from the key (e.g., Db rather than C# for the tritone substitution of G7 in C major).
+_OFFSET_INTERVAL_NAMES: Tuple[str, ...] = ("unison", "minor_second", "major_second", "minor_third", "major_third", "perfect_fourth",
+                                           "augmented_fourth", "perfect_fifth", "minor_sixth", "major_sixth", "minor_seventh", "major_seventh")
+
+# Maps the interval in semitones of each third, fifth and seventh to its interval type Enum member.
+_SHAPE_TYPES: Dict[str, Dict[int, object]] = {interval_name: {member.semitones: member for member in SLOT_MEMBERS[INTERVAL_SLOT_NAMES.index(interval_name)]}
+                                              for interval_name in ("third", "fifth", "seventh")}
+
+# Maps each root note to its RootType.
+_ROOT_TYPES_BY_VALUE: Dict[str, RootType] = {root_type.value: root_type for root_type in RootType}
+
+class SubstitutionRule(NamedTuple):
+
+    """
+    A rule that substitutes a chord, from its root note and quality, in a key.
+
+    Attributes:
+
+        name (str): The name of the rule (e.g., "tritone_substitution").
+        weight (float): The score added for each substitution, as a preference for the rule's colour.
+        substitute (Callable[[int, int, Key], Optional[Tuple[Shape, ...]]]): A function from the root note index, the quality mask (bit 0 as the root note) and the key
+                                                                                to the chords that replace the source chord within its bar, or None if the rule does not apply.
+
+    """
+
+    name: str
+    weight: float
+    substitute: Callable[[int, int, Key], Optional[Tuple[Shape, ...]]]
+
+class Substitution(NamedTuple):
+
+    """
+    A substitution of a source chord, as the chord IDs that replace it within its bar, the rule applied (None where the source chord is kept),
+    and its weight: the rule's weight less the penalty for the notes of the source chord that are lost.
+
+    """
+
+    chord_ids: Tuple[int, ...]
+    rule: Optional[str]
+    weight: float
+
+class Reharmonisation(NamedTuple):
+
+    """
+    A reharmonised progression.
+
+    Attributes:
+
+        score (float): The sum of the substitution weights, less the voice leading penalty.
+        chord_ids (Tuple[int, ...]): The chord IDs of the reharmonised progression; a source chord may be replaced by more than one chord.
+        rules (Tuple[Optional[str], ...]): The rule applied to each source chord, or None where it is kept.
+
+    """
+
+    score: float
+    chord_ids: Tuple[int, ...]
+    rules: Tuple[Optional[str], ...]
+
+    def chords(self) -> List[Chord]:
+
+        return [chord_from_id(chord_id) for chord_id in self.chord_ids]
+
+def _has(quality_mask: int,
+         *intervals: int
+         ) -> bool:
+
+    return all(quality_mask >> interval & 1 for interval in intervals)
+
+def _is_dominant(quality_mask: int) -> bool:
+
+    return _has(quality_mask, 4, 10) and not _has(quality_mask, 3) and not _has(quality_mask, 11)
+
+def _is_major(quality_mask: int) -> bool:
+
+    return _has(quality_mask, 4, 7) and not _has(quality_mask, 3) and not _has(quality_mask, 10)
+
+def _is_minor(quality_mask: int) -> bool:
+
+    return _has(quality_mask, 3, 7) and not _has(quality_mask, 4)
+
+def _tritone_substitution(root_index: int, quality_mask: int, key: Key) -> Optional[Tuple[Shape, ...]]:
+
+    """
+    Replaces a dominant seventh chord with the dominant seventh chord a tritone away (e.g., G7 -> Db7).
+
+    """
+
+    return ((root_index + 6, DOMINANT_SEVENTH),) if _is_dominant(quality_mask) else None
+
+def _relative_chord(root_index: int, quality_mask: int, key: Key) -> Optional[Tuple[Shape, ...]]:
+
+    """
+    Replaces a major chord with its relative minor chord (e.g., Cmaj7 -> Am7), and a minor chord with its relative major chord (e.g., Dm -> F).
+
+    """
+
+    if _is_major(quality_mask):
+
+        return ((root_index + 9, MINOR_SEVENTH if _has(quality_mask, 11) else MINOR),)
+
+    if _is_minor(quality_mask):
+
+        return ((root_index + 3, MAJOR_SEVENTH if _has(quality_mask, 10) else MAJOR),)
+
+    return None
+
+def _secondary_dominant(root_index: int, quality_mask: int, key: Key) -> Optional[Tuple[Shape, ...]]:
+
+    """
+    Precedes a major or minor chord other than the tonic with its dominant seventh chord, within its bar (e.g., Dm7 -> A7 Dm7).
+
+    """
+
+    if (root_index - key.tonic_index) % CHROMATIC_LEN == 0 or not (_is_major(quality_mask) or _is_minor(quality_mask) or _is_dominant(quality_mask)):
+
+        return None
+
+    return ((root_index + 7, DOMINANT_SEVENTH), None)
+
+def _modal_interchange(root_index: int, quality_mask: int, key: Key) -> Optional[Tuple[Shape, ...]]:
+
+    """
+    Replaces a diatonic chord with the chord on the same scale degree of the parallel mode (e.g., F -> Fm, Am -> Ab in C major).
+
+    """
+
+    scale = MODE_SCALES[key.mode]
+
+    offset = (root_index - key.tonic_index) % CHROMATIC_LEN
+
+    if offset not in scale or not (_is_major(quality_mask) or _is_minor(quality_mask) or _is_dominant(quality_mask)):
+
+        return None
+
+    degree = scale.index(offset)
+
+    parallel_scale = MODE_SCALES["minor" if key.mode == "major" else "major"]
+
+    # Stacks thirds from the degree of the parallel scale, with a seventh if the source chord has one.
+    notes = [parallel_scale[(degree + step) % len(parallel_scale)] for step in (2, 4, 6)[:3 if _has(quality_mask, 10) or _has(quality_mask, 11) else 2]]
+
+    shape = tuple((note - parallel_scale[degree]) % CHROMATIC_LEN for note in notes)
+
+    return ((key.tonic_index + parallel_scale[degree], shape),)
+
+def _backdoor_progression(root_index: int, quality_mask: int, key: Key) -> Optional[Tuple[Shape, ...]]:
+
+    """
+    Replaces the dominant seventh chord of a major key with the backdoor ii-V, within its bar (e.g., G7 -> Fm7 Bb7 in C major).
+
+    """
+
+    if key.mode != "major" or (root_index - key.tonic_index) % CHROMATIC_LEN != 7 or not _is_dominant(quality_mask):
+
+        return None
+
+    return ((key.tonic_index + 5, MINOR_SEVENTH), (key.tonic_index + 10, DOMINANT_SEVENTH))
+
+# Defines the substitution rules, keyed by name.
+SUBSTITUTION_RULES: Dict[str, SubstitutionRule] = {
+
+    "tritone_substitution": SubstitutionRule("tritone_substitution", 1.0, _tritone_substitution),
+    "relative_chord": SubstitutionRule("relative_chord", 0.5, _relative_chord),
+    "secondary_dominant": SubstitutionRule("secondary_dominant", 0.4, _secondary_dominant),
+    "modal_interchange": SubstitutionRule("modal_interchange", 0.7, _modal_interchange),
+    "backdoor_progression": SubstitutionRule("backdoor_progression", 1.0, _backdoor_progression)
+
+}
+
+def register_rule(rule: SubstitutionRule) -> None:
+
+    """
+    Registers a substitution rule under its name, replacing any rule with the same name; reharmonisers constructed afterwards can use it.
+
+    """
+
+    SUBSTITUTION_RULES[rule.name] = rule
+
+def _spelled_root_type(root_index: int,
+                       key: Key
+                       ) -> RootType:
+
+    """
+    Spells a root note from the key's tonic (e.g., Db rather than C# as the minor second of C), falling back to the chromatic scale's spelling.
+
+    """
+
+    note = SPELLING_TABLE[ROOT_TYPES_BY_INDEX[key.tonic_index]][_OFFSET_INTERVAL_NAMES[(root_index - key.tonic_index) % CHROMATIC_LEN]]
+
+    return _ROOT_TYPES_BY_VALUE.get(note, ROOT_TYPES_BY_INDEX[root_index % CHROMATIC_LEN])
+
+def _shape_chord_id(shape: Tuple[int, Tuple[int, ...]],
+                    key: Key
+                    ) -> int:
+
+    """
+    Packs a substituted chord into its chord ID.
+
+    """
+
+    root_index, intervals = shape
+
+    interval_types = {"root": _spelled_root_type(root_index % CHROMATIC_LEN, key)}
+
+    for interval_name, interval in zip(("third", "fifth", "seventh"), intervals):
+
+        interval_types[interval_name] = _SHAPE_TYPES[interval_name][interval]
+
+    return pack_codes(encode_interval_types(interval_types))
+
+class Reharmoniser:
+
+    """
+    A class to search the reharmonisations of a progression with substitution rules.
+
+    The substitutions of each source chord are calculated once per key and memoised, so a chord that recurs (in this or any later progression) is never expanded again.
+    The search keeps the best beam_width partial progressions after each source chord, scoring each by its rule weights, less a penalty for each note of a source chord
+    that its substitution loses and a penalty per semitone of voice leading between consecutive chords (see app/transitions.py); its cost grows linearly with the length of the progression.
+
+    Attributes:
+
+        rules (Tuple[SubstitutionRule, ...]): The substitution rules.
+        beam_width (int): The number of partial progressions kept after each source chord.
+        fidelity_weight (float): The score subtracted for each note of a source chord that its substitution loses.
+        voice_leading_weight (float): The score subtracted per semitone of voice leading between consecutive chords.
+
+    """
+
+    def __init__(self,
+                 rules: Optional[Iterable[str]] = None,
+                 beam_width: int = 32,
+                 fidelity_weight: float = 0.3,
+                 voice_leading_weight: float = 0.1
+                 ):
+
+        if beam_width < 1:
+
+            raise ValueError(f"Invalid beam_width: {beam_width} must be at least 1.")
+
+        rule_names = list(SUBSTITUTION_RULES) if rules is None else list(rules)
+
+        for rule_name in rule_names:
+
+            if rule_name not in SUBSTITUTION_RULES:
+
+                raise ValueError(f"Invalid rule: {rule_name} must be one of {list(SUBSTITUTION_RULES)}.")
+
+        self.rules: Tuple[SubstitutionRule, ...] = tuple(SUBSTITUTION_RULES[rule_name] for rule_name in rule_names)
+
+        self.beam_width: int = beam_width
+
+        self.fidelity_weight: float = fidelity_weight
+
+        self.voice_leading_weight: float = voice_leading_weight
+
+        # Stores the substitutions of each source chord, keyed by (chord ID, key).
+        self._substitutions: Dict[Tuple[int, Key], Tuple[Substitution, ...]] = {}
+
+        # Stores the pitch class mask of each chord ID, and the voice leading between each pair of masks, once they have been calculated.
+        self._masks: Dict[int, int] = {}
+        self._voice_leadings: Dict[Tuple[int, int], int] = {}
+
+    def substitutions(self,
+                      chord_id: int,
+                      key: Key
+                      ) -> Tuple[Substitution, ...]:
+
+        """
+        Returns the substitutions of a source chord in a key, starting with the source chord itself; calculated once per (chord ID, key) pair.
+
+        """
+
+        lookup_key = (chord_id, key)
+
+        substitutions = self._substitutions.get(lookup_key)
+
+        if substitutions is None:
+
+            substitutions = [Substitution((chord_id,), None, 0.0)]
+
+            codes = unpack_codes(chord_id)
+
+            if codes[0]:
+
+                root_index = ROOT_INDICES[codes[0]]
+
+                quality_mask = rotate_mask(self._mask(chord_id), -root_index)
+
+                seen = {(chord_id,)}
+
+                for rule in self.rules:
+
+                    shapes = rule.substitute(root_index, quality_mask, key)
+
+                    if shapes is None:
+
+                        continue
+
+                    chord_ids = tuple(chord_id if shape is None else _shape_chord_id(shape, key) for shape in shapes)
+
+                    # Skips substitutions that only respell the source chord (e.g., a diatonic chord that the parallel mode shares).
+                    if len(chord_ids) == 1 and self._mask(chord_ids[0]) == self._mask(chord_id):
+
+                        continue
+
+                    if chord_ids not in seen:
+
+                        seen.add(chord_ids)
+
+                        # Counts the notes of the source chord that no chord of the substitution keeps.
+                        kept_mask = 0
+
+                        for substitute_chord_id in chord_ids:
+
+                            kept_mask |= self._mask(substitute_chord_id)
+
+                        lost_notes = bin(self._mask(chord_id) & ~kept_mask).count("1")
+
+                        substitutions.append(Substitution(chord_ids, rule.name, rule.weight - self.fidelity_weight * lost_notes))
+
+            substitutions = self._substitutions[lookup_key] = tuple(substitutions)
+
+        return substitutions
+
+    def _mask(self,
+              chord_id: int
+              ) -> int:
+
+        mask = self._masks.get(chord_id)
+
+        if mask is None:
+
+            mask = self._masks[chord_id] = chord_id_mask(chord_id)
+
+        return mask
+
+    def _voice_leading(self,
+                       chord_id_a: int,
+                       chord_id_b: int
+                       ) -> int:
+
+        """
+        Returns the voice leading between two chords, as the sum of the distances in semitones from each note to the nearest note of the other chord.
+
+        """
+
+        masks = (self._mask(chord_id_a), self._mask(chord_id_b))
+
+        voice_leading = self._voice_leadings.get(masks)
+
+        if voice_leading is None:
+
+            distances = nearest_distances()
+
+            mask_a, mask_b = masks
+
+            voice_leading = self._voice_leadings[masks] = int(sum(distances[mask_b, pitch_class] for pitch_class in range(CHROMATIC_LEN) if mask_a >> pitch_class & 1)
+                                                              + sum(distances[mask_a, pitch_class] for pitch_class in range(CHROMATIC_LEN) if mask_b >> pitch_class & 1))
+
+        return voice_leading
+
+    def _score(self,
+               substitution: Substitution,
+               previous_chord_id: Optional[int]
+               ) -> float:
+
+        """
+        Scores a substitution after the previous chord, including the voice leading within its bar.
+
+        """
+
+        chord_ids = substitution.chord_ids
+
+        voice_leading = 0 if previous_chord_id is None else self._voice_leading(previous_chord_id, chord_ids[0])
+
+        for chord_id_a, chord_id_b in zip(chord_ids, chord_ids[1:]):
+
+            voice_leading += self._voice_leading(chord_id_a, chord_id_b)
+
+        return substitution.weight - self.voice_leading_weight * voice_leading
+
+    def search(self,
+               chords: Sequence[Union[Chord, int]],
+               key: Optional[Key] = None,
+               k: int = 5
+               ) -> List[Reharmonisation]:
+
+        """
+        Searches the reharmonisations of a progression with beam search.
+
+        Args:
+
+            chords (Sequence[Union[Chord, int]]): The source progression, as chords or chord IDs.
+            key (Optional[Key]): The key of the progression; defaults to the key estimated from its chords (see key_finding.find_keys).
+            k (int): The number of reharmonisations returned; defaults to 5.
+
+        Returns:
+
+            List[Reharmonisation]: The k distinct reharmonisations with the highest scores, best first; the source progression is included if it scores among them.
+
+        """
+
+        chord_ids = [chord if isinstance(chord, int) else chord.snapshot() for chord in chords]
+
+        if key is None:
+
+            key = find_keys([[chord_from_id(chord_id) for chord_id in chord_ids]])[0] or Key(0, "major")
+
+        # Stores each partial progression as (score, chord IDs, rules); partial progressions with the same chord IDs keep the higher score.
+        beam: List[Tuple[float, Tuple[int, ...], Tuple[Optional[str], ...]]] = [(0.0, (), ())]
+
+        for source_chord_id in chord_ids:
+
+            substitutions = self.substitutions(source_chord_id, key)
+
+            candidates: Dict[Tuple[int, ...], Tuple[float, Tuple[int, ...], Tuple[Optional[str], ...]]] = {}
+
+            for score, progression, rules in beam:
+
+                previous_chord_id = progression[-1] if progression else None
+
+                for substitution in substitutions:
+
+                    candidate = (score + self._score(substitution, previous_chord_id), progression + substitution.chord_ids, rules + (substitution.rule,))
+
+                    previous = candidates.get(candidate[1])
+
+                    if previous is None or candidate[0] > previous[0]:
+
+                        candidates[candidate[1]] = candidate
+
+            beam = heapq.nlargest(max(self.beam_width, k), candidates.values(), key=lambda candidate: candidate[0])
+
+        return [Reharmonisation(score, progression, rules) for score, progression, rules in beam[:k]]
+
+
+
+@lru_cache(maxsize=None)
+def get_reharmoniser() -> Reharmoniser:
+
+    """
+    Returns the shared reharmoniser with every substitution rule, constructed on first use, so that its memoised substitutions are kept between searches.
+
+    """
+
+    return Reharmoniser()
+
+def reharmonise(chords: Sequence[Union[Chord, int]],
+                key: Optional[Key] = None,
+                k: int = 5
+                ) -> List[Reharmonisation]:
+
+    """
+    Searches the reharmonisations of a progression with the shared reharmoniser (see Reharmoniser.search).
+
+    """
+
+    return get_reharmoniser().search(chords, key, k)
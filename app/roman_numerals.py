@@ -0,0 +1,397 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.chord import Chord
+from app.key_finding import Key
+from app.library.intervals import IntervalRow, load_intervals_table
+from app.spelling import note_index
+from app.utils import pitch_class_mask, quality_mask, rotate_mask
+from config.config import CHROMATIC_LEN
+
+if TYPE_CHECKING:
+
+    from app.chord_array import ChordArray
+
+# Defines the index positions of the notes of each mode, relative to the tonic.
+MODE_SCALES: Dict[str, Tuple[int, ...]] = {
+
+    "major": (0, 2, 4, 5, 7, 9, 11),
+    "minor": (0, 2, 3, 5, 7, 8, 10)
+
+}
+
+# Stores the roman numerals, whose letters are separated from any accidental prefix when a label is formatted.
+_ROMAN_NUMERALS: Tuple[str, ...] = ("I", "II", "III", "IV", "V", "VI", "VII")
+
+def _build_degree_numerals(rows: Iterable[IntervalRow]) -> Dict[int, str]:
+
+    """
+    Builds the upper-case roman numeral of the scale degree for each interval distance from the intervals table.
+
+    Where several rows share an interval distance, the row without an augmented (+) or diminished (°) marking is preferred (e.g., "vi" rather than "V+" for 8 semitones).
+
+    Args:
+
+        rows (Iterable[IntervalRow]): The rows of the intervals table.
+
+    Returns:
+
+        Dict[int, str]: The roman numeral for each interval distance (e.g., {0: "I", 1: "II", ...}).
+
+    """
+
+    degree_numerals = {}
+
+    for row in rows:
+
+        numeral = row.numerical_symbol.rstrip("+°").upper()
+
+        is_altered = row.numerical_symbol != row.numerical_symbol.rstrip("+°")
+
+        if row.interval_distance not in degree_numerals or (not is_altered and degree_numerals[row.interval_distance][1]):
+
+            degree_numerals[row.interval_distance] = (numeral, is_altered)
+
+    return {interval_distance: numeral for interval_distance, (numeral, _) in degree_numerals.items()}
+
+def _describe_quality(quality_mask: int) -> Tuple[bool, str]:
+
+    """
+    Describes the quality of a chord from its pitch class mask relative to the root note.
+
+    Args:
+
+        quality_mask (int): The 12-bit pitch class mask of the chord, with bit 0 as the root note.
+
+    Returns:
+
+        Tuple[bool, str]: Whether the numeral is upper case (major, augmented or suspended), and the quality suffix (e.g., "7", "ø7", "maj9").
+
+    """
+
+    def has(interval: int) -> bool:
+
+        return bool(quality_mask >> interval & 1)
+
+    minor_third, major_third = has(3), has(4)
+
+    diminished_fifth, augmented_fifth = has(6) and not has(7), has(8) and not has(7)
+
+    if minor_third and not major_third:
+
+        upper_case, triad_suffix = False, "°" if diminished_fifth else ""
+
+    elif major_third:
+
+        upper_case, triad_suffix = True, "+" if augmented_fifth else ""
+
+    else:
+
+        upper_case, triad_suffix = True, "sus4" if has(5) else "sus2" if has(2) else ""
+
+    minor_seventh, major_seventh = has(10), has(11)
+
+    diminished_seventh = has(9) and triad_suffix == "°" and not (minor_seventh or major_seventh)
+
+    if not (minor_seventh or major_seventh or diminished_seventh):
+
+        return upper_case, triad_suffix
+
+    # Names the highest extension above the seventh, if any.
+    extension = "13" if has(9) and not diminished_seventh else "11" if has(5) and (minor_third or major_third) else "9" if has(1) or has(2) else "7"
+
+    if diminished_seventh:
+
+        return upper_case, "°7"
+
+    if triad_suffix == "°":
+
+        return upper_case, f"ø{extension}"
+
+    if major_seventh:
+
+        return upper_case, f"{triad_suffix}maj{extension}"
+
+    return upper_case, f"{triad_suffix}{extension}"
+
+class RomanNumeralAnalyzer:
+
+    """
+    A class to label chords with roman numerals relative to a key (e.g., "ii7", "V7/V", "bVII").
+
+    The intervals table is loaded once into memory, and labels are memoised in a lookup keyed by (mode, root offset, quality mask), so each chord costs a single dictionary lookup once its shape has been seen.
+
+    Attributes:
+
+        degree_numerals (Dict[int, str]): The upper-case roman numeral for each interval distance, from the intervals table.
+        numerals (Dict[str, Tuple[str, ...]]): The roman numeral with its accidental for each root offset, for each mode (e.g., "bVII").
+
+    """
+
+    def __init__(self,
+                 rows: Optional[Sequence[IntervalRow]] = None
+                 ):
+
+        self.degree_numerals: Dict[int, str] = _build_degree_numerals(load_intervals_table() if rows is None else rows)
+
+        self.numerals: Dict[str, Tuple[str, ...]] = {mode: tuple(self._numeral_for_offset(mode, offset) for offset in range(CHROMATIC_LEN)) for mode in MODE_SCALES}
+
+        # Stores the pitch class mask of each mode, relative to the tonic.
+        self._scale_masks: Dict[str, int] = {mode: pitch_class_mask(scale) for mode, scale in MODE_SCALES.items()}
+
+        # Stores the memoised labels, keyed by (mode, root offset, quality mask).
+        self._labels: Dict[Tuple[str, int, int], str] = {}
+
+    def _numeral_for_offset(self,
+                            mode: str,
+                            offset: int
+                            ) -> str:
+
+        """
+        Returns the roman numeral for a root offset from the tonic, with a flat or sharp where the offset is outside the mode's scale.
+
+        """
+
+        scale = MODE_SCALES[mode]
+
+        numeral = self.degree_numerals[offset]
+
+        if offset in scale:
+
+            return numeral
+
+        if (offset + 1) % CHROMATIC_LEN in scale and self.degree_numerals[(offset + 1) % CHROMATIC_LEN] == numeral:
+
+            return f"b{numeral}"
+
+        if (offset - 1) % CHROMATIC_LEN in scale and self.degree_numerals[(offset - 1) % CHROMATIC_LEN] == numeral:
+
+            return f"#{numeral}"
+
+        return f"b{self.degree_numerals[(offset + 1) % CHROMATIC_LEN]}"
+
+    def _diatonic_triad_mask(self,
+                             mode: str,
+                             offset: int
+                             ) -> int:
+
+        """
+        Returns the quality mask of the diatonic triad built on a scale degree of the mode.
+
+        """
+
+        scale = MODE_SCALES[mode]
+
+        degree = scale.index(offset)
+
+        return pitch_class_mask((scale[(degree + step) % len(scale)] - offset) % CHROMATIC_LEN for step in (0, 2, 4))
+
+    def _format(self,
+                numeral: str,
+                upper_case: bool,
+                suffix: str
+                ) -> str:
+
+        """
+        Formats a numeral with its case and quality suffix, keeping any accidental prefix unchanged.
+
+        """
+
+        accidental = numeral.rstrip("".join(_ROMAN_NUMERALS))
+
+        numeral = numeral[len(accidental):]
+
+        return f"{accidental}{numeral if upper_case else numeral.lower()}{suffix}"
+
+    def label_shape(self,
+                    mode: str,
+                    offset: int,
+                    quality_mask: int
+                    ) -> str:
+
+        """
+        Returns the label for a chord shape, calculating and memoising it on first use.
+
+        Args:
+
+            mode (str): The mode of the key, either "major" or "minor".
+            offset (int): The root offset of the chord from the tonic, in semitones.
+            quality_mask (int): The 12-bit pitch class mask of the chord, with bit 0 as the root note.
+
+        Returns:
+
+            str: The roman numeral label (e.g., "V7/V").
+
+        """
+
+        lookup_key = (mode, offset % CHROMATIC_LEN, quality_mask)
+
+        label = self._labels.get(lookup_key)
+
+        if label is None:
+
+            label = self._labels[lookup_key] = self._calculate_label(*lookup_key)
+
+        return label
+
+    def _calculate_label(self,
+                         mode: str,
+                         offset: int,
+                         quality_mask: int
+                         ) -> str:
+
+        upper_case, suffix = _describe_quality(quality_mask)
+
+        scale_mask = self._scale_masks[mode]
+
+        is_diatonic = rotate_mask(quality_mask, offset) & ~scale_mask == 0
+
+        # Labels a non-diatonic major triad or dominant seventh as a secondary dominant of the diatonic degree a perfect fifth below, other than the tonic.
+        is_dominant = upper_case and suffix in ("", "7", "9", "11", "13") and quality_mask >> 4 & 1 == 1
+
+        target = (offset - 7) % CHROMATIC_LEN
+
+        if not is_diatonic and is_dominant and target != 0 and target in MODE_SCALES[mode]:
+
+            target_upper_case, target_suffix = _describe_quality(self._diatonic_triad_mask(mode, target))
+
+            if target_suffix != "°":
+
+                return f"{self._format('V', True, suffix)}/{self._format(self.numerals[mode][target], target_upper_case, '')}"
+
+        return self._format(self.numerals[mode][offset], upper_case, suffix)
+
+    def precompute(self,
+                   quality_masks: Iterable[int]
+                   ) -> None:
+
+        """
+        Fills the lookup for every mode and root offset of the given quality masks (e.g., every shape in a catalog), ahead of analysis.
+
+        """
+
+        for quality_mask in set(quality_masks):
+
+            for mode in MODE_SCALES:
+
+                for offset in range(CHROMATIC_LEN):
+
+                    self.label_shape(mode, offset, quality_mask)
+
+    def label(self,
+              chord: Chord,
+              key: Key
+              ) -> Optional[str]:
+
+        """
+        Labels a chord relative to a key.
+
+        The root note and the quality are read from the spelled root note and the interval types' semitones, rather than from the tuning's steps,
+        so that a chord is labelled the same in every tuning.
+
+        Args:
+
+            chord (Chord): The chord to label.
+            key (Key): The key of the progression.
+
+        Returns:
+
+            Optional[str]: The roman numeral label, or None if the chord has no root note.
+
+        """
+
+        if chord.root_type is None:
+
+            return None
+
+        return self.label_shape(key.mode, note_index(chord.root_type.value) - key.tonic_index, quality_mask(chord))
+
+    def analyze(self,
+                progression: Iterable[Chord],
+                key: Key
+                ) -> List[Optional[str]]:
+
+        """
+        Labels every chord in a progression relative to a key.
+
+        """
+
+        return [self.label(chord, key) for chord in progression]
+
+    def analyze_batch(self,
+                      progressions: Sequence[Iterable[Chord]],
+                      keys: Sequence[Key]
+                      ) -> List[List[Optional[str]]]:
+
+        """
+        Labels many progressions, each relative to its own key.
+
+        """
+
+        if len(progressions) != len(keys):
+
+            raise ValueError(f"Invalid keys: {len(keys)} keys provided for {len(progressions)} progressions.")
+
+        return [self.analyze(progression, key) for progression, key in zip(progressions, keys)]
+
+    def analyze_array(self,
+                      chord_array: "ChordArray",
+                      key: Key
+                      ) -> List[Optional[str]]:
+
+        """
+        Labels every chord in a ChordArray relative to a key, calculating each distinct (root offset, quality mask) pair once.
+
+        Args:
+
+            chord_array (ChordArray): The chords to label.
+            key (Key): The key of the chords.
+
+        Returns:
+
+            List[Optional[str]]: The roman numeral label of each chord, or None where a chord has no root note.
+
+        """
+
+        # Imports NumPy on first use, as it is only required for ChordArray analysis.
+        import numpy as np
+
+        root_index = chord_array.root_index.astype(np.int64)
+
+        masks = chord_array.pitch_class_masks().astype(np.int64)
+
+        # Rotates each absolute pitch class mask so that bit 0 is the root note.
+        shift = np.where(root_index < 0, 0, root_index)
+
+        quality_masks = ((masks >> shift) | (masks << (CHROMATIC_LEN - shift))) & ((1 << CHROMATIC_LEN) - 1)
+
+        offsets = (root_index - key.tonic_index) % CHROMATIC_LEN
+
+        shapes, inverse = np.unique(offsets * (1 << CHROMATIC_LEN) + quality_masks, return_inverse=True)
+
+        labels = [self.label_shape(key.mode, int(shape) >> CHROMATIC_LEN, int(shape) & ((1 << CHROMATIC_LEN) - 1)) for shape in shapes]
+
+        return [None if root < 0 else labels[shape_index] for root, shape_index in zip(root_index.tolist(), inverse.reshape(-1).tolist())]
+
+
+
+@lru_cache(maxsize=None)
+def get_analyzer() -> RomanNumeralAnalyzer:
+
+    """
+    Returns the shared analyzer, constructed on first use.
+
+    """
+
+    return RomanNumeralAnalyzer()
+
+def analyze_progression(progression: Iterable[Chord],
+                        key: Key
+                        ) -> List[Optional[str]]:
+
+    """
+    Labels every chord in a progression relative to a key, using the shared analyzer.
+
+    """
+
+    return get_analyzer().analyze(progression, key)
@@ -0,0 +1,302 @@
+import numpy as np
+
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from app.chord_array import ChordArray
+from app.consonance import get_model, interval_vectors
+from app.inversions import inversion_masks
+from app.library.codes import CHORD_ID_COUNT, ROOT_INDICES, SLOT_RADICES, SLOT_SIZES
+from app.similarity import nearest_distances
+from config.config import INTERVAL_SLOT_NAMES
+
+# Defines the alignment of each table in the shared memory block, in bytes, so that every view starts on a cache line.
+TABLE_ALIGNMENT: int = 64
+
+class TableSpec(NamedTuple):
+
+    """
+    The location of one table in a shared memory block.
+
+    Attributes:
+
+        name (str): The name of the table (e.g., "pitch_class_masks").
+        dtype (str): The NumPy dtype string of the table (e.g., "<u2").
+        shape (Tuple[int, ...]): The shape of the table.
+        offset (int): The position of the table's first byte in the block.
+
+    """
+
+    name: str
+    dtype: str
+    shape: Tuple[int, ...]
+    offset: int
+
+class SharedTablesHandle(NamedTuple):
+
+    """
+    A small, picklable description of a published block, passed to worker processes so that they can attach to it (e.g., as a Pool initializer argument).
+
+    Attributes:
+
+        name (str): The name of the shared memory block.
+        layout (Tuple[TableSpec, ...]): The location of each table in the block.
+
+    """
+
+    name: str
+    layout: Tuple[TableSpec, ...]
+
+def _chord_id_tables() -> Dict[str, np.ndarray]:
+
+    """
+    Builds the columns of every chord ID at once, by unpacking the mixed-radix codes with vectorised operations rather than constructing a Chord for each ID.
+
+    """
+
+    chord_ids = np.arange(CHORD_ID_COUNT, dtype=np.int64)
+
+    codes = (chord_ids[:, None] // np.array(SLOT_RADICES)[None, :] % np.array(SLOT_SIZES)[None, :]).astype(np.uint8)
+
+    chords = ChordArray(np.array(ROOT_INDICES, dtype=np.int8)[codes[:, 0]], {interval_name: codes[:, slot_index] for slot_index, interval_name in enumerate(INTERVAL_SLOT_NAMES)})
+
+    return {
+
+        "codes": codes,
+        "interval_signatures": chords.interval_signatures(),
+        "note_indices": chords.note_signatures(),
+        "pitch_class_masks": chords.pitch_class_masks(),
+
+    }
+
+def build_tables() -> Dict[str, np.ndarray]:
+
+    """
+    Builds the precomputed chord and interval tables in the current process.
+
+    Returns:
+
+        Dict[str, np.ndarray]: A dictionary mapping each table name to its array:
+
+            codes: The interval type code of each slot, indexed by chord ID, as a (CHORD_ID_COUNT, 10) uint8 array (see app/library/codes.py).
+            interval_signatures: The interval of each slot in semitones, indexed by chord ID, as a (CHORD_ID_COUNT, 10) int8 array; -1 where the interval type has not been set.
+            note_indices: The note of each slot as an index position in the chromatic scale, indexed by chord ID, as a (CHORD_ID_COUNT, 10) int8 array; -1 where there is no note.
+            pitch_class_masks: The 12-bit pitch class mask, indexed by chord ID, as a (CHORD_ID_COUNT,) uint16 array.
+            nearest_distances: The distance from each pitch class to the nearest note, indexed by mask and pitch class, as a (4096, 12) int8 array (see similarity.nearest_distances()).
+            interval_vectors: The interval class vector, indexed by mask, as a (4096, 6) uint8 array (see consonance.interval_vectors()).
+            tension: The tension, indexed by mask, as a (4096,) float64 array (see ConsonanceModel).
+            inversion_masks: The mask of each inversion, indexed by mask and bass note, as a (4096, 12) uint16 array (see inversions.inversion_masks()).
+
+    """
+
+    return {
+
+        **_chord_id_tables(),
+        "nearest_distances": nearest_distances().astype(np.int8),
+        "interval_vectors": interval_vectors().astype(np.uint8),
+        "tension": get_model().tension_table.copy(),
+        "inversion_masks": inversion_masks(),
+
+    }
+
+def _layout(tables: Dict[str, np.ndarray]) -> Tuple[Tuple[TableSpec, ...], int]:
+
+    """
+    Places the tables one after another in a block, each aligned to TABLE_ALIGNMENT bytes, and returns their locations and the size of the block.
+
+    """
+
+    layout, offset = [], 0
+
+    for name, table in tables.items():
+
+        layout.append(TableSpec(name, table.dtype.str, table.shape, offset))
+
+        offset += -(-table.nbytes // TABLE_ALIGNMENT) * TABLE_ALIGNMENT
+
+    return tuple(layout), max(offset, 1)
+
+class SharedTables:
+
+    """
+    A class to publish the precomputed tables into a single shared memory block once, and to attach to them from other processes as read-only NumPy views.
+
+    Attaching maps the block without copying it, so it takes microseconds and every process shares the same physical pages.
+    The publishing process owns the block and must unlink it when the workers are done (e.g., by using it as a context manager); the workers only close it.
+    Workers should be child processes of the publisher (e.g., a multiprocessing Pool), as they share its resource tracker, which would otherwise unlink the block when an attached process exits.
+
+    Attributes:
+
+        handle (SharedTablesHandle): The name and layout of the block, to pass to worker processes.
+        tables (Dict[str, np.ndarray]): A dictionary mapping each table name to its read-only view of the block.
+        owner (bool): Whether this process published the block.
+
+    """
+
+    def __init__(self,
+                 shared_memory: SharedMemory,
+                 layout: Tuple[TableSpec, ...],
+                 owner: bool
+                 ):
+
+        self._shared_memory: Optional[SharedMemory] = shared_memory
+
+        self.handle: SharedTablesHandle = SharedTablesHandle(shared_memory.name, layout)
+
+        self.owner: bool = owner
+
+        self.tables: Dict[str, np.ndarray] = {}
+
+        for spec in layout:
+
+            view = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=shared_memory.buf, offset=spec.offset)
+
+            view.flags.writeable = False
+
+            self.tables[spec.name] = view
+
+    @classmethod
+    def publish(cls,
+                tables: Optional[Dict[str, np.ndarray]] = None,
+                name: Optional[str] = None
+                ) -> "SharedTables":
+
+        """
+        Copies the tables into a new shared memory block.
+
+        Args:
+
+            tables (Optional[Dict[str, np.ndarray]]): The tables to publish; defaults to build_tables().
+            name (Optional[str]): The name of the block; defaults to a unique name chosen by the operating system.
+
+        """
+
+        tables = build_tables() if tables is None else tables
+
+        layout, size = _layout(tables)
+
+        shared_memory = SharedMemory(name=name, create=True, size=size)
+
+        for spec in layout:
+
+            np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=shared_memory.buf, offset=spec.offset)[...] = tables[spec.name]
+
+        return cls(shared_memory, layout, owner=True)
+
+    @classmethod
+    def attach(cls,
+               handle: SharedTablesHandle
+               ) -> "SharedTables":
+
+        """
+        Attaches to a published block, without copying or building any table.
+
+        Args:
+
+            handle (SharedTablesHandle): The handle of the published block.
+
+        """
+
+        try:
+
+            shared_memory = SharedMemory(name=handle.name)
+
+        except FileNotFoundError:
+
+            raise ValueError(f"Invalid handle: no shared memory block named {handle.name!r} has been published.") from None
+
+        return cls(shared_memory, handle.layout, owner=False)
+
+    def __getitem__(self,
+                    name: str
+                    ) -> np.ndarray:
+
+        return self.tables[name]
+
+    def __enter__(self) -> "SharedTables":
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+
+        """
+        The size of the shared memory block, in bytes; 0 once the block has been closed.
+
+        """
+
+        return 0 if self._shared_memory is None else self._shared_memory.size
+
+    def close(self) -> None:
+
+        """
+        Releases the views and detaches from the block, and unlinks the block if this process published it; closing twice has no effect.
+
+        """
+
+        if self._shared_memory is None:
+
+            return
+
+        # Drops the views first, as the block cannot be closed while they export its buffer.
+        self.tables = {}
+
+        self._shared_memory.close()
+
+        if self.owner:
+
+            self._shared_memory.unlink()
+
+        self._shared_memory = None
+
+# Stores the tables attached by the current process; set by attach_worker().
+_attached_tables: Optional[SharedTables] = None
+
+def attach_worker(handle: SharedTablesHandle) -> None:
+
+    """
+    Attaches the current process to a published block, so that get_tables() returns its views; intended as a Pool initializer.
+
+    Args:
+
+        handle (SharedTablesHandle): The handle of the published block.
+
+    """
+
+    global _attached_tables
+
+    if _attached_tables is not None:
+
+        _attached_tables.close()
+
+    _attached_tables = SharedTables.attach(handle)
+
+@lru_cache(maxsize=None)
+def _local_tables() -> Dict[str, np.ndarray]:
+
+    """
+    Builds the tables once in the current process, marked read-only like the shared views.
+
+    """
+
+    tables = build_tables()
+
+    for table in tables.values():
+
+        table.flags.writeable = False
+
+    return tables
+
+def get_tables() -> Dict[str, np.ndarray]:
+
+    """
+    Returns the tables attached by attach_worker(), or tables built in the current process if it has not attached to a block.
+
+    """
+
+    return _local_tables() if _attached_tables is None else _attached_tables.tables
@@ -0,0 +1,276 @@
+import numpy as np
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from app.chord import Chord
+from app.consonance import MASK_COUNT, interval_vectors
+from app.library.codes import SLOT_CODES, ROOT_TYPES_BY_INDEX, decode_interval_types
+from app.utils import enumerate_shapes, mask_bits, pitch_classes, pitch_class_mask, rotate_masks, shape_cost
+from config.config import CHROMATIC_LEN
+
+# Defines the metrics that the index can rank neighbours by.
+METRICS: Tuple[str, ...] = ("voice_leading", "common_tones", "interval_vector")
+
+@lru_cache(maxsize=None)
+def nearest_distances() -> np.ndarray:
+
+    """
+    Calculates the distance in semitones from each pitch class to the nearest note of every pitch class mask.
+
+    Returns:
+
+        np.ndarray: A (4096, 12) array, indexed by mask and pitch class; 12 for the empty mask.
+
+    """
+
+    pitch_class_distances = np.abs(np.arange(CHROMATIC_LEN)[:, None] - np.arange(CHROMATIC_LEN)[None, :])
+    pitch_class_distances = np.minimum(pitch_class_distances, CHROMATIC_LEN - pitch_class_distances)
+
+    distances = np.where(mask_bits()[:, None, :] == 1, pitch_class_distances[None, :, :], CHROMATIC_LEN).min(axis=2)
+
+    # Marks the table read-only, as it is shared by every caller.
+    distances.flags.writeable = False
+
+    return distances
+
+class SimilarityIndex:
+
+    """
+    A class to find the chords in the catalog closest to a query chord, under a choice of metrics.
+
+    The catalog holds every pitch class set that a rooted chord can produce. As every metric is unchanged by transposition, one ranked row of neighbours is precomputed per transposition class
+    (rather than per pitch class set), and a query rotates the first k entries of its class's row, so each query costs O(k) rather than O(catalog).
+
+    Metrics:
+
+        voice_leading: The sum of the distances in semitones from each note of either chord to the nearest note of the other; smaller is closer.
+        common_tones: The number of notes shared by both chords; larger is closer, with ties ranked by the number of notes not shared.
+        interval_vector: The L1 distance between the interval class vectors of both chords; smaller is closer.
+
+    Attributes:
+
+        catalog_masks (np.ndarray): The pitch class mask of every pitch class set in the catalog, in ascending order.
+        class_masks (np.ndarray): The pitch class mask of the representative (the smallest rotation) of each transposition class in the catalog.
+
+    """
+
+    def __init__(self):
+
+        shapes = enumerate_shapes()
+
+        # Stores the root note and the interval type codes of the simplest chord producing each absolute pitch class mask, preferring the lowest root note on ties; -1 where no chord produces it.
+        self._root_indices: np.ndarray = np.full(MASK_COUNT, -1, dtype=np.int8)
+        self._shape_codes: Dict[int, Tuple[int, ...]] = {}
+
+        for quality_mask, codes in shapes.items():
+
+            for root_index in range(CHROMATIC_LEN):
+
+                mask = int(rotate_masks(quality_mask, root_index))
+
+                previous_codes = self._shape_codes.get(mask)
+
+                if previous_codes is None or shape_cost(codes) < shape_cost(previous_codes):
+
+                    self._root_indices[mask] = root_index
+                    self._shape_codes[mask] = codes
+
+        self.catalog_masks: np.ndarray = np.flatnonzero(self._root_indices >= 0)
+
+        # Stores the smallest rotation of every mask, and the rotation from it to the mask.
+        rotations = rotate_masks(np.arange(MASK_COUNT)[:, None], np.arange(CHROMATIC_LEN)[None, :])
+
+        self._canonical_masks: np.ndarray = rotations.min(axis=1)
+        self._rotations: np.ndarray = (CHROMATIC_LEN - rotations.argmin(axis=1)) % CHROMATIC_LEN
+
+        self.class_masks: np.ndarray = np.unique(self._canonical_masks[self.catalog_masks])
+
+        # Maps each representative mask to its row in the ranked neighbours.
+        self._class_rows: np.ndarray = np.full(MASK_COUNT, -1, dtype=np.int64)
+        self._class_rows[self.class_masks] = np.arange(len(self.class_masks))
+
+        # Stores the ranked neighbours and their scores for each metric, once they have been calculated.
+        self._rankings: Dict[str, np.ndarray] = {}
+        self._scores: Dict[str, np.ndarray] = {}
+
+    def _score_matrix(self,
+                      metric: str
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+
+        """
+        Scores every representative against every pitch class set in the catalog with matrix operations.
+
+        Returns:
+
+            Tuple[np.ndarray, np.ndarray]: The score of each pair, and the sort key of each pair (smaller is closer), both of shape (classes, catalog).
+
+        """
+
+        bits = mask_bits()
+
+        class_bits, catalog_bits = bits[self.class_masks], bits[self.catalog_masks]
+
+        if metric == "voice_leading":
+
+            distances_to_masks = nearest_distances().T
+
+            scores = class_bits @ distances_to_masks[:, self.catalog_masks] + (catalog_bits @ distances_to_masks[:, self.class_masks]).T
+
+            return scores, scores
+
+        if metric == "common_tones":
+
+            common_tones = class_bits @ catalog_bits.T
+
+            differences = class_bits.sum(axis=1)[:, None] + catalog_bits.sum(axis=1)[None, :] - 2 * common_tones
+
+            return common_tones, -common_tones * (2 * CHROMATIC_LEN) + differences
+
+        vectors = interval_vectors()
+
+        scores = np.abs(vectors[self.class_masks][:, None, :] - vectors[self.catalog_masks][None, :, :]).sum(axis=2)
+
+        return scores, scores
+
+    def _ranking(self,
+                 metric: str
+                 ) -> Tuple[np.ndarray, np.ndarray]:
+
+        """
+        Returns the ranked catalog indices and the scores for every representative, calculating them on first use of the metric.
+
+        """
+
+        if metric not in METRICS:
+
+            raise ValueError(f"Invalid metric: {metric} must be one of {list(METRICS)}.")
+
+        if metric not in self._rankings:
+
+            scores, sort_keys = self._score_matrix(metric)
+
+            self._rankings[metric] = np.argsort(sort_keys, axis=1, kind="stable").astype(np.int16)
+
+            self._scores[metric] = scores.astype(np.int16)
+
+        return self._rankings[metric], self._scores[metric]
+
+    def precompute(self) -> None:
+
+        """
+        Ranks the neighbours for every metric, ahead of the first query.
+
+        """
+
+        for metric in METRICS:
+
+            self._ranking(metric)
+
+    def neighbours(self,
+                   mask: int,
+                   k: int = 5,
+                   metric: str = "voice_leading"
+                   ) -> List[Tuple[int, int]]:
+
+        """
+        Finds the k pitch class sets in the catalog closest to a pitch class set, excluding the set itself.
+
+        Args:
+
+            mask (int): The 12-bit pitch class mask of the query.
+            k (int): The number of neighbours; defaults to 5.
+            metric (str): The metric to rank by, one of METRICS; defaults to "voice_leading".
+
+        Returns:
+
+            List[Tuple[int, int]]: The pitch class mask and score of each neighbour, closest first.
+
+        """
+
+        rankings, scores = self._ranking(metric)
+
+        if not 0 < mask < MASK_COUNT:
+
+            raise ValueError(f"Invalid mask: {mask} must be a non-empty 12-bit pitch class mask.")
+
+        canonical_mask, rotation = self._canonical_masks[mask], self._rotations[mask]
+
+        row = self._class_rows[canonical_mask]
+
+        if row < 0:
+
+            raise ValueError(f"Invalid mask: {mask:012b} is not produced by any chord.")
+
+        # Takes one more entry than required, as the query itself is ranked among its neighbours.
+        catalog_indices = rankings[row, :k + 1]
+
+        neighbour_masks = rotate_masks(self.catalog_masks[catalog_indices], rotation)
+
+        return [(neighbour_mask, score) for neighbour_mask, score in zip(neighbour_masks.tolist(), scores[row, catalog_indices].tolist()) if neighbour_mask != mask][:k]
+
+    def chord_for_mask(self,
+                       mask: int
+                       ) -> Chord:
+
+        """
+        Constructs the simplest chord that produces a pitch class set (see utils.shape_cost), with its root note spelled as in CHROMATIC_SCALE.
+
+        """
+
+        root_code = SLOT_CODES[0][ROOT_TYPES_BY_INDEX[self._root_indices[mask]]]
+
+        return Chord.from_interval_types(decode_interval_types((root_code, *self._shape_codes[mask])))
+
+    def similar(self,
+                chord: Chord,
+                k: int = 5,
+                metric: str = "voice_leading"
+                ) -> List[Chord]:
+
+        """
+        Finds the k chords in the catalog closest to a chord, excluding chords with the same notes.
+
+        Args:
+
+            chord (Chord): The query chord.
+            k (int): The number of chords; defaults to 5.
+            metric (str): The metric to rank by, one of METRICS; defaults to "voice_leading".
+
+        Returns:
+
+            List[Chord]: The closest chords, closest first.
+
+        """
+
+        if chord.root_type is None:
+
+            raise ValueError("Invalid chord: the chord must have a root note.")
+
+        mask = pitch_class_mask(pitch_classes(chord.get_note_signature()))
+
+        return [self.chord_for_mask(neighbour_mask) for neighbour_mask, _ in self.neighbours(mask, k, metric)]
+
+
+
+@lru_cache(maxsize=None)
+def get_index() -> SimilarityIndex:
+
+    """
+    Returns the shared similarity index, constructed on first use.
+
+    """
+
+    return SimilarityIndex()
+
+def similar(chord: Chord,
+            k: int = 5,
+            metric: str = "voice_leading"
+            ) -> List[Chord]:
+
+    """
+    Finds the k chords in the catalog closest to a chord, using the shared similarity index.
+
+    """
+
+    return get_index().similar(chord, k, metric)
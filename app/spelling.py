@@ -0,0 +1,120 @@
+import re
+
+from typing import Dict
+
+from app.library.enums import RootType
+from config.config import INTERVAL_FIFTHS_DICT, NATURAL_NOTE_INDEX_DICT, CHROMATIC_LEN
+
+# Matches a spelled note, with any number of sharps or flats (e.g., "Bbbb" in a Cb diminished seventh chord).
+NOTE_PATTERN = re.compile(r"[A-G](?:#+|b+)?")
+
+# Defines the letter names in line of fifths order, with C at position 0 (F is -1, G is 1, D is 2, etc).
+LINE_OF_FIFTHS_LETTERS: str = "FCGDAEB"
+
+def line_of_fifths_position(note: str) -> int:
+
+    """
+    Calculates the position of a spelled note on the line of fifths (e.g., "C" -> 0, "F#" -> 6, "Bb" -> -2).
+
+    Each sharp moves the letter seven fifths up the line, and each flat moves it seven fifths down.
+
+    Args:
+
+        note (str): The spelled note (e.g., "Eb"), with any number of "#" or "b" accidentals.
+
+    Returns:
+
+        int: The position of the note on the line of fifths.
+
+    """
+
+    return LINE_OF_FIFTHS_LETTERS.index(note[0]) - 1 + 7 * (note.count("#") - note.count("b"))
+
+def note_at_position(position: int) -> str:
+
+    """
+    Spells the note at a position on the line of fifths (e.g., 4 -> "E", 9 -> "D#", -9 -> "Bbb").
+
+    Args:
+
+        position (int): The position on the line of fifths, with C at position 0.
+
+    Returns:
+
+        str: The spelled note.
+
+    """
+
+    accidentals, letter_index = divmod(position + 1, 7)
+
+    return LINE_OF_FIFTHS_LETTERS[letter_index] + ("#" * accidentals if accidentals > 0 else "b" * -accidentals)
+
+def note_index(note: str) -> int:
+
+    """
+    Calculates the index position of a spelled note in the chromatic scale (e.g., "D#" -> 3, "Cb" -> 11, "F##" -> 7).
+
+    """
+
+    return (NATURAL_NOTE_INDEX_DICT[note[0]] + note.count("#") - note.count("b")) % CHROMATIC_LEN
+
+def _build_spelling_table() -> Dict[RootType, Dict[str, str]]:
+
+    """
+    Builds the spelling of every interval name above every root spelling.
+
+    The letter name of each note is fixed by the generic size of the interval (third, fifth, seventh, etc), as a fixed number of fifths from the root on the line of fifths.
+
+    Returns:
+
+        Dict[RootType, Dict[str, str]]: A dictionary mapping each RootType to the spelled note for each interval name in INTERVAL_DICT.
+
+    """
+
+    return {root_type: {interval_name: note_at_position(line_of_fifths_position(root_type.value) + fifths) for interval_name, fifths in INTERVAL_FIFTHS_DICT.items()}
+            for root_type in RootType}
+
+# Stores the spelled note for every (root spelling, interval name) pair (e.g., SPELLING_TABLE[RootType.B]["major_third"] -> "D#").
+SPELLING_TABLE: Dict[RootType, Dict[str, str]] = _build_spelling_table()
+
+def add_interval_spellings(interval_name: str) -> None:
+
+    """
+    Adds the spelling of an interval name above every root spelling to SPELLING_TABLE, once the interval name has been added to INTERVAL_FIFTHS_DICT (see app/registry.py).
+
+    """
+
+    for root_type, spellings in SPELLING_TABLE.items():
+
+        spellings[interval_name] = note_at_position(line_of_fifths_position(root_type.value) + INTERVAL_FIFTHS_DICT[interval_name])
+
+def remove_interval_spellings(interval_name: str) -> None:
+
+    """
+    Removes the spelling of an interval name above every root spelling from SPELLING_TABLE (see app/registry.py).
+
+    """
+
+    for spellings in SPELLING_TABLE.values():
+
+        spellings.pop(interval_name, None)
+
+def spell_note(root_type: RootType,
+               interval_name: str
+               ) -> str:
+
+    """
+    Spells the note an interval above a root note (e.g., RootType.B, "major_third" -> "D#").
+
+    Args:
+
+        root_type (RootType): The root note, whose letter name fixes the letter names of the other notes.
+        interval_name (str): The name of the interval in INTERVAL_DICT (e.g., "major_third").
+
+    Returns:
+
+        str: The spelled note.
+
+    """
+
+    return SPELLING_TABLE[root_type][interval_name]
@@ -0,0 +1,210 @@
+import re
+
+from typing import Callable, Dict, Optional, Tuple
+
+from app.chord import Chord
+from app.library.codes import SLOT_TYPES
+from app.library.enums import RootType, SecondType, ThirdType, FourthType, FifthType, SixthType, SeventhType, NinthType, EleventhType, ThirteenthType
+from config.config import INTERVAL_SLOT_NAMES, DEFAULT_INTERVAL_TYPES
+
+# Matches the root note of a chord symbol, and the rest of the symbol.
+_ROOT_PATTERN = re.compile(r"([A-G](?:#|b)?)(.*)")
+
+# Matches a chord symbol with a slash bass note (e.g., "C/E", or "Ebdim7/Bbb"), and captures the chord symbol and the bass note; "6/9" is not a slash bass note.
+_SLASH_PATTERN = re.compile(r"(.+)/([A-G](?:#{1,2}|b{1,2})?)")
+
+# Defines the interval types set by each token of a chord symbol's suffix.
+# The seventh type of an extension ("7", "9", "11" and "13") is resolved when the token is applied, as it depends on any preceding "maj" or diminished token.
+_EXTENSION_NAMES: Dict[str, Tuple[str, ...]] = {
+
+    "7": ("seventh",),
+    "9": ("seventh", "ninth"),
+    "11": ("seventh", "ninth", "eleventh"),
+    "13": ("seventh", "ninth", "eleventh", "thirteenth")
+
+}
+
+_TOKEN_TYPES: Dict[str, Dict[str, object]] = {
+
+    "m": {"third": ThirdType.MINOR},
+    "min": {"third": ThirdType.MINOR},
+    "-": {"third": ThirdType.MINOR},
+    "dim": {"third": ThirdType.MINOR, "fifth": FifthType.DIMINISHED},
+    "°": {"third": ThirdType.MINOR, "fifth": FifthType.DIMINISHED},
+    "dim7": {"third": ThirdType.MINOR, "fifth": FifthType.DIMINISHED, "seventh": SeventhType.DIMINISHED},
+    "°7": {"third": ThirdType.MINOR, "fifth": FifthType.DIMINISHED, "seventh": SeventhType.DIMINISHED},
+    "ø": {"third": ThirdType.MINOR, "fifth": FifthType.DIMINISHED, "seventh": SeventhType.MINOR},
+    "ø7": {"third": ThirdType.MINOR, "fifth": FifthType.DIMINISHED, "seventh": SeventhType.MINOR},
+    "aug": {"fifth": FifthType.AUGMENTED},
+    "+": {"fifth": FifthType.AUGMENTED},
+    "sus": {"third": ThirdType.SUS4},
+    "sus2": {"third": ThirdType.SUS2},
+    "sus4": {"third": ThirdType.SUS4},
+    "6": {"sixth": SixthType.ADD6},
+    "69": {"sixth": SixthType.ADD6, "ninth": NinthType.ADD9},
+    "6/9": {"sixth": SixthType.ADD6, "ninth": NinthType.ADD9},
+    "add2": {"second": SecondType.ADD2},
+    "add4": {"fourth": FourthType.ADD4},
+    "add6": {"sixth": SixthType.ADD6},
+    "add9": {"ninth": NinthType.ADD9},
+    "add11": {"eleventh": EleventhType.ADD11},
+    "add13": {"thirteenth": ThirteenthType.ADD13},
+    "b5": {"fifth": FifthType.DIMINISHED},
+    "#5": {"fifth": FifthType.AUGMENTED},
+    "b9": {"ninth": NinthType.MINOR},
+    "#11": {"eleventh": EleventhType.AUGMENTED},
+    "b13": {"thirteenth": ThirteenthType.MINOR}
+
+}
+
+# Defines the tokens that make the seventh of the following (or attached) extension major.
+_MAJOR_TOKENS: Tuple[str, ...] = ("maj", "Maj", "M", "Δ")
+
+# Matches any single token of a chord symbol's suffix, longest tokens first; parentheses and commas around alterations are ignored.
+_TOKEN_PATTERN = re.compile("|".join(re.escape(token) for token in sorted([*_TOKEN_TYPES, *_EXTENSION_NAMES, *_MAJOR_TOKENS, "(", ")", ","], key=len, reverse=True)))
+
+# Maps the upper-case name of each interval type Enum member to the member, for each interval name (e.g., "B_FLAT" -> RootType.B_Flat).
+_SLOT_MEMBER_NAMES: Dict[str, Dict[str, object]] = {interval_name: {member_name.upper(): member for member_name, member in slot_type.__members__.items()}
+                                                     for interval_name, slot_type in zip(INTERVAL_SLOT_NAMES, SLOT_TYPES)}
+
+# Maps each root note to its RootType (e.g., "C#" -> RootType.C_SHARP).
+_ROOT_TYPES_BY_VALUE: Dict[str, RootType] = {root_type.value: root_type for root_type in RootType}
+
+def parse_symbol(symbol: str) -> Dict[str, Optional[object]]:
+
+    """
+    Parses a chord symbol into the interval types for the root note and all interval names (e.g., "Bbm7b5", "F#maj9", "C13#11", "Dsus4add9").
+
+    Extensions include the interval types below them, as in initialise_dependencies() (e.g., "C11" sets the seventh, ninth and eleventh).
+
+    Args:
+
+        symbol (str): The chord symbol.
+
+    Returns:
+
+        Dict[str, Optional[IntervalType]]: A dictionary mapping each name in INTERVAL_SLOT_NAMES to its interval type, or None.
+
+    """
+
+    # Ignores any slash bass note, as it does not change the interval types (see parse_chord).
+    slash_match = _SLASH_PATTERN.fullmatch(symbol.strip())
+
+    match = _ROOT_PATTERN.fullmatch(slash_match.group(1) if slash_match else symbol.strip())
+
+    if match is None:
+
+        raise ValueError(f"Invalid chord symbol: {symbol!r} must start with a root note (e.g., 'C', 'F#', 'Bb').")
+
+    root_note, suffix = match.groups()
+
+    interval_types: Dict[str, Optional[object]] = {interval_name: None for interval_name in INTERVAL_SLOT_NAMES}
+
+    interval_types.update(root=RootType(root_note), third=DEFAULT_INTERVAL_TYPES["third"], fifth=DEFAULT_INTERVAL_TYPES["fifth"])
+
+    position, major_seventh = 0, False
+
+    while position < len(suffix):
+
+        token_match = _TOKEN_PATTERN.match(suffix, position)
+
+        if token_match is None:
+
+            raise ValueError(f"Invalid chord symbol: {symbol!r} has an unrecognised suffix at {suffix[position:]!r}.")
+
+        token = token_match.group()
+
+        position = token_match.end()
+
+        if token in _MAJOR_TOKENS:
+
+            major_seventh = True
+
+            # Reads a bare "Δ" or "maj" as a major seventh chord.
+            if position == len(suffix) or not suffix[position].isdigit():
+
+                interval_types["seventh"] = SeventhType.MAJOR
+
+        elif token in _EXTENSION_NAMES:
+
+            for interval_name in _EXTENSION_NAMES[token]:
+
+                if interval_types[interval_name] is None or interval_name == "seventh" and major_seventh:
+
+                    interval_types[interval_name] = SeventhType.MAJOR if interval_name == "seventh" and major_seventh else DEFAULT_INTERVAL_TYPES[interval_name]
+
+            major_seventh = False
+
+        elif token in _TOKEN_TYPES:
+
+            interval_types.update(_TOKEN_TYPES[token])
+
+    return interval_types
+
+def parse_spec(spec: str) -> Dict[str, Optional[object]]:
+
+    """
+    Parses a chord spec of whitespace-separated name=value pairs into the interval types for the root note and all interval names (e.g., "root=F# third=MINOR seventh=MINOR").
+
+    Unlisted interval names keep the default chord's interval types (a "C" root note, a major third and a perfect fifth); "none" removes an interval type.
+
+    Args:
+
+        spec (str): The chord spec; each name is in INTERVAL_SLOT_NAMES, and each value is the name of an interval type Enum member (e.g., "MINOR", "C_SHARP") or a root note (e.g., "C#").
+
+    Returns:
+
+        Dict[str, Optional[IntervalType]]: A dictionary mapping each name in INTERVAL_SLOT_NAMES to its interval type, or None.
+
+    """
+
+    interval_types: Dict[str, Optional[object]] = {interval_name: None for interval_name in INTERVAL_SLOT_NAMES}
+
+    interval_types.update(root=DEFAULT_INTERVAL_TYPES["root"], third=DEFAULT_INTERVAL_TYPES["third"], fifth=DEFAULT_INTERVAL_TYPES["fifth"])
+
+    for pair in spec.split():
+
+        interval_name, _, value = pair.partition("=")
+
+        if interval_name not in interval_types:
+
+            raise ValueError(f"Invalid interval name: {interval_name!r} must be one of {INTERVAL_SLOT_NAMES}.")
+
+        member_names = _SLOT_MEMBER_NAMES[interval_name]
+
+        if value.lower() == "none":
+
+            interval_types[interval_name] = None
+
+        elif value.upper() in member_names:
+
+            interval_types[interval_name] = member_names[value.upper()]
+
+        elif interval_name == "root" and value in _ROOT_TYPES_BY_VALUE:
+
+            interval_types[interval_name] = _ROOT_TYPES_BY_VALUE[value]
+
+        else:
+
+            raise ValueError(f"Invalid interval_type: {value!r} is not a member of {SLOT_TYPES[INTERVAL_SLOT_NAMES.index(interval_name)].__name__}.")
+
+    return interval_types
+
+def parse_chord(line: str) -> Chord:
+
+    """
+    Constructs a chord from a chord spec (see parse_spec), if the line contains "=", or otherwise from a chord symbol (see parse_symbol), with any slash bass note (e.g., "C/E").
+
+    """
+
+    parse: Callable[[str], Dict[str, Optional[object]]] = parse_spec if "=" in line else parse_symbol
+
+    chord = Chord.from_interval_types(parse(line))
+
+    slash_match = None if "=" in line else _SLASH_PATTERN.fullmatch(line.strip())
+
+    if slash_match:
+
+        chord.set_bass(slash_match.group(2))
+
+    return chord
@@ -0,0 +1,180 @@
+import numpy as np
+
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+
+from app.chord import Chord
+from app.chord_array import ChordArray
+from app.progression import Progression
+from app.similarity import nearest_distances
+from app.utils import mask_bits, pitch_classes, pitch_class_mask
+from config.config import CHROMATIC_LEN
+
+# Defines the chord collections that can be compared.
+Chords = Union[Sequence[Chord], ChordArray, Progression]
+
+# Stores the bits of every pitch class mask, and the number of notes in every pitch class mask.
+_BITS: np.ndarray = mask_bits().astype(np.int16)
+_POPCOUNTS: np.ndarray = _BITS.sum(axis=1).astype(np.uint8)
+
+class ChordDiffs(NamedTuple):
+
+    """
+    The differences between pairs of chords, as arrays of the same shape: one entry per pair, or one row per chord of the first collection in all-pairs mode.
+
+    Attributes:
+
+        common (np.ndarray): The pitch class mask of the notes in both chords, as uint16.
+        added (np.ndarray): The pitch class mask of the notes only in the second chord, as uint16.
+        removed (np.ndarray): The pitch class mask of the notes only in the first chord, as uint16.
+        common_tones (np.ndarray): The number of notes in both chords.
+        root_motion (np.ndarray): The shortest motion of the root note in semitones, from -5 to 6; 0 where either chord has no root note.
+        voice_leading (np.ndarray): The sum of the distances in semitones from each note to the nearest note of the other chord, in both directions.
+
+    """
+
+    common: np.ndarray
+    added: np.ndarray
+    removed: np.ndarray
+    common_tones: np.ndarray
+    root_motion: np.ndarray
+    voice_leading: np.ndarray
+
+def chord_masks(chords: Chords) -> Tuple[np.ndarray, np.ndarray]:
+
+    """
+    Returns the pitch class mask and the root note index of every chord.
+
+    Args:
+
+        chords (Chords): The chords, as Chord objects, a ChordArray or a Progression.
+
+    Returns:
+
+        Tuple[np.ndarray, np.ndarray]: The 12-bit pitch class mask of each chord, as uint16, and the index position of each root note in the chromatic scale, as int8; -1 where the root note has been removed.
+
+    """
+
+    if isinstance(chords, Progression):
+
+        chords = chords.to_chord_array()
+
+    if isinstance(chords, ChordArray):
+
+        return chords.pitch_class_masks(), chords.root_index
+
+    masks = np.fromiter((pitch_class_mask(pitch_classes(chord.get_note_signature())) for chord in chords), dtype=np.uint16, count=len(chords))
+
+    root_indices = np.fromiter((-1 if chord.root_type is None else chord.root_type.index for chord in chords), dtype=np.int8, count=len(chords))
+
+    return masks, root_indices
+
+def diff_masks(masks_a: np.ndarray,
+               root_indices_a: np.ndarray,
+               masks_b: np.ndarray,
+               root_indices_b: np.ndarray
+               ) -> ChordDiffs:
+
+    """
+    Compares pitch class masks element-wise with bitwise operations, broadcasting as NumPy does.
+
+    Args:
+
+        masks_a (np.ndarray): The pitch class masks of the first chords.
+        root_indices_a (np.ndarray): The root note indices of the first chords; -1 where there is no root note.
+        masks_b (np.ndarray): The pitch class masks of the second chords.
+        root_indices_b (np.ndarray): The root note indices of the second chords; -1 where there is no root note.
+
+    Returns:
+
+        ChordDiffs: The differences between each pair of chords.
+
+    """
+
+    masks_a, masks_b = np.asarray(masks_a, dtype=np.uint16), np.asarray(masks_b, dtype=np.uint16)
+
+    # Calculates the voice leading from the distances of each note to the nearest note of the other chord, as in the similarity index.
+    bits, distances = _BITS, nearest_distances()
+
+    voice_leading = (bits[masks_a] * distances[masks_b]).sum(axis=-1) + (bits[masks_b] * distances[masks_a]).sum(axis=-1)
+
+    return _diffs(masks_a, root_indices_a, masks_b, root_indices_b, voice_leading)
+
+def _diffs(masks_a: np.ndarray,
+           root_indices_a: np.ndarray,
+           masks_b: np.ndarray,
+           root_indices_b: np.ndarray,
+           voice_leading: np.ndarray
+           ) -> ChordDiffs:
+
+    """
+    Compares pitch class masks element-wise with bitwise operations, once the voice leading of each pair has been calculated.
+
+    """
+
+    common = masks_a & masks_b
+
+    root_indices_a, root_indices_b = np.asarray(root_indices_a, dtype=np.int16), np.asarray(root_indices_b, dtype=np.int16)
+
+    root_motion = (root_indices_b - root_indices_a + 5) % CHROMATIC_LEN - 5
+
+    return ChordDiffs(common=common,
+                      added=masks_b & ~masks_a,
+                      removed=masks_a & ~masks_b,
+                      common_tones=_POPCOUNTS[common],
+                      root_motion=np.where((root_indices_a < 0) | (root_indices_b < 0), 0, root_motion).astype(np.int8),
+                      voice_leading=voice_leading)
+
+def chord_diffs(chords_a: Chords,
+                chords_b: Chords
+                ) -> ChordDiffs:
+
+    """
+    Compares two collections of chords pair by pair (e.g., the same bars of an original and a reharmonised progression).
+
+    """
+
+    if len(chords_a) != len(chords_b):
+
+        raise ValueError(f"Invalid chords: {len(chords_a)} and {len(chords_b)} chords cannot be compared pair by pair.")
+
+    return diff_masks(*chord_masks(chords_a), *chord_masks(chords_b))
+
+def progression_diffs(chords: Chords) -> ChordDiffs:
+
+    """
+    Compares each chord of a progression with the next chord.
+
+    """
+
+    masks, root_indices = chord_masks(chords)
+
+    return diff_masks(masks[:-1], root_indices[:-1], masks[1:], root_indices[1:])
+
+def all_pair_diffs(chords_a: Chords,
+                   chords_b: Optional[Chords] = None
+                   ) -> ChordDiffs:
+
+    """
+    Compares every chord of one collection with every chord of another, or of itself, with vectorised operations.
+
+    Args:
+
+        chords_a (Chords): The first chords.
+        chords_b (Optional[Chords]): The second chords; defaults to the first chords.
+
+    Returns:
+
+        ChordDiffs: The differences, as arrays of shape (len(chords_a), len(chords_b)).
+
+    """
+
+    masks_a, root_indices_a = chord_masks(chords_a)
+
+    masks_b, root_indices_b = (masks_a, root_indices_a) if chords_b is None else chord_masks(chords_b)
+
+    # Calculates the voice leading of every pair with matrix products, rather than broadcasting a (len(chords_a), len(chords_b), 12) array.
+    bits, distances = _BITS, nearest_distances().astype(np.int16)
+
+    voice_leading = bits[masks_a] @ distances[masks_b].T + (bits[masks_b] @ distances[masks_a].T).T
+
+    return _diffs(masks_a[:, None], root_indices_a[:, None], masks_b[None, :], root_indices_b[None, :], voice_leading)
@@ -0,0 +1,263 @@
+from fractions import Fraction
+from math import log2
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from app.spelling import SPELLING_TABLE, line_of_fifths_position, note_at_position
+from config.config import CHROMATIC_SCALE, CHROMATIC_LEN, INTERVAL_DICT, INTERVAL_FIFTHS_DICT, NOTE_INDEX_DICT
+
+# Defines the range of line of fifths positions considered when naming the steps of a tuning.
+_NAMING_POSITIONS: range = range(-21, 22)
+
+class Tuning:
+
+    """
+    A class to describe a tuning, compiling its note and interval tables once on construction.
+
+    Spelled notes are mapped to steps through the line of fifths, so each tuning keeps the letter names of the spelling engine while changing the size of every interval;
+    e.g., C# and Db are distinct steps in 19-TET and 31-TET, and a single step in 12-TET.
+
+    Attributes:
+
+        name (str): The name of the tuning (e.g., "19-TET").
+        divisions (int): The number of steps per octave.
+        fifth_steps (int): The number of steps in a perfect fifth.
+        note_names (Tuple[str, ...]): The name of each step, indexed by step.
+        interval_steps (Dict[str, int]): The size of each interval name in INTERVAL_DICT, in steps.
+        interval_cents (Dict[str, float]): The size of each interval name in INTERVAL_DICT, in cents.
+        note_steps (Dict[str, int]): The step of every spelled note produced by the spelling engine.
+
+    """
+
+    def __init__(self,
+                 name: str,
+                 divisions: int,
+                 note_names: Optional[Sequence[str]] = None,
+                 ratios: Optional[Sequence[Fraction]] = None
+                 ):
+
+        """
+        Args:
+
+            name (str): The name of the tuning.
+            divisions (int): The number of steps per octave.
+            note_names (Optional[Sequence[str]]): The name of each step; defaults to the simplest spelling on the line of fifths, with "+" marking steps between spellings.
+            ratios (Optional[Sequence[Fraction]]): The frequency ratio of each step above the root note, for just intonation; defaults to equal temperament.
+
+        """
+
+        if ratios is not None and len(ratios) != divisions:
+
+            raise ValueError(f"Invalid ratios: {len(ratios)} ratios provided for {divisions} divisions.")
+
+        self.name: str = name
+
+        self.divisions: int = divisions
+
+        self.fifth_steps: int = round(divisions * log2(3 / 2))
+
+        self.ratios: Optional[Tuple[Fraction, ...]] = None if ratios is None else tuple(ratios)
+
+        self.interval_steps: Dict[str, int] = {}
+        self.interval_cents: Dict[str, float] = {}
+
+        for interval_name in INTERVAL_FIFTHS_DICT:
+
+            self.add_interval(interval_name)
+
+        self.note_names: Tuple[str, ...] = tuple(note_names) if note_names is not None else self._name_steps()
+
+        if len(self.note_names) != divisions:
+
+            raise ValueError(f"Invalid note_names: {len(self.note_names)} names provided for {divisions} divisions.")
+
+        spellings = set(NOTE_INDEX_DICT) | {note for spelling in SPELLING_TABLE.values() for note in spelling.values()}
+
+        self.note_steps: Dict[str, int] = {note: self._calculate_note_step(note) for note in spellings}
+
+    def add_interval(self,
+                     interval_name: str
+                     ) -> None:
+
+        """
+        Compiles the size of an interval name in steps and in cents, from its position on the line of fifths and its size in semitones.
+
+        Args:
+
+            interval_name (str): The name of the interval in INTERVAL_DICT and INTERVAL_FIFTHS_DICT.
+
+        """
+
+        steps = (INTERVAL_FIFTHS_DICT[interval_name] * self.fifth_steps) % self.divisions + self.divisions * (INTERVAL_DICT[interval_name] // CHROMATIC_LEN)
+
+        self.interval_steps[interval_name] = steps
+
+        if self.ratios is None:
+
+            self.interval_cents[interval_name] = steps * 1200 / self.divisions
+
+        else:
+
+            self.interval_cents[interval_name] = 1200 * log2(self.ratios[steps % self.divisions]) + 1200 * (steps // self.divisions)
+
+    def remove_interval(self,
+                        interval_name: str
+                        ) -> None:
+
+        """
+        Removes the compiled size of an interval name, if it has been compiled.
+
+        Args:
+
+            interval_name (str): The name of the interval.
+
+        """
+
+        self.interval_steps.pop(interval_name, None)
+
+        self.interval_cents.pop(interval_name, None)
+
+    def _calculate_note_step(self,
+                             note: str
+                             ) -> int:
+
+        return (line_of_fifths_position(note) * self.fifth_steps) % self.divisions
+
+    def _name_steps(self) -> Tuple[str, ...]:
+
+        """
+        Names each step with its simplest spelling on the line of fifths; steps without a spelling are named after the step below with a "+" suffix (e.g., "C+" in 24-TET).
+
+        """
+
+        names: Dict[int, str] = {}
+
+        for position in sorted(_NAMING_POSITIONS, key=abs):
+
+            names.setdefault((position * self.fifth_steps) % self.divisions, note_at_position(position))
+
+        for step in range(self.divisions):
+
+            if step not in names:
+
+                names[step] = f"{names[step - 1]}+"
+
+        return tuple(names[step] for step in range(self.divisions))
+
+    def note_index(self,
+                   note: str
+                   ) -> int:
+
+        """
+        Returns the step of a spelled note (e.g., "Db" -> 2 in 19-TET).
+
+        """
+
+        try:
+
+            return self.note_steps[note]
+
+        except KeyError:
+
+            return self._calculate_note_step(note)
+
+    def __repr__(self) -> str:
+
+        return f"Tuning({self.name!r})"
+
+
+
+# Defines the 5-limit just intonation ratios of each step of the chromatic scale above the root note.
+FIVE_LIMIT_RATIOS: Tuple[Fraction, ...] = tuple(Fraction(ratio) for ratio in ("1", "16/15", "9/8", "6/5", "5/4", "4/3", "45/32", "3/2", "8/5", "5/3", "9/5", "15/8"))
+
+# Maps each tuning name to the function that builds it.
+TUNING_BUILDERS: Dict[str, Callable[[], Tuning]] = {
+
+    "12-TET": lambda: Tuning("12-TET", CHROMATIC_LEN, note_names=CHROMATIC_SCALE),
+    "19-TET": lambda: Tuning("19-TET", 19),
+    "24-TET": lambda: Tuning("24-TET", 24),
+    "31-TET": lambda: Tuning("31-TET", 31),
+    "5-limit-just": lambda: Tuning("5-limit-just", CHROMATIC_LEN, note_names=CHROMATIC_SCALE, ratios=FIVE_LIMIT_RATIOS),
+
+}
+
+# Stores each tuning once it has been compiled, keyed by name.
+_COMPILED_TUNINGS: Dict[str, Tuning] = {}
+
+def get_tuning(name: str = "12-TET") -> Tuning:
+
+    """
+    Returns the tuning with the given name, compiling its tables on first use and caching it thereafter.
+
+    Args:
+
+        name (str): The name of the tuning in TUNING_BUILDERS; defaults to "12-TET".
+
+    Returns:
+
+        Tuning: The compiled tuning.
+
+    """
+
+    if name not in TUNING_BUILDERS:
+
+        raise ValueError(f"Invalid tuning: {name} must be one of {list(TUNING_BUILDERS)}.")
+
+    tuning = _COMPILED_TUNINGS.get(name)
+
+    if tuning is None:
+
+        tuning = _COMPILED_TUNINGS[name] = TUNING_BUILDERS[name]()
+
+    return tuning
+
+def register_tuning(name: str,
+                    builder: Callable[[], Tuning]
+                    ) -> None:
+
+    """
+    Registers a tuning, so that get_tuning() can compile it by name; a tuning already compiled under the name is replaced.
+
+    Args:
+
+        name (str): The name of the tuning.
+        builder (Callable[[], Tuning]): The function that builds the tuning.
+
+    """
+
+    TUNING_BUILDERS[name] = builder
+
+    _COMPILED_TUNINGS.pop(name, None)
+
+def is_registered(tuning: Tuning) -> bool:
+
+    """
+    Returns whether a tuning is the one that get_tuning() returns for its name, so that it can be restored by name (e.g., when a chord is unpickled).
+
+    """
+
+    return _COMPILED_TUNINGS.get(tuning.name) is tuning
+
+def compile_interval(interval_name: str) -> None:
+
+    """
+    Adds an interval name to every compiled tuning; tunings compiled later include it automatically.
+
+    """
+
+    for tuning in _COMPILED_TUNINGS.values():
+
+        tuning.add_interval(interval_name)
+
+def remove_interval(interval_name: str) -> None:
+
+    """
+    Removes an interval name from every compiled tuning.
+
+    """
+
+    for tuning in _COMPILED_TUNINGS.values():
+
+        tuning.remove_interval(interval_name)
+
+# Stores the default tuning.
+TWELVE_TET: Tuning = get_tuning("12-TET")
@@ -1,8 +1,22 @@
-from typing import List
+from itertools import product
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
+from app.library.codes import SLOT_CODES, SLOT_SEMITONES, SLOT_SIZES
+from app.library.enums import ThirdType, FifthType
+from app.spelling import note_index
 from config.config import CHROMATIC_SCALE
 
-def calculate_note(chromatic_scale: List[str], root_index: int, interval_type: object) -> str:
+if TYPE_CHECKING:
+
+    import numpy as np
+
+    from app.tuning import Tuning
+
+# Stores the codes of the tertian third and fifth interval types, which keep the notation of a chord conventional (see shape_cost).
+_TERTIAN_THIRD_CODES: Tuple[int, ...] = (SLOT_CODES[2][ThirdType.MINOR], SLOT_CODES[2][ThirdType.MAJOR])
+_PERFECT_FIFTH_CODE: int = SLOT_CODES[4][FifthType.PERFECT]
+
+def calculate_note(chromatic_scale: List[str], root_index: int, interval_type: object, tuning: Optional["Tuning"] = None) -> str:
 
     """
     Calculates the note in the chromatic scale based on the root note index position and the interval type.
@@ -12,16 +26,21 @@ def calculate_note(chromatic_scale: List[str], root_index: int, interval_type: o
         chromatic_scale (List[str]): A list of strings representing the twelve note chromatic scale.
         root_index (int): The index position of the root note in the chromatic scale.
         interval_type (object): The interval type Enum that refers to the value in semitones between the root note and the target note.
+        tuning (Optional[Tuning]): The tuning whose note names replace the chromatic scale, with the root note index position and the interval in its steps; defaults to None.
 
     Returns:
 
         str: The note in the chromatic scale that corresponds to the root note index position and the interval type.
     
     """
+
+    if tuning is not None:
+
+        chromatic_scale = tuning.note_names
     
     return chromatic_scale[(root_index + interval_type) % len(chromatic_scale)]
 
-def calculate_interval(chromatic_scale: List[str], root_index: int, note_type: str) -> int:
+def calculate_interval(chromatic_scale: List[str], root_index: int, note_type: str, tuning: Optional["Tuning"] = None) -> int:
 
     """
     Calculates the interval in the chromatic scale based on the root note index position and the note type.
@@ -31,6 +50,7 @@ def calculate_interval(chromatic_scale: List[str], root_index: int, note_type: s
         chromatic_scale (List[str]): A list of strings representing the twelve note chromatic scale.
         root_index (int): The index position of the root note in the chromatic scale.
         note_type (str): The target note from the chromatic scale. 
+        tuning (Optional[Tuning]): The tuning that the root note index position and the interval are measured in, which accepts any spelling of the target note; defaults to None.
 
     Returns:
 
@@ -38,6 +58,10 @@ def calculate_interval(chromatic_scale: List[str], root_index: int, note_type: s
     
     """
 
+    if tuning is not None:
+
+        return (tuning.note_index(note_type) - root_index) % tuning.divisions
+
     return (chromatic_scale.index(note_type) - root_index) % len(chromatic_scale)
 
 def interval_signature(self) -> List[int]:
@@ -71,8 +95,8 @@ def interval_signature(self) -> List[int]:
         
         ]
     
-    # Calculates the length of the chromatic scale.
-    chromatic_len: int = len(CHROMATIC_SCALE)
+    # Calculates the number of steps per octave in the chord's tuning.
+    chromatic_len: int = self.tuning.divisions if hasattr(self, "tuning") else len(CHROMATIC_SCALE)
 
     for interval in all_intervals:
 
@@ -86,3 +110,206 @@ def interval_signature(self) -> List[int]:
             interval_signature.append(interval)
 
     return interval_signature
+
+def pitch_classes(note_signature: Iterable[str]) -> List[int]:
+
+    """
+    Converts a note signature into the index positions of its notes in the chromatic scale.
+
+    Args:
+
+        note_signature (Iterable[str]): The spelled notes, with any accidentals (e.g., ["B", "D#", "F#"]).
+
+    Returns:
+
+        List[int]: The index position of each note in the chromatic scale (e.g., [11, 3, 6]).
+    
+    """
+
+    return [note_index(note) for note in note_signature]
+
+def pitch_class_mask(pitch_class_list: Iterable[int]) -> int:
+
+    """
+    Converts a list of index positions in the chromatic scale into a 12-bit mask, with bit n set for the note at index n.
+
+    Args:
+
+        pitch_class_list (Iterable[int]): The index positions of the notes (e.g., [0, 4, 7]).
+
+    Returns:
+
+        int: The pitch class mask (e.g., 0b000010010001).
+    
+    """
+
+    mask = 0
+
+    for pitch_class in pitch_class_list:
+
+        mask |= 1 << (pitch_class % len(CHROMATIC_SCALE))
+
+    return mask
+
+def quality_mask(chord: object) -> int:
+
+    """
+    Converts the interval types of a chord into a 12-bit pitch class mask relative to its root note, from the size of each interval type in semitones,
+    so that the mask is the same in every tuning (unlike a mask of the interval signature, which is in the tuning's steps).
+
+    Args:
+
+        chord (object): The chord (a Chord; typed as object to avoid a circular import).
+
+    Returns:
+
+        int: The pitch class mask, with bit 0 as the root note (e.g., 0b010010010001 for a dominant seventh chord).
+    
+    """
+
+    return pitch_class_mask(interval_type.semitones for interval_type in chord.get_interval_types().values() if interval_type is not None)
+
+def rotate_mask(mask: int, semitones: int) -> int:
+
+    """
+    Rotates a 12-bit pitch class mask by a number of semitones (e.g., downwards by 4 to hear a C major triad from its E in the bass).
+
+    Args:
+
+        mask (int): The pitch class mask.
+        semitones (int): The number of semitones to rotate by, positive (upwards) or negative (downwards).
+
+    Returns:
+
+        int: The rotated pitch class mask (e.g., rotate_mask(0b000010010001, -4) -> 0b000100001001).
+    
+    """
+
+    chromatic_len = len(CHROMATIC_SCALE)
+
+    semitones %= chromatic_len
+
+    return ((mask << semitones) | (mask >> (chromatic_len - semitones))) & ((1 << chromatic_len) - 1)
+
+def rotate_masks(masks: "np.ndarray", semitones: "np.ndarray") -> "np.ndarray":
+
+    """
+    Rotates 12-bit pitch class masks upwards by a number of semitones, element-wise (see rotate_mask).
+
+    Args:
+
+        masks (np.ndarray): The pitch class masks.
+        semitones (np.ndarray): The number of semitones to rotate each mask by, broadcast against the masks.
+
+    Returns:
+
+        np.ndarray: The rotated pitch class masks, as 64-bit integers.
+    
+    """
+
+    import numpy as np
+
+    chromatic_len = len(CHROMATIC_SCALE)
+
+    semitones = np.asarray(semitones, dtype=np.int64) % chromatic_len
+
+    masks = np.asarray(masks, dtype=np.int64)
+
+    return ((masks << semitones) | (masks >> (chromatic_len - semitones))) & ((1 << chromatic_len) - 1)
+
+def mask_bits() -> "np.ndarray":
+
+    """
+    Returns the bits of every 12-bit pitch class mask, indexed by mask and pitch class.
+
+    Returns:
+
+        np.ndarray: A (4096, 12) array of 0s and 1s.
+    
+    """
+
+    import numpy as np
+
+    chromatic_len = len(CHROMATIC_SCALE)
+
+    return (np.arange(1 << chromatic_len)[:, None] >> np.arange(chromatic_len)[None, :]) & 1
+
+def shape_cost(codes: Tuple[int, ...]) -> int:
+
+    """
+    Scores the complexity of a combination of interval type codes (excluding the root note), as the number of interval types set,
+    plus one for a third that is not minor or major and one for a fifth that is not perfect.
+
+    Args:
+
+        codes (Tuple[int, ...]): The code of each interval name, excluding the root note, in INTERVAL_SLOT_NAMES order.
+
+    Returns:
+
+        int: The complexity of the combination; lower is simpler.
+    
+    """
+
+    return sum(1 for code in codes if code) + (codes[1] not in _TERTIAN_THIRD_CODES) + (codes[3] != _PERFECT_FIFTH_CODE)
+
+def enumerate_shapes() -> Dict[int, Tuple[int, ...]]:
+
+    """
+    Enumerates every combination of interval type codes that a chord can hold, and keeps the simplest combination for each quality mask (see shape_cost).
+
+    Returns:
+
+        Dict[int, Tuple[int, ...]]: The codes of the interval names (excluding the root note) of the simplest combination, for each quality mask with bit 0 as the root note.
+    
+    """
+
+    shapes = {}
+
+    for codes in sorted(product(*(range(size) for size in SLOT_SIZES[1:])), key=shape_cost):
+
+        quality_mask = pitch_class_mask([0, *(semitones[code] for semitones, code in zip(SLOT_SEMITONES[1:], codes) if code)])
+
+        shapes.setdefault(quality_mask, codes)
+
+    return shapes
+
+def invert_interval_signature(interval_signature: List[int], bass_interval: int, divisions: int = len(CHROMATIC_SCALE)) -> List[int]:
+
+    """
+    Rotates a root position interval signature to start from its bass note, in close position, without rebuilding the chord.
+
+    If the bass note is a chord tone, the pitch classes are rotated to start from it; otherwise (e.g., D/C), the bass note is added below the chord.
+
+    Args:
+
+        interval_signature (List[int]): The root position interval signature, starting from the root note (0).
+        bass_interval (int): The interval from the root note to the bass note, in steps.
+        divisions (int): The number of steps per octave; defaults to 12.
+
+    Returns:
+
+        List[int]: The interval signature relative to the bass note, ascending from 0 (e.g., [0, 4, 7, 10, 14] with bass interval 4 -> [0, 3, 6, 8, 10]).
+    
+    """
+
+    bass_interval %= divisions
+
+    # Rotates the pitch classes of the chord so that the bass note is at 0, in ascending order; the bass note is added if it is not a chord tone.
+    rotated = sorted((interval - bass_interval) % divisions for interval in interval_signature)
+
+    if not rotated or rotated[0] != 0:
+
+        rotated.insert(0, 0)
+
+    inverted = [0]
+
+    for interval in rotated[1:]:
+
+        # Ensures the intervals remain in sequence above the bass note, placing notes that share a pitch class an octave apart.
+        while interval <= inverted[-1]:
+
+            interval += divisions
+
+        inverted.append(interval)
+
+    return inverted
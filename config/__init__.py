@@ -1,11 +1,16 @@
-from config.config import CHROMATIC_SCALE, CHROMATIC_LEN, INTERVAL_NAMES, INTERVAL_DICT, INTERVAL_DEPENDENCIES_DICT, DEFAULT_INTERVAL_TYPES
+from config.config import CHROMATIC_SCALE, CHROMATIC_LEN, NATURAL_NOTE_INDEX_DICT, ACCIDENTAL_DICT, NOTE_INDEX_DICT, INTERVAL_NAMES, INTERVAL_SLOT_NAMES, INTERVAL_DICT, INTERVAL_FIFTHS_DICT, INTERVAL_DEPENDENCIES_DICT, DEFAULT_INTERVAL_TYPES
 
 __all__ = [
 
     "CHROMATIC_SCALE",
     "CHROMATIC_LEN",
+    "NATURAL_NOTE_INDEX_DICT",
+    "ACCIDENTAL_DICT",
+    "NOTE_INDEX_DICT",
     "INTERVAL_NAMES",
+    "INTERVAL_SLOT_NAMES",
     "INTERVAL_DICT",
+    "INTERVAL_FIFTHS_DICT",
     "INTERVAL_DEPENDENCIES_DICT",
     "DEFAULT_INTERVAL_TYPES"
 
@@ -6,8 +6,22 @@ CHROMATIC_SCALE: List[str] = ["C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "
 
 CHROMATIC_LEN: int = len(CHROMATIC_SCALE)
 
+NATURAL_NOTE_INDEX_DICT: Dict[str, int] = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+ACCIDENTAL_DICT: Dict[str, int] = {"bb": -2, "b": -1, "": 0, "#": 1, "##": 2}
+
+NOTE_INDEX_DICT: Dict[str, int] = {
+    
+    f"{letter}{accidental}": (index + offset) % CHROMATIC_LEN 
+    for letter, index in NATURAL_NOTE_INDEX_DICT.items() 
+    for accidental, offset in ACCIDENTAL_DICT.items()
+    
+    }
+
 INTERVAL_NAMES: List[str] = ["second", "third", "fourth", "fifth", "sixth", "seventh", "ninth", "eleventh", "thirteenth"]
 
+INTERVAL_SLOT_NAMES: List[str] = ["root", *INTERVAL_NAMES]
+
 INTERVAL_DICT: Dict[str, int] = {
     
     "unison": 0,
@@ -38,6 +52,36 @@ INTERVAL_DICT: Dict[str, int] = {
 
     }
 
+INTERVAL_FIFTHS_DICT: Dict[str, int] = {
+
+    "unison": 0,
+    "minor_second": -5,
+    "major_second": 2,
+    "minor_third": -3,
+    "major_third": 4,
+    "perfect_fourth": -1,
+    "augmented_fourth": 6,
+    "diminished_fifth": -6,
+    "perfect_fifth": 1,
+    "augmented_fifth": 8,
+    "minor_sixth": -4,
+    "major_sixth": 3,
+    "diminished_seventh": -9,
+    "minor_seventh": -2,
+    "major_seventh": 5,
+    "octave": 0,
+    "minor_ninth": -5,
+    "major_ninth": 2,
+    "minor_tenth": -3,
+    "major_tenth": 4,
+    "perfect_eleventh": -1,
+    "augmented_eleventh": 6,
+    "perfect_twelfth": 1,
+    "minor_thirteenth": -4,
+    "major_thirteenth": 3
+
+    }
+
 INTERVAL_DEPENDENCIES_DICT: Dict[str, List[str]] = {
 
     "thirteenth": ["seventh", "ninth", "eleventh"],
@@ -0,0 +1,21 @@
+from app.chord import Chord
+from app.library.enums import RootType
+
+def build_chord(root_type: RootType,
+                *interval_types
+                ) -> Chord:
+
+    """
+    Builds a chord from the default major triad, with a new root note and each interval type added (or removed, if the triad already has it).
+
+    """
+
+    chord = Chord()
+
+    chord.set_new_root(root_type)
+
+    for interval_type in interval_types:
+
+        chord.add_or_remove_interval_type_and_attributes(interval_type)
+
+    return chord
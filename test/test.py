@@ -1,6 +1,7 @@
 import pytest
 
 from app.chord import Chord
+from app.library.dependencies import INTERVAL_DEPENDENCY_CLOSURE, resolve_dependencies, resolve_dependencies_batch
 from app.library.enums import RootType, ThirdType, FifthType, SeventhType, NinthType, EleventhType, ThirteenthType
 from config.config import CHROMATIC_SCALE, CHROMATIC_LEN, INTERVAL_NAMES, INTERVAL_DICT, INTERVAL_DEPENDENCIES_DICT, DEFAULT_INTERVAL_TYPES
 
@@ -169,6 +170,118 @@ def test_all_default_interval_types_and_attributes_added():
 
 
 
+def test_interval_types_are_recorded_without_calculating_notes():
+
+    """
+    Adding an interval type records the type only; its note and interval attributes are calculated on first access.
+    
+    """
+
+    chord = Chord()
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MAJOR)
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MAJOR)
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+
+    assert "seventh" not in chord._notes
+    assert "seventh" not in chord._intervals
+
+    assert chord.seventh_note == "Bb"
+    assert chord.seventh_interval == 10
+
+
+
+def test_set_new_root_invalidates_notes_only():
+
+    chord = Chord()
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+
+    assert chord.get_note_signature() == ["C", "E", "G", "Bb"]
+    assert chord.get_interval_signature() == [0, 4, 7, 10]
+
+    chord.set_new_root(RootType.G)
+
+    assert chord._notes == {}
+    assert chord._interval_signature == [0, 4, 7, 10]
+
+    assert chord.get_note_signature() == ["G", "B", "D", "F"]
+    assert chord.get_interval_signature() == [0, 4, 7, 10]
+
+
+
+def test_signature_invalidated_for_changed_interval_only():
+
+    chord = Chord()
+
+    chord.get_note_signature()
+
+    chord.third_type = ThirdType.MINOR
+
+    assert "third" not in chord._notes
+    assert chord._notes["fifth"] == "G"
+
+    assert chord.third_note == "Eb"
+    assert chord.get_note_signature() == ["C", "Eb", "G"]
+    assert chord.get_interval_signature() == [0, 3, 7]
+
+
+
+
+@pytest.mark.parametrize("interval_type, expected_interval_types", [
+
+    (NinthType.MAJOR, {"seventh": SeventhType.MINOR}),
+    (EleventhType.AUGMENTED, {"seventh": SeventhType.MINOR, "ninth": NinthType.MAJOR}),
+    (ThirteenthType.MINOR, {"seventh": SeventhType.MINOR, "ninth": NinthType.MAJOR, "eleventh": EleventhType.PERFECT}),
+
+])
+def test_add_interval_type_resolves_all_dependencies(interval_type, expected_interval_types):
+
+    """
+    Adding a ninth, eleventh or thirteenth interval type sets every interval type dependency to its default interval type.
+    
+    """
+
+    chord = Chord()
+
+    chord.add_or_remove_interval_type_and_attributes(interval_type)
+
+    for interval_name, expected_interval_type in expected_interval_types.items():
+
+        assert getattr(chord, f"{interval_name}_type") == expected_interval_type
+
+
+
+def test_add_interval_type_keeps_existing_dependencies():
+
+    chord = Chord()
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MAJOR)
+    chord.add_or_remove_interval_type_and_attributes(NinthType.MINOR)
+
+    assert chord.seventh_type == SeventhType.MAJOR
+    assert chord.ninth_type == NinthType.MINOR
+
+
+
+def test_resolve_dependencies():
+
+    assert resolve_dependencies([]) == {}
+    assert resolve_dependencies(["third", "fifth"]) == {}
+    assert resolve_dependencies(["ninth", "thirteenth"]) == {
+
+        "seventh": SeventhType.MINOR, 
+        "ninth": NinthType.MAJOR, 
+        "eleventh": EleventhType.PERFECT
+
+    }
+
+    assert INTERVAL_DEPENDENCY_CLOSURE["eleventh"] == frozenset({"seventh", "ninth"})
+    assert resolve_dependencies_batch([["ninth"], ["second"]]) == [{"seventh": SeventhType.MINOR}, {}]
+
+
+
+
 """
 
 def test_chord_instantiation_with_custom_intervals():
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from app.chord import Chord
+from app.chord_array import ChordArray
+from app.library.enums import RootType, ThirdType, FifthType, SeventhType, NinthType, ThirteenthType
+
+def _chords():
+
+    """
+    Builds a small set of chords covering roots, removed notes and interval dependencies.
+    
+    """
+
+    major = Chord()
+
+    minor_seventh = Chord()
+    minor_seventh.set_new_root(RootType.D)
+    minor_seventh.add_or_remove_interval_type_and_attributes(ThirdType.MINOR)
+    minor_seventh.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+
+    thirteenth = Chord()
+    thirteenth.set_new_root(RootType.B)
+    thirteenth.add_or_remove_interval_type_and_attributes(ThirteenthType.MAJOR)
+
+    rootless = Chord()
+    rootless.add_or_remove_interval_type_and_attributes(RootType.C)
+
+    flat_root = Chord()
+    flat_root.set_new_root(RootType.D_FLAT)
+
+    return [major, minor_seventh, thirteenth, rootless, flat_root]
+
+
+
+def test_chord_array_round_trip():
+
+    chords = _chords()
+
+    chord_array = ChordArray.from_chords(chords)
+
+    assert len(chord_array) == 5
+    assert chord_array.nbytes == 55
+
+    for chord, restored in zip(chords, chord_array.to_chords()):
+
+        assert restored.get_interval_types() == chord.get_interval_types()
+        assert restored.get_note_signature() == chord.get_note_signature()
+
+
+
+def test_chord_array_signatures_match_chord():
+
+    chords = _chords()
+
+    chord_array = ChordArray.from_chords(chords)
+
+    assert chord_array.note_names() == [chord.get_note_signature() for chord in chords]
+
+    interval_signatures = chord_array.interval_signatures()
+
+    for chord, row in zip(chords, interval_signatures):
+
+        assert [interval for interval in row.tolist() if interval >= 0] == chord.get_interval_signature()
+
+    assert chord_array.pitch_class_masks()[0] == (1 << 0) | (1 << 4) | (1 << 7)
+
+
+
+def test_chord_array_transpose():
+
+    chord_array = ChordArray.from_chords(_chords()).transpose(-3)
+
+    assert chord_array.root_index.tolist() == [9, 11, 8, -1, 10]
+    assert chord_array.note_names()[0] == ["A", "C#", "E"]
+
+
+
+def test_chord_array_filter():
+
+    chord_array = ChordArray.from_chords(_chords() * 3)
+
+    assert len(chord_array.filter(seventh=SeventhType.MINOR)) == 6
+    assert len(chord_array.filter(root=RootType.D, third=ThirdType.MINOR)) == 3
+    assert len(chord_array.filter(root=RootType.C_SHARP)) == 3
+    assert len(chord_array.filter(root=None)) == 3
+    assert len(chord_array.filter(chord_array.root_index > 0, ninth=None)) == 6
+
+    with pytest.raises(ValueError, match=r"Invalid interval_type"):
+
+        chord_array.filter(ninth=FifthType.PERFECT)
+
+
+
+def test_chord_array_empty():
+
+    chord_array = ChordArray.empty(1_000_000)
+
+    assert chord_array.nbytes == 11_000_000
+    assert chord_array[999_999].get_note_signature() == ["C", "E", "G"]
+    assert np.all(chord_array.pitch_class_masks()[:10] == 0b10010001)
@@ -0,0 +1,179 @@
+import random
+import threading
+import time
+
+import pytest
+
+from app.concurrency import ChordLookup, FrozenChord, SingleFlightCache, get_lookup
+from app.symbols import parse_chord
+
+SYMBOLS = ["C", "Cm7", "G7", "F#m7b5", "Bbmaj9", "D13#11", "Ebdim7", "Aø7", "E7b9", "Dbmaj7", "root=F# third=MINOR seventh=MINOR"]
+
+THREAD_COUNT = 16
+
+
+
+def _run_threads(target, count=THREAD_COUNT):
+
+    errors = []
+
+    barrier = threading.Barrier(count)
+
+    def run(thread_index):
+
+        try:
+
+            barrier.wait()
+
+            target(thread_index)
+
+        except BaseException as error:
+
+            errors.append(error)
+
+    threads = [threading.Thread(target=run, args=(thread_index,)) for thread_index in range(count)]
+
+    for thread in threads:
+
+        thread.start()
+
+    for thread in threads:
+
+        thread.join()
+
+    assert errors == []
+
+
+
+def test_frozen_chord_is_immutable():
+
+    frozen = get_lookup().lookup("F#m7b5")
+
+    assert frozen == FrozenChord.from_chord(parse_chord("F#m7b5"))
+    assert frozen.root_note == "F#"
+    assert frozen.notes == ("F#", "A", "C", "E")
+
+    with pytest.raises(AttributeError):
+
+        frozen.notes = ()
+
+    chord = frozen.to_chord()
+
+    chord.set_new_root(parse_chord("G").root_type)
+
+    assert frozen.notes == ("F#", "A", "C", "E")
+
+
+
+def test_lookup_keeps_the_slash_bass_note():
+
+    lookup = ChordLookup()
+
+    root_position, slash = lookup.lookup("C"), lookup.lookup("C/E")
+
+    assert (root_position.bass, slash.bass) == ("C", "E")
+    assert root_position != slash and root_position.notes == slash.notes
+    assert lookup.lookup_id(parse_chord("C/E").state()) is slash
+
+    assert slash.to_chord().get_bass_note_signature() == ["E", "G", "C"]
+    assert lookup.lookup("D/C").to_chord().get_bass_note_signature() == ["C", "D", "F#", "A"]
+
+
+
+def test_single_flight_fills_each_key_once():
+
+    calls = []
+
+    def slow_factory(key):
+
+        calls.append(key)
+
+        time.sleep(0.01)
+
+        return key * 2
+
+    cache = SingleFlightCache(slow_factory)
+
+    def read(thread_index):
+
+        for key in random.Random(thread_index).choices(range(20), k=200):
+
+            assert cache.get(key) == key * 2
+
+    _run_threads(read)
+
+    assert sorted(calls) == list(range(20))
+    assert cache.fills == 20
+
+
+
+def _outcome(cache, key):
+
+    try:
+
+        return cache.get(key)
+
+    except RuntimeError as error:
+
+        return error
+
+def test_single_flight_shares_and_retries_errors():
+
+    attempts = []
+
+    def failing_factory(key):
+
+        attempts.append(key)
+
+        time.sleep(0.01)
+
+        if len(attempts) == 1:
+
+            raise RuntimeError("temporary failure")
+
+        return key
+
+    cache = SingleFlightCache(failing_factory)
+
+    outcomes = []
+
+    _run_threads(lambda thread_index: outcomes.append(_outcome(cache, "key")), count=8)
+
+    assert len(attempts) == 1 and all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+
+    assert cache.get("key") == "key" and len(attempts) == 2
+
+
+
+def test_eviction():
+
+    cache = SingleFlightCache(lambda key: key, maxsize=3)
+
+    for key in range(5):
+
+        cache.get(key)
+
+    assert len(cache) == 3 and 0 not in cache and 4 in cache
+
+
+
+def test_lookup_stress():
+
+    lookup = ChordLookup()
+
+    expected = {line: FrozenChord.from_chord(parse_chord(line)) for line in SYMBOLS}
+
+    def read(thread_index):
+
+        for line in random.Random(thread_index).choices(SYMBOLS, k=2000):
+
+            frozen = lookup.lookup(line)
+
+            # Publishes whole snapshots, so no thread sees notes that disagree with the root note or intervals.
+            assert frozen == expected[line]
+            assert lookup.lookup_id(frozen.chord_id) is frozen
+
+    _run_threads(read)
+
+    assert lookup.by_symbol.fills == len(SYMBOLS)
+    assert lookup.by_id.fills == len({frozen.chord_id for frozen in expected.values()})
@@ -0,0 +1,83 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from app.chord import Chord
+from app.chord_array import ChordArray
+from app.consonance import ConsonanceModel, interval_vectors, tension_scores, roughness_scores
+from app.library.enums import RootType, SecondType, ThirdType, FifthType, SeventhType, NinthType
+from app.tuning import get_tuning
+from test.conftest import build_chord
+
+def test_interval_vectors():
+
+    vectors = interval_vectors()
+
+    assert vectors[0b000010010001].tolist() == [0, 0, 1, 1, 1, 0]
+    assert vectors[0b001001001001].tolist() == [0, 0, 4, 0, 0, 2]
+
+
+
+def test_tension_matches_pairwise_calculation():
+
+    model = ConsonanceModel()
+
+    chords = [build_chord(RootType.C), build_chord(RootType.C, SeventhType.MINOR), build_chord(RootType.C, ThirdType.MINOR, FifthType.DIMINISHED, SeventhType.DIMINISHED), build_chord(RootType.C, SecondType.ADD2, NinthType.MINOR)]
+
+    for chord, score in zip(chords, model.tension(chords)):
+
+        pitch_classes = sorted({interval % 12 for interval in chord.get_interval_signature()})
+
+        pair_tensions = [model.interval_class_tension[min((b - a) % 12, (a - b) % 12) - 1] for a, b in combinations(pitch_classes, 2)]
+
+        assert score == pytest.approx(sum(pair_tensions) / len(pair_tensions))
+
+    assert np.allclose(model.tension(ChordArray.from_chords(chords)), model.tension(chords))
+
+
+
+def test_tension_and_roughness_ordering():
+
+    major, dominant, cluster = build_chord(RootType.C), build_chord(RootType.C, SeventhType.MINOR), build_chord(RootType.C, SecondType.ADD2, NinthType.MINOR, ThirdType.MINOR)
+
+    tension = tension_scores([major, dominant, cluster])
+    roughness = roughness_scores([major, dominant, cluster])
+
+    assert tension[0] < tension[1] < tension[2]
+    assert roughness[0] < roughness[2]
+
+    assert ConsonanceModel().rank([cluster, major, dominant]) == [1, 2, 0]
+
+
+
+def test_scores_in_other_tunings():
+
+    model = ConsonanceModel()
+
+    dominant = build_chord(RootType.C, SeventhType.MINOR)
+
+    chords = [Chord.from_interval_types(dominant.get_interval_types(), get_tuning(tuning_name)) for tuning_name in ("12-TET", "24-TET", "19-TET", "31-TET")]
+
+    # Scores tension from semitones, and roughness from each tuning's cents, which are close to 12-TET's in 19-TET and 31-TET.
+    assert np.allclose(model.tension(chords), model.tension([dominant]))
+
+    roughness = model.roughness(chords)
+
+    assert roughness[1] == pytest.approx(roughness[0])
+    assert np.allclose(roughness[2:], roughness[0], rtol=0.05) and not np.allclose(roughness[2:], roughness[0])
+
+
+
+def test_roughness_table():
+
+    model = ConsonanceModel()
+
+    table = model.roughness_table
+
+    assert table.shape == (4096,)
+    assert table[0b000000000011] > table[0b000010000001] > table[0b000000000001]
+
+    with pytest.raises(ValueError, match=r"Invalid score"):
+
+        model.rank([], by="brightness")
@@ -0,0 +1,47 @@
+import pickle
+
+from app.chord import Chord
+from app.library.codes import ROOT_INDICES, SLOT_MEMBERS, SLOT_SEMITONES, SLOT_TYPES
+from app.library.enums import RootType, ThirdType, FifthType, SeventhType, NinthType
+from app.tuning import get_tuning
+from config.config import INTERVAL_DICT, NOTE_INDEX_DICT
+
+def test_members_carry_integer_semitones():
+
+    for slot_type in SLOT_TYPES[1:]:
+
+        for member in slot_type:
+
+            assert member.semitones == INTERVAL_DICT[member.value]
+
+    for root_type in RootType:
+
+        assert (root_type.index, root_type.semitones) == (NOTE_INDEX_DICT[root_type.value], 0)
+
+    assert SLOT_SEMITONES[2] == (0, *(member.semitones for member in SLOT_MEMBERS[2]))
+    assert ROOT_INDICES[0] == -1
+
+
+
+def test_string_values_are_kept():
+
+    assert ThirdType.MAJOR.value == "major_third"
+    assert ThirdType("major_third") is ThirdType.MAJOR
+    assert RootType("Db") is RootType.D_FLAT
+
+    # Aliases still resolve to their canonical member.
+    assert NinthType.ADD9 is NinthType.MAJOR
+    assert list(NinthType) == [NinthType.MINOR, NinthType.MAJOR]
+
+    assert pickle.loads(pickle.dumps(ThirdType.MINOR)) is ThirdType.MINOR
+
+
+
+def test_twelve_tet_fast_path_matches_tunings():
+
+    chord = Chord.from_interval_types({"root": RootType.B, "third": ThirdType.MAJOR, "fifth": FifthType.PERFECT, "seventh": SeventhType.MINOR, "ninth": NinthType.MINOR})
+
+    assert chord.root_index == 11
+    assert chord.get_interval_signature() == [0, 4, 7, 10, 13]
+
+    assert Chord.from_interval_types(chord.get_interval_types(), get_tuning("24-TET")).get_interval_signature() == [0, 8, 14, 20, 26]
@@ -0,0 +1,43 @@
+import pytest
+
+from app.chord import Chord
+from app.footprint import BENCHMARKS, FOOTPRINT_BUDGETS, main, measure_footprint
+
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_footprints_are_within_budget(name):
+
+    small, large = measure_footprint(name, 1000), measure_footprint(name, 10000)
+
+    assert small.bytes_per_object <= FOOTPRINT_BUDGETS[name]
+    assert large.bytes_per_object <= FOOTPRINT_BUDGETS[name]
+
+    # The cost of each object does not grow with the number of objects.
+    assert large.bytes_per_object <= small.bytes_per_object * 1.1
+
+
+
+def test_chords_have_no_instance_dictionary():
+
+    chord = Chord()
+
+    assert not hasattr(chord, "__dict__")
+
+    with pytest.raises(AttributeError):
+
+        chord.root_note_name = "C"
+
+
+
+def test_command_line_reports_every_benchmark(capsys):
+
+    assert main(["--counts", "1000", "--benchmarks", "chord", "progression"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert [line.split()[0] for line in lines[1:]] == ["chord", "progression"]
+
+    with pytest.raises(ValueError, match="Invalid benchmark"):
+
+        measure_footprint("tuning", 100)
@@ -0,0 +1,216 @@
+import random
+
+import pytest
+
+from app.chord import Chord
+from app.history import CHUNK_SIZE, ChordHistory, History, ProgressionHistory, ProgressionSnapshot
+from app.library.enums import RootType, ThirdType, SeventhType, ThirteenthType
+from app.symbols import parse_chord
+from app.tuning import get_tuning
+
+def test_history_undo_redo_and_eviction():
+
+    history = History(0, limit=3)
+
+    for snapshot in range(1, 6):
+
+        history.commit(snapshot)
+
+    # Keeps only the three most recent previous snapshots.
+    assert [history.undo() for _ in range(4)] == [True, True, True, False]
+    assert history.current == 2
+
+    assert history.redo() and history.current == 3
+
+    history.commit(10)
+
+    assert not history.can_redo
+    assert history.undo() and history.current == 3
+
+    with pytest.raises(ValueError, match="Invalid limit"):
+
+        History(0, limit=0)
+
+
+
+def test_chord_history():
+
+    chord = Chord()
+
+    editor = ChordHistory(chord)
+
+    editor.add_or_remove_interval_type_and_attributes(ThirteenthType.MAJOR)
+    editor.set_new_root(RootType.G)
+    editor.add_or_remove_interval_type_and_attributes(ThirdType.MINOR)
+
+    assert chord.get_note_signature() == ["G", "Bb", "D", "F", "A", "C", "E"]
+
+    assert editor.undo()
+    assert chord.get_note_signature() == ["G", "B", "D", "F", "A", "C", "E"]
+
+    assert editor.undo() and editor.undo()
+    assert chord.get_note_signature() == ["C", "E", "G"]
+    assert not editor.undo()
+
+    assert editor.redo()
+    assert chord.get_note_signature() == ["C", "E", "G", "Bb", "D", "F", "A"]
+
+
+
+def test_chord_history_restores_the_bass_note():
+
+    chord = parse_chord("C")
+
+    editor = ChordHistory(chord)
+
+    editor.invert(1)
+    editor.set_new_root(RootType.D)
+    editor.set_bass("C")
+
+    assert chord.bass_note == "C"
+
+    assert editor.undo()
+    assert (chord.bass_note, chord.inversion) == ("F#", 1)
+
+    assert editor.undo() and editor.undo()
+    assert (chord.bass_note, chord.inversion) == ("C", 0)
+
+    assert editor.redo() and editor.redo() and editor.redo()
+    assert (chord.get_note_signature(), chord.bass_note) == (["D", "F#", "A"], "C")
+
+    # A slash bass note below the root note round-trips through its state.
+    assert Chord.from_state(chord.state()).get_bass_note_signature() == ["C", "D", "F#", "A"]
+
+
+
+def test_restore_only_invalidates_changed_interval_names():
+
+    chord = Chord()
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+
+    snapshot = chord.snapshot()
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+    chord.get_interval_signature()
+
+    chord.restore(snapshot)
+
+    assert set(chord._intervals) == {"root", "second", "third", "fourth", "fifth", "sixth", "ninth", "eleventh", "thirteenth"}
+    assert chord.get_interval_signature() == [0, 4, 7, 10]
+
+
+
+def test_progression_snapshot_matches_list_operations():
+
+    rng = random.Random(0)
+
+    expected = list(range(300))
+
+    snapshot = ProgressionSnapshot.from_chord_ids(expected)
+
+    for step in range(500):
+
+        operation = rng.choice(["set", "insert", "delete"]) if expected else "insert"
+
+        if operation == "set":
+
+            index = rng.randrange(len(expected))
+
+            expected[index] = step
+            snapshot = snapshot.set(index, step)
+
+        elif operation == "insert":
+
+            index = rng.randrange(len(expected) + 1)
+
+            expected.insert(index, step)
+            snapshot = snapshot.insert(index, step)
+
+        else:
+
+            index = rng.randrange(len(expected))
+
+            del expected[index]
+            snapshot = snapshot.delete(index)
+
+        assert len(snapshot) == len(expected)
+
+    assert list(snapshot) == expected
+    assert all(len(chunk) < 2 * CHUNK_SIZE for chunk in snapshot.chunks)
+
+
+
+def test_progression_snapshot_shares_unchanged_chunks():
+
+    snapshot = ProgressionSnapshot.from_chord_ids(range(10 * CHUNK_SIZE))
+
+    edited = snapshot.set(3 * CHUNK_SIZE, -1)
+
+    shared = [original is chunk for original, chunk in zip(snapshot.chunks, edited.chunks)]
+
+    assert shared.count(False) == 1 and not shared[3]
+    assert snapshot[3 * CHUNK_SIZE] == 3 * CHUNK_SIZE and edited[3 * CHUNK_SIZE] == -1
+
+
+
+def test_progression_history():
+
+    editor = ProgressionHistory([parse_chord(symbol) for symbol in ["Dm7", "G7", "Cmaj7"]], limit=10)
+
+    editor.add_or_remove_interval_type_and_attributes(1, ThirteenthType.MAJOR)
+    editor.append_chord(parse_chord("A7"))
+    editor.set_new_root(0, RootType.E)
+    editor.remove_chord(2)
+
+    assert [chord.get_note_signature()[0] for chord in editor.chords()] == ["E", "G", "A"]
+
+    assert editor.undo() and editor.undo()
+    assert [chord.get_note_signature() for chord in editor.chords()][:2] == [["D", "F", "A", "C"], ["G", "B", "D", "F", "A", "C", "E"]]
+
+    assert editor.redo()
+    assert [chord.get_note_signature()[0] for chord in editor.to_progression()] == ["E", "G", "C", "A"]
+
+
+
+def test_progression_snapshot_equality():
+
+    snapshot = ProgressionSnapshot.from_chord_ids(range(4 * CHUNK_SIZE))
+
+    edited = snapshot.set(CHUNK_SIZE, -1)
+
+    assert snapshot != edited and edited.set(CHUNK_SIZE, CHUNK_SIZE) == snapshot
+
+    # Compares the chord states, rather than the chunks, of snapshots that are split differently.
+    resplit = snapshot.insert(0, -1).delete(0)
+
+    assert [len(chunk) for chunk in resplit.chunks] == [len(chunk) for chunk in snapshot.chunks] and resplit == snapshot
+    assert ProgressionSnapshot((tuple(range(CHUNK_SIZE + 1)), tuple(range(CHUNK_SIZE + 1, 4 * CHUNK_SIZE)))) == snapshot
+
+    assert snapshot.with_tuning(get_tuning("24-TET")) != snapshot
+
+
+
+def test_progression_history_restores_bass_notes_and_tuning():
+
+    chord = parse_chord("C")
+
+    chord.invert(1)
+
+    editor = ProgressionHistory([chord, parse_chord("D/C")])
+
+    assert [editor.chord(index).get_bass_note_signature() for index in range(2)] == [["E", "G", "C"], ["C", "D", "F#", "A"]]
+
+    editor.set_new_root(0, RootType.F)
+
+    assert editor.chord(0).bass_note == "A"
+
+    editor.set_tuning(get_tuning("24-TET"))
+
+    assert editor.chord(1).tuning is get_tuning("24-TET")
+
+    assert editor.undo() and editor.tuning is None
+    assert editor.undo() and editor.chord(0).bass_note == "E"
+
+    # Stores only the chord IDs in a progression, in root position.
+    assert [chord.get_note_signature()[0] for chord in editor.to_progression()] == ["C", "D"]
@@ -0,0 +1,91 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+# Stores the project root directory, so that the package is imported from a clean interpreter.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Defines the import time budget for the package, in seconds.
+IMPORT_TIME_BUDGET = 0.15
+
+def _run_in_clean_interpreter(code: str, cwd: Path) -> dict:
+
+    """
+    Runs the code in a new interpreter with the project root on the Python path, and returns the JSON it prints.
+    
+    """
+
+    result = subprocess.run([sys.executable, "-c", code], 
+                            cwd=cwd, 
+                            env={"PYTHONPATH": str(PROJECT_ROOT)}, 
+                            capture_output=True, 
+                            text=True, 
+                            check=True)
+
+    return json.loads(result.stdout)
+
+
+
+def test_import_has_no_side_effects(tmp_path):
+
+    """
+    Importing the package does not change the Python path, create files, print, or import the database and demo modules.
+    
+    """
+
+    code = """
+import json, sys
+path = list(sys.path)
+import app
+from app import Chord
+Chord().get_note_signature()
+print(json.dumps({"path_changed": sys.path != path, "modules": sorted(sys.modules)}))
+"""
+
+    result = _run_in_clean_interpreter(code, tmp_path)
+
+    assert result["path_changed"] is False
+    assert list(tmp_path.iterdir()) == []
+
+    for module in ("sqlite3", "numpy", "app.demo", "app.library.intervals"):
+
+        assert module not in result["modules"]
+
+
+
+def test_heavy_submodules_load_lazily(tmp_path):
+
+    code = """
+import json, sys
+import app
+before = "app.library.intervals" in sys.modules
+rows = app.intervals.INTERVALS_DATA
+print(json.dumps({"before": before, "after": "app.library.intervals" in sys.modules, "rows": len(rows)}))
+"""
+
+    result = _run_in_clean_interpreter(code, tmp_path)
+
+    assert result == {"before": False, "after": True, "rows": 15}
+
+
+
+def test_import_time_budget(tmp_path):
+
+    """
+    Measures the time taken to import the package and construct a chord, taking the fastest of several runs.
+    
+    """
+
+    code = """
+import json, time
+start = time.perf_counter()
+from app import Chord
+Chord()
+print(json.dumps({"seconds": time.perf_counter() - start}))
+"""
+
+    seconds = min(_run_in_clean_interpreter(code, tmp_path)["seconds"] for _ in range(3))
+
+    assert seconds < IMPORT_TIME_BUDGET
@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+from app import instrumentation
+from app.chord import Chord
+from app.library.enums import RootType, SeventhType
+
+def test_instrumentation_disabled_uses_original_methods():
+
+    """
+    While instrumentation is disabled, the chord engine calls its original methods and records nothing.
+    
+    """
+
+    original_method = Chord.__dict__["set_new_root"]
+
+    assert not instrumentation.is_enabled()
+
+    with instrumentation.profiling():
+
+        assert Chord.__dict__["set_new_root"] is not original_method
+
+    assert Chord.__dict__["set_new_root"] is original_method
+
+    instrumentation.reset()
+
+    Chord().set_new_root(RootType.G)
+
+    assert instrumentation.report() == {}
+
+
+
+def test_profiling_collects_calls_latencies_and_cache_hits():
+
+    with instrumentation.profiling():
+
+        chord = Chord()
+
+        chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+        chord.get_note_signature()
+        chord.get_note_signature()
+        chord.set_new_root(RootType.D)
+        chord.get_note_signature()
+
+    report = instrumentation.report()
+
+    assert report["Chord.__init__"]["calls"] == 1
+    assert report["Chord.set_new_root"]["calls"] == 1
+    assert report["Chord.add_or_remove_interval_type_and_attributes"]["calls"] == 1
+    assert report["Chord.calculate_note_and_interval"]["calls"] == 8
+
+    assert report["Chord.get_note_signature"]["calls"] == 3
+    assert report["Chord.get_note_signature"]["cache_hits"] == 1
+    assert report["Chord.get_note_signature"]["cache_misses"] == 2
+
+    assert report["Chord.set_new_root"]["p99_us"] >= report["Chord.set_new_root"]["p50_us"] > 0
+
+    assert json.loads(instrumentation.export_json()) == json.loads(json.dumps(report))
+    assert not instrumentation.is_enabled()
+
+
+
+def test_profiling_enabled_by_environment_variable():
+
+    code = """
+from app import instrumentation
+from app.chord import Chord
+Chord().get_interval_signature()
+print(instrumentation.export_json())
+"""
+
+    result = subprocess.run([sys.executable, "-c", code], 
+                            cwd=Path(__file__).resolve().parent.parent, 
+                            env={instrumentation.PROFILE_ENV_VARIABLE: "1"}, 
+                            capture_output=True, 
+                            text=True, 
+                            check=True)
+
+    assert json.loads(result.stdout)["Chord.get_interval_signature"]["calls"] == 1
@@ -0,0 +1,174 @@
+import pickle
+
+import pytest
+
+from app.chord import Chord
+from app.inversions import all_inversions, identify, inversion_catalog
+from app.library.enums import RootType, ThirdType
+from app.symbols import parse_chord
+from app.tuning import get_tuning
+from app.utils import enumerate_shapes, invert_interval_signature, mask_bits, pitch_classes, pitch_class_mask, rotate_mask, rotate_masks
+
+def test_invert_interval_signature_rotates_pitch_classes():
+
+    assert invert_interval_signature([0, 4, 7], 4) == [0, 3, 8]
+    assert invert_interval_signature([0, 4, 7], 7) == [0, 5, 9]
+    assert invert_interval_signature([0, 4, 7, 10, 14], 4) == [0, 3, 6, 8, 10]
+
+    # Adds a bass note that is not a chord tone below the chord.
+    assert invert_interval_signature([0, 4, 7], 10) == [0, 2, 6, 9]
+
+    assert rotate_mask(pitch_class_mask([0, 4, 7]), -4) == pitch_class_mask([0, 3, 8])
+
+
+    # Rotates every mask at once, as rotate_mask does one at a time.
+    masks = list(range(0, 1 << 12, 37))
+
+    assert list(rotate_masks(masks, -4)) == [rotate_mask(mask, -4) for mask in masks]
+    assert [pitch_class for pitch_class, bit in enumerate(mask_bits()[pitch_class_mask([0, 4, 7])]) if bit] == [0, 4, 7]
+
+    # Keeps the major triad as the simplest shape of its quality mask.
+    assert pitch_class_mask([0, 4, 7]) in enumerate_shapes()
+
+
+
+def test_chord_inversions_and_slash_bass():
+
+    chord = parse_chord("Cmaj7")
+
+    assert (chord.bass_note, chord.inversion) == ("C", 0)
+
+    chord.invert(2)
+
+    assert (chord.bass_note, chord.inversion) == ("G", 2)
+    assert chord.get_bass_interval_signature() == [0, 4, 5, 9]
+    assert chord.get_bass_note_signature() == ["G", "B", "C", "E"]
+
+    # Changing an interval type regenerates the signature above the bass note.
+    chord.add_or_remove_interval_type_and_attributes(chord.seventh_type)
+
+    assert chord.get_bass_interval_signature() == [0, 5, 9]
+
+    slash_chord = parse_chord("D/C")
+
+    assert (slash_chord.bass_note, slash_chord.inversion) == ("C", None)
+    assert slash_chord.get_bass_note_signature() == ["C", "D", "F#", "A"]
+
+    assert pickle.loads(pickle.dumps(slash_chord)).bass_note == "C"
+
+    with pytest.raises(ValueError, match="Invalid inversion"):
+
+        chord.invert(3)
+
+    with pytest.raises(ValueError, match="Invalid bass note"):
+
+        chord.set_bass("H")
+
+    # Rejects an inversion of a chord whose root note has been removed.
+    rootless = parse_chord("C")
+
+    rootless.set_new_root(None)
+
+    with pytest.raises(ValueError, match="Invalid chord: the chord must have a root note."):
+
+        rootless.invert(0)
+
+
+
+def test_inversion_with_a_triple_flat_bass_note():
+
+    chord = parse_chord("Cbdim7")
+
+    chord.invert(3)
+
+    assert (chord.bass_note, chord.bass_index, chord.inversion) == ("Bbbb", 8, 3)
+    assert chord.get_bass_note_signature() == ["Bbbb", "Cb", "Ebb", "Gbb"]
+
+
+
+def test_slash_bass_notes_with_double_accidentals():
+
+    chord = parse_chord("Ebdim7/Bbb")
+
+    assert (chord.get_note_signature(), chord.bass_note, chord.inversion) == (["Eb", "Gb", "Bbb", "Dbb"], "Bbb", 2)
+
+    assert parse_chord("G#/F##").get_bass_note_signature() == ["F##", "G#", "B#", "D#"]
+
+
+
+def test_bass_note_follows_the_root_note_and_interval_types():
+
+    chord = parse_chord("C")
+
+    chord.invert(1)
+    chord.set_new_root(RootType.D)
+
+    assert (chord.bass_note, chord.inversion) == ("F#", 1)
+
+    # The inversion follows the chord tone, and returns to root position when the chord tone is removed.
+    chord.third_type = ThirdType.MINOR
+
+    assert (chord.bass_note, chord.inversion) == ("F", 1)
+
+    chord.third_type = None
+
+    assert (chord.bass_note, chord.inversion) == ("D", 0)
+
+    slash_chord = parse_chord("D/C")
+
+    slash_chord.set_new_root(RootType.E)
+
+    assert (slash_chord.bass_note, slash_chord.inversion) == ("D", None)
+    assert pickle.loads(pickle.dumps(slash_chord)).get_bass_note_signature() == ["D", "E", "G#", "B"]
+
+    inverted = parse_chord("G7")
+
+    inverted.invert(3)
+
+    assert pickle.loads(pickle.dumps(inverted)).bass_note == "F"
+
+
+
+def test_inversions_in_other_tunings():
+
+    chord = Chord(get_tuning("31-TET"))
+
+    chord.set_bass(RootType.E)
+
+    assert chord.get_bass_interval_signature() == [0, 8, 21]
+
+
+
+def test_all_inversions_match_rotated_masks():
+
+    chords = [parse_chord(symbol) for symbol in ("C", "Am7", "F#m7b5")]
+
+    inversions = all_inversions(chords)
+
+    for chord, row in zip(chords, inversions.tolist()):
+
+        intervals = chord.get_interval_signature()
+
+        for interval in range(12):
+
+            expected = pitch_class_mask(invert_interval_signature(intervals, interval)) if interval in {value % 12 for value in intervals} else 0
+
+            assert row[interval] == expected
+
+
+
+def test_identify_every_inversion():
+
+    assert sum(len(candidates) for candidates in inversion_catalog().values()) > len(inversion_catalog())
+
+    for symbol in ("C/E", "Bbmaj7/D", "Am7/G", "D/C"):
+
+        chord = parse_chord(symbol)
+
+        mask = pitch_class_mask(pitch_classes(chord.get_note_signature()) + [chord.bass_index])
+
+        candidates = identify(mask, chord.bass_index)
+
+        assert any(candidate.get_bass_note_signature() == chord.get_bass_note_signature() for candidate in candidates)
+
+    assert identify(pitch_class_mask([0, 4, 7]), 4)[0].get_note_signature() == ["C", "E", "G"]
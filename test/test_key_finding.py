@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from app.key_finding import Key, KeyFinder, find_keys
+from app.library.enums import RootType, ThirdType, SeventhType
+from test.conftest import build_chord
+
+C_MAJOR_PROGRESSION = [build_chord(RootType.C), build_chord(RootType.F), build_chord(RootType.G, SeventhType.MINOR), build_chord(RootType.C)]
+
+A_MINOR_PROGRESSION = [build_chord(RootType.A, ThirdType.MINOR), build_chord(RootType.D, ThirdType.MINOR), build_chord(RootType.E, SeventhType.MINOR), build_chord(RootType.A, ThirdType.MINOR)]
+
+E_MAJOR_PROGRESSION = [build_chord(RootType.E), build_chord(RootType.A), build_chord(RootType.B, SeventhType.MINOR), build_chord(RootType.E)]
+
+
+
+def test_key_finder_progressions():
+
+    assert list(KeyFinder().stream(C_MAJOR_PROGRESSION))[-1] == Key(0, "major")
+    assert list(KeyFinder().stream(A_MINOR_PROGRESSION))[-1] == Key(9, "minor")
+    assert Key(9, "minor").name == "A minor"
+
+
+
+def test_key_finder_sliding_window():
+
+    """
+    Once the window has slid past the first progression, the estimate follows the chords that remain in the window.
+    
+    """
+
+    key_finder = KeyFinder(window=4)
+
+    keys = list(key_finder.stream(C_MAJOR_PROGRESSION + E_MAJOR_PROGRESSION))
+
+    assert keys[3] == Key(0, "major")
+    assert keys[-1] == Key(4, "major")
+
+    # Compares the incremental statistics with a histogram of the final window calculated from scratch.
+    fresh_key_finder = KeyFinder(window=4)
+
+    list(fresh_key_finder.stream(E_MAJOR_PROGRESSION))
+
+    assert key_finder.histogram == fresh_key_finder.histogram
+
+    for key, score in fresh_key_finder.scores().items():
+
+        assert key_finder.scores()[key] == pytest.approx(score)
+
+
+
+def test_key_finder_empty_window():
+
+    key_finder = KeyFinder()
+
+    assert key_finder.key is None
+
+    with pytest.raises(ValueError, match=r"Invalid window"):
+
+        KeyFinder(window=0)
+
+
+
+def test_find_keys_matches_incremental_key_finder():
+
+    progressions = [C_MAJOR_PROGRESSION, A_MINOR_PROGRESSION, E_MAJOR_PROGRESSION, []]
+
+    keys = find_keys(progressions)
+
+    assert keys == [list(KeyFinder(window=100).stream(progression))[-1] for progression in progressions[:3]] + [None]
+
+
+
+def test_key_finder_latency_per_chord():
+
+    chords = (C_MAJOR_PROGRESSION + A_MINOR_PROGRESSION + E_MAJOR_PROGRESSION) * 100
+
+    key_finder = KeyFinder(window=16)
+
+    start = time.perf_counter()
+
+    for _ in key_finder.stream(chords):
+
+        pass
+
+    assert (time.perf_counter() - start) / len(chords) < 0.001
@@ -0,0 +1,107 @@
+import io
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from app.main import describe_chord, run
+from app.symbols import parse_chord, parse_spec, parse_symbol
+
+# Stores the project root directory, which the command-line entry point is run from.
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+LINES = ["Cmaj7", "F#m7b5", "", "root=Bb seventh=MINOR", "H7", "C13#11"] * 3
+
+
+
+@pytest.mark.parametrize("symbol, expected_note_signature", [
+
+    ("C", ["C", "E", "G"]),
+    ("Bbm7b5", ["Bb", "Db", "Fb", "Ab"]),
+    ("F#maj9", ["F#", "A#", "C#", "E#", "G#"]),
+    ("C13#11", ["C", "E", "G", "Bb", "D", "F#", "A"]),
+    ("Dsus4add9", ["D", "G", "A", "E"]),
+    ("Ebdim7", ["Eb", "Gb", "Bbb", "Dbb"]),
+    ("CmMaj7", ["C", "Eb", "G", "B"]),
+    ("G7(b9)", ["G", "B", "D", "F", "Ab"]),
+
+])
+def test_parse_symbol(symbol, expected_note_signature):
+
+    assert parse_chord(symbol).get_note_signature() == expected_note_signature
+
+
+
+def test_parse_spec():
+
+    assert parse_chord("root=F# third=MINOR seventh=MINOR").get_note_signature() == ["F#", "A", "C#", "E"]
+    assert parse_chord("root=b_flat fifth=none").get_note_signature() == ["Bb", "D"]
+
+    with pytest.raises(ValueError, match="Invalid interval_type"):
+
+        parse_spec("third=FLAT")
+
+    with pytest.raises(ValueError, match="Invalid interval name"):
+
+        parse_spec("twelfth=MAJOR")
+
+    with pytest.raises(ValueError, match="Invalid chord symbol"):
+
+        parse_symbol("Cxyz")
+
+
+
+def _run(lines, **options):
+
+    stdout = io.BytesIO()
+
+    run(io.BytesIO("\n".join(lines).encode("utf-8")), stdout, **options)
+
+    return [json.loads(line) for line in stdout.getvalue().decode("utf-8").splitlines()]
+
+
+
+@pytest.mark.parametrize("options", [{}, {"cache_size": 0}, {"workers": 2}])
+def test_run_streams_json_lines_in_order(options):
+
+    results = _run(LINES, **options)
+
+    assert [result["input"] for result in results] == [line for line in LINES if line]
+    assert results[0] == {"input": "Cmaj7", "notes": ["C", "E", "G", "B"], "intervals": [0, 4, 7, 11], "bass": "C", "interval_types": {"root": "C", "third": "MAJOR", "fifth": "PERFECT", "seventh": "MAJOR"}}
+    assert "error" in results[3]
+    assert results == [json.loads(describe_chord(line)) for line in LINES if line]
+
+
+
+def test_describe_chord_includes_the_slash_bass_note():
+
+    assert json.loads(describe_chord("C/E"))["bass"] == "E"
+    assert json.loads(describe_chord("C"))["bass"] == "C"
+
+
+
+def test_run_describes_undecodable_lines_as_errors():
+
+    stdout = io.BytesIO()
+
+    run(io.BytesIO(b"C\n\xff\xfe7\nG7\n"), stdout)
+
+    results = [json.loads(line) for line in stdout.getvalue().decode("utf-8").splitlines()]
+
+    assert [result["input"] for result in results] == ["C", "\ufffd\ufffd7", "G7"]
+    assert "error" in results[1] and results[2]["notes"] == ["G", "B", "D", "F"]
+
+
+
+def test_command_line():
+
+    completed = subprocess.run([sys.executable, "-m", "app.main", "--cache-size", "16"], input="Am7\nG\n".encode("utf-8"), capture_output=True, cwd=PROJECT_ROOT, check=True)
+
+    assert [json.loads(line)["notes"] for line in completed.stdout.decode("utf-8").splitlines()] == [["A", "C", "E", "G"], ["G", "B", "D"]]
+
+    completed = subprocess.run([sys.executable, "-m", "app.main", "--workers", "0"], input=b"", capture_output=True, cwd=PROJECT_ROOT)
+
+    assert completed.returncode == 2
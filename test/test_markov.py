@@ -0,0 +1,115 @@
+import io
+import random
+
+from collections import Counter
+
+import pytest
+
+from app.key_finding import Key
+from app.library.codes import CHORD_ID_COUNT, SLOT_SIZES, pack_codes, unpack_codes
+from app.library.enums import RootType, ThirdType, SeventhType
+from app.markov import MarkovGenerator, build_alias_table, sample_alias_table, chord_id, chord_from_id, chord_id_mask
+from app.utils import pitch_classes, pitch_class_mask
+from test.conftest import build_chord
+
+I, IV, V7, vi, bVII = build_chord(RootType.C), build_chord(RootType.F), build_chord(RootType.G, SeventhType.MINOR), build_chord(RootType.A, ThirdType.MINOR), build_chord(RootType.B_Flat)
+
+PROGRESSIONS = [[I, IV, V7, I], [I, vi, IV, V7], [I, bVII, IV, I]] * 10
+
+
+
+def test_chord_id_round_trip():
+
+    assert CHORD_ID_COUNT < 2 ** 32
+
+    rng = random.Random(0)
+
+    for _ in range(200):
+
+        codes = tuple(rng.randrange(size) for size in SLOT_SIZES)
+
+        assert unpack_codes(pack_codes(codes)) == codes
+
+    for chord in (I, V7, vi, build_chord(RootType.D_FLAT, SeventhType.MAJOR)):
+
+        restored = chord_from_id(chord_id(chord))
+
+        assert restored.get_note_signature() == chord.get_note_signature()
+        assert chord_id_mask(chord_id(chord)) == pitch_class_mask(pitch_classes(chord.get_note_signature()))
+
+
+
+def test_alias_table_distribution():
+
+    table = build_alias_table({1: 1, 2: 2, 3: 7})
+
+    rng = random.Random(0)
+
+    counts = Counter(sample_alias_table(table, rng.random) for _ in range(50000))
+
+    for outcome, probability in ((1, 0.1), (2, 0.2), (3, 0.7)):
+
+        assert counts[outcome] / 50000 == pytest.approx(probability, abs=0.01)
+
+
+
+def test_generate_follows_trained_transitions():
+
+    generator = MarkovGenerator(order=2, seed=0).train(PROGRESSIONS)
+
+    trained_ids = {chord_id(chord) for progression in PROGRESSIONS for chord in progression}
+
+    for _ in range(100):
+
+        progression = generator.generate_ids(6)
+
+        assert len(progression) == 6
+        assert set(progression) <= trained_ids
+
+        # Starts every progression on the tonic, as every trained progression does.
+        assert progression[0] == chord_id(I)
+
+
+
+def test_constraints():
+
+    generator = MarkovGenerator(order=1, seed=0).train(PROGRESSIONS)
+
+    key = Key(0, "major")
+
+    for _ in range(100):
+
+        progression = generator.generate_ids(5, key=key, stay_in_key=True, end_on_tonic=True)
+
+        assert chord_id(bVII) not in progression
+        assert progression[-1] == chord_id(I)
+
+    with pytest.raises(ValueError, match="Invalid constraints"):
+
+        generator.generate_ids(4, stay_in_key=True)
+
+    with pytest.raises(ValueError, match="Invalid constraints"):
+
+        generator.generate_ids(4, key=Key(6, "major"), end_on_tonic=True)
+
+
+
+def test_save_and_load():
+
+    generator = MarkovGenerator(order=2, seed=0).train(PROGRESSIONS)
+
+    file = io.BytesIO()
+
+    generator.save(file)
+
+    file.seek(0)
+
+    loaded = MarkovGenerator.load(file, seed=0)
+
+    assert loaded.order == 2
+    assert {context: dict(transitions) for context, transitions in loaded.counts.items()} == {context: dict(transitions) for context, transitions in generator.counts.items()}
+    assert loaded.generate_ids(8) == MarkovGenerator(order=2, seed=0).train(PROGRESSIONS).generate_ids(8)
+
+    with pytest.raises(ValueError, match="Invalid file"):
+
+        MarkovGenerator.load(io.BytesIO(b"XXXX" + bytes(6)))
@@ -0,0 +1,120 @@
+import gc
+import io
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from app.musicxml import MusicXMLWriter, describe_harmony, voice_chord, write_musicxml
+from app.progression import Progression
+from app.symbols import parse_chord
+
+
+
+class _CountingStream(io.RawIOBase):
+
+    def __init__(self):
+
+        self.size = 0
+
+    def writable(self):
+
+        return True
+
+    def write(self, data):
+
+        self.size += len(data)
+
+        return len(data)
+
+
+
+def _harmony(symbol):
+
+    harmony = describe_harmony(parse_chord(symbol))
+
+    return harmony.root_step, harmony.root_alter, harmony.kind.kind, [tuple(degree) for degree in harmony.degrees]
+
+def test_harmony_kinds_and_degrees():
+
+    assert _harmony("F#m7b5") == ("F", 1, "half-diminished", [])
+    assert _harmony("Bbmaj9") == ("B", -1, "major-ninth", [])
+    assert _harmony("Ebdim7") == ("E", -1, "diminished-seventh", [])
+    assert _harmony("D13#11") == ("D", 0, "dominant-13th", [(11, 1, "alter")])
+    assert _harmony("C7sus4") == ("C", 0, "suspended-fourth", [(7, 0, "add")])
+    assert _harmony("Cmaj7#11") == ("C", 0, "major-seventh", [(11, 1, "add")])
+    assert _harmony("Cm(maj7)") == ("C", 0, "major-minor", [])
+
+
+
+def test_voicings_put_the_bass_note_lowest():
+
+    assert voice_chord(parse_chord("Dm7")) == [("D", 0, 4), ("F", 0, 4), ("A", 0, 4), ("C", 0, 5)]
+    assert voice_chord(parse_chord("C/E")) == [("E", 0, 4), ("G", 0, 4), ("C", 0, 5)]
+    assert voice_chord(parse_chord("D/C")) == [("C", 0, 4), ("D", 0, 4), ("F", 1, 4), ("A", 0, 4)]
+
+    # The octave belongs to the letter, so Cb sounds a semitone below C5 rather than C4.
+    assert voice_chord(parse_chord("Abm"), 4) == [("A", -1, 4), ("C", -1, 5), ("E", -1, 5)]
+
+
+
+def test_score_is_well_formed_musicxml():
+
+    stream = io.BytesIO()
+
+    assert write_musicxml((parse_chord(symbol) for symbol in ("Dm7", "G7", "Cmaj7", "C/E", "E7b9")), stream, title="ii-V-I", chords_per_measure=2, voicings=True) == 5
+
+    assert b"<!DOCTYPE score-partwise" in stream.getvalue()
+
+    score = ElementTree.fromstring(stream.getvalue())
+
+    measures = score.findall("part/measure")
+
+    assert score.findtext("work/work-title") == "ii-V-I"
+    assert [measure.get("number") for measure in measures] == ["1", "2", "3"]
+
+    # Every measure is filled: the last chord is followed by two quarter rests.
+    for measure in measures:
+
+        assert sum(int(note.findtext("duration")) for note in measure.findall("note") if note.find("chord") is None) == 4
+
+    harmonies = score.findall("part/measure/harmony")
+
+    assert [harmony.findtext("kind") for harmony in harmonies] == ["minor-seventh", "dominant", "major-seventh", "major", "dominant"]
+    assert harmonies[3].findtext("bass/bass-step") == "E"
+    assert [(degree.findtext("degree-value"), degree.findtext("degree-alter"), degree.findtext("degree-type")) for degree in harmonies[4].findall("degree")] == [("9", "-1", "add")]
+
+    with pytest.raises(ValueError, match="Invalid chords_per_measure"):
+
+        MusicXMLWriter(io.BytesIO(), chords_per_measure=3)
+
+
+
+def test_memory_is_constant_in_the_number_of_chords():
+
+    progression = Progression.from_chords(parse_chord(symbol) for symbol in ("Dm7", "G7", "Cmaj7", "A7b9", "F#m7b5", "B7", "Em7", "Ebdim7"))
+
+    def peak(repeats):
+
+        # Collects and disables the garbage collector, so that the peak does not depend on when a collection happens to run.
+        gc.collect()
+        gc.disable()
+
+        tracemalloc.start()
+
+        try:
+
+            write_musicxml((chord for _ in range(repeats) for chord in progression), _CountingStream(), voicings=True)
+
+            return tracemalloc.get_traced_memory()[1]
+
+        finally:
+
+            tracemalloc.stop()
+
+            gc.enable()
+
+    peak(1)
+
+    # Writes 25 times as many chords (2000 rather than 80); a per-chord leak of even one byte would add about 2 KB.
+    assert peak(250) - peak(10) < 1024
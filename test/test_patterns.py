@@ -0,0 +1,104 @@
+from itertools import count, islice
+
+import pytest
+
+from app.chord import Chord
+from app.patterns import Arpeggio, BrokenChord, Comping, NoteEvent, Pattern, perform, track_events, voice_pitches
+from app.symbols import parse_chord
+from app.tuning import get_tuning
+
+
+
+def _pitches(events):
+
+    return [event.pitch for event in events]
+
+def test_voiced_pitches_stack_upwards():
+
+    assert voice_pitches(parse_chord("Cmaj9")) == [60, 64, 67, 71, 74]
+    assert voice_pitches(parse_chord("Bb7"), 3) == [58, 62, 65, 68]
+
+    # Puts the bass note lowest, as a chord tone or below the root note.
+    inverted = parse_chord("C")
+
+    inverted.invert(1)
+
+    assert voice_pitches(inverted) == [64, 67, 72]
+    assert voice_pitches(parse_chord("Cmaj9/D")) == [62, 64, 67, 71, 72]
+    assert voice_pitches(parse_chord("D/C")) == [60, 62, 66, 69]
+
+    chord = parse_chord("C")
+
+    chord.set_new_root(None)
+
+    with pytest.raises(ValueError, match="Invalid chord"):
+
+        voice_pitches(chord)
+
+    with pytest.raises(ValueError, match="12 divisions"):
+
+        voice_pitches(Chord.from_interval_types(parse_chord("C").get_interval_types(), get_tuning("24-TET")))
+
+
+
+def test_arpeggios_and_broken_chords():
+
+    c_major = [parse_chord("C")]
+
+    assert _pitches(track_events(c_major, Arpeggio("up", step=1.0))) == [60, 64, 67, 60]
+    assert _pitches(track_events(c_major, Arpeggio("down", step=0.5))) == [67, 64, 60, 67, 64, 60, 67, 64]
+    assert _pitches(track_events(c_major, Arpeggio("up_down", octaves=2, step=0.5))) == [60, 64, 67, 72, 76, 79, 76, 72]
+
+    # Positions past the voiced chord move up an octave, and negative positions move down.
+    assert _pitches(track_events(c_major, BrokenChord((-3, 0, 3, 2), step=1.0))) == [48, 60, 72, 67]
+
+    events = list(track_events(c_major, BrokenChord(step=1.0, gate=0.5, accent=20, velocity=90)))
+
+    assert [event.velocity for event in events] == [110, 90, 90, 90]
+    assert {event.duration for event in events} == {0.5}
+
+    with pytest.raises(ValueError, match="Invalid direction"):
+
+        Arpeggio("sideways")
+
+    # Requires a subclass to implement notes().
+    with pytest.raises(TypeError):
+
+        Pattern()
+
+
+
+def test_comping_stops_at_the_end_of_each_chord():
+
+    events = list(track_events([parse_chord("Dm7"), parse_chord("G7")], Comping(((0.0, 1.0), (1.5, 0.5), (2.5, 1.0)), channel=2), beats=[2.0, 4.0]))
+
+    assert sorted({event.time for event in events}) == [0.0, 1.5, 2.0, 3.5, 4.5]
+    assert [event.pitch for event in events if event.time == 2.0] == [67, 71, 74, 77]
+    assert {event.channel for event in events} == {2}
+
+    with pytest.raises(ValueError, match="Invalid rhythm"):
+
+        Comping(((4.0, 1.0),))
+
+
+
+def test_tracks_are_merged_lazily_in_time_order():
+
+    consumed = []
+
+    def endless_progression():
+
+        for index in count():
+
+            consumed.append(index)
+
+            yield parse_chord(("Dm7", "G7", "Cmaj7")[index % 3])
+
+    events = list(islice(perform(endless_progression(), [Arpeggio(step=0.25, channel=0), Comping(channel=1, octave=3)]), 200))
+
+    assert all(isinstance(event, NoteEvent) for event in events)
+    assert [event.time for event in events] == sorted(event.time for event in events)
+    assert {event.channel for event in events} == {0, 1}
+
+    # Only the chords reached by the first 200 events have been read from the endless progression.
+    assert len(consumed) < 10
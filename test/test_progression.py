@@ -0,0 +1,127 @@
+import pickle
+
+import pytest
+
+from app.chord import Chord
+from app.chord_array import ChordArray
+from app.library.enums import RootType, ThirteenthType
+from app.progression import Progression, PROGRESSION_HEADER
+from app.symbols import parse_chord
+from app.tuning import Tuning, get_tuning
+
+SYMBOLS = ["Dm7", "G7", "Cmaj7", "A7b9", "Dbmaj7", "F#m7b5", "Ebdim7", "C13#11"]
+
+
+
+def test_chord_bytes_round_trip():
+
+    for symbol in SYMBOLS:
+
+        chord = parse_chord(symbol)
+
+        data = chord.to_bytes()
+
+        assert len(data) == 4
+        assert Chord.from_bytes(data).get_interval_types() == chord.get_interval_types()
+
+    with pytest.raises(ValueError, match="Invalid data"):
+
+        Chord.from_bytes(b"\x00\x01")
+
+    with pytest.raises(ValueError, match="Invalid data"):
+
+        Chord.from_bytes(b"\xff\xff\xff\xff")
+
+
+
+def test_chord_pickles_compactly():
+
+    chord = Chord(get_tuning("19-TET"))
+
+    chord.set_new_root(RootType.D_FLAT)
+    chord.add_or_remove_interval_type_and_attributes(ThirteenthType.MAJOR)
+
+    # Pickles the chord after its caches have been filled, which are not included.
+    chord.get_note_signature()
+
+    data = pickle.dumps(chord)
+
+    restored = pickle.loads(data)
+
+    assert len(data) < 100
+    assert restored.tuning is get_tuning("19-TET")
+    assert restored.get_note_signature() == chord.get_note_signature()
+    assert restored.get_interval_signature() == chord.get_interval_signature()
+
+    # Pickles a tuning that is not registered whole, rather than by a name that could not be looked up.
+    chord = Chord(Tuning("17-TET", 17))
+
+    chord.set_new_root(RootType.D)
+
+    restored = pickle.loads(pickle.dumps(chord))
+
+    assert (restored.tuning.name, restored.tuning.divisions) == ("17-TET", 17)
+    assert restored.get_note_signature() == chord.get_note_signature()
+
+
+
+def test_progression_round_trip():
+
+    chords = [parse_chord(symbol) for symbol in SYMBOLS]
+
+    progression = Progression.from_chords(chords)
+
+    data = progression.to_bytes()
+
+    assert len(data) == PROGRESSION_HEADER.size + 4 * len(chords)
+
+    restored = Progression.from_bytes(data)
+
+    assert restored == progression
+    assert len(restored) == len(chords)
+    assert [chord.get_note_signature() for chord in restored] == [chord.get_note_signature() for chord in chords]
+    assert [chord.get_note_signature() for chord in restored[2:4]] == [chord.get_note_signature() for chord in chords[2:4]]
+
+
+
+def test_progression_decoding_is_zero_copy():
+
+    data = bytearray(Progression.from_chords([parse_chord(symbol) for symbol in SYMBOLS]).to_bytes())
+
+    progression = Progression.from_bytes(data)
+
+    assert isinstance(progression.chord_ids, memoryview)
+
+    # Overwrites the first chord in the underlying buffer, which the progression reads directly.
+    data[PROGRESSION_HEADER.size:PROGRESSION_HEADER.size + 4] = parse_chord("E").to_bytes()
+
+    assert progression[0].get_note_signature() == ["E", "G#", "B"]
+
+
+
+def test_progression_to_chord_array():
+
+    chords = [parse_chord(symbol) for symbol in SYMBOLS]
+
+    chord_array = Progression.from_bytes(Progression.from_chords(chords).to_bytes()).to_chord_array()
+
+    expected = ChordArray.from_chords(chords)
+
+    assert chord_array.note_names() == expected.note_names()
+    assert (chord_array.root_index == expected.root_index).all()
+
+
+
+def test_progression_invalid_data():
+
+    with pytest.raises(ValueError, match="Invalid data"):
+
+        Progression.from_bytes(b"CHPR")
+
+    with pytest.raises(ValueError, match="Invalid data"):
+
+        Progression.from_bytes(PROGRESSION_HEADER.pack(b"XXXX", 1, 0))
+
+    with pytest.raises(ValueError, match="Invalid data"):
+
+        Progression.from_bytes(PROGRESSION_HEADER.pack(b"CHPR", 1, 3) + bytes(4))
@@ -0,0 +1,108 @@
+from enum import Enum
+
+import pytest
+
+from app.chord import Chord
+from app.library.codes import SLOT_TYPES
+from app.library.enums import NinthType, SeventhType
+from app.registry import INTERVAL_FAMILIES, interval_family, register_interval_family, register_interval_name, unregister_interval_family, unregister_interval_name
+from app.tuning import get_tuning
+from config.config import INTERVAL_DICT, INTERVAL_SLOT_NAMES
+
+class AlteredNinthType(Enum):
+
+    FLAT_NINE = "minor_ninth"
+    SHARP_NINE = "augmented_ninth"
+
+@pytest.fixture
+def altered_ninths():
+
+    register_interval_name("augmented_ninth", 15, 9)
+
+    try:
+
+        yield register_interval_family(AlteredNinthType, "ninth")
+
+    finally:
+
+        unregister_interval_family(AlteredNinthType)
+        unregister_interval_name("augmented_ninth")
+
+def test_built_in_families():
+
+    for slot_index, (interval_name, slot_type) in enumerate(zip(INTERVAL_SLOT_NAMES, SLOT_TYPES)):
+
+        family = INTERVAL_FAMILIES[slot_type]
+
+        assert (family.interval_name, family.slot_index) == (interval_name, slot_index)
+
+    assert interval_family(NinthType.MINOR).semitones[NinthType.MINOR] == INTERVAL_DICT["minor_ninth"]
+
+    with pytest.raises(ValueError, match="Invalid interval_type"):
+
+        interval_family(AlteredNinthType.SHARP_NINE)
+
+
+
+def test_plug_in_family_without_editing_chord(altered_ninths):
+
+    assert altered_ninths.semitones[AlteredNinthType.SHARP_NINE] == 15
+
+    chord = Chord()
+
+    chord.add_or_remove_interval_type_and_attributes(AlteredNinthType.SHARP_NINE)
+
+    # The ninth's dependency on the seventh is resolved as for built-in interval types.
+    assert chord.seventh_type == SeventhType.MINOR
+    assert chord.get_note_signature() == ["C", "E", "G", "Bb", "D#"]
+    assert chord.get_interval_signature() == [0, 4, 7, 10, 15]
+
+    # Adding the same interval type again removes it.
+    chord.add_or_remove_interval_type_and_attributes(AlteredNinthType.SHARP_NINE)
+
+    assert chord.ninth_type is None
+
+    # Plug-in interval types cannot be packed into a chord ID.
+    chord.add_or_remove_interval_type_and_attributes(AlteredNinthType.FLAT_NINE)
+
+    with pytest.raises(ValueError, match="cannot be packed"):
+
+        chord.snapshot()
+
+
+
+def test_registered_interval_names_reach_every_tuning(altered_ninths):
+
+    assert get_tuning("19-TET").interval_steps["augmented_ninth"] == get_tuning("19-TET").interval_steps["major_ninth"] + 1
+
+    with pytest.raises(ValueError, match="Invalid interval"):
+
+        register_interval_name("augmented_ninth", 16, 4)
+
+    with pytest.raises(ValueError, match="Invalid interval_type"):
+
+        register_interval_family(Enum("DoubleSharpNinthType", {"SHARP_SHARP_NINE": "doubly_augmented_ninth"}), "ninth")
+
+    with pytest.raises(ValueError, match="built in"):
+
+        unregister_interval_family(NinthType)
+
+    with pytest.raises(ValueError, match="built in"):
+
+        unregister_interval_name("major_ninth")
+
+
+
+def test_unregistered_interval_names_are_removed():
+
+    register_interval_name("augmented_octave", 13, 7)
+
+    try:
+
+        assert get_tuning("12-TET").interval_steps["augmented_octave"] == 13
+
+    finally:
+
+        unregister_interval_name("augmented_octave")
+
+    assert "augmented_octave" not in INTERVAL_DICT and "augmented_octave" not in get_tuning("12-TET").interval_steps
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from app.key_finding import Key
+from app.markov import chord_from_id
+from app.reharmonisation import Reharmoniser, SubstitutionRule, SUBSTITUTION_RULES, register_rule, reharmonise
+from app.symbols import parse_chord
+
+C_MAJOR = Key(0, "major")
+
+def _substitutes(reharmoniser, symbol, rule):
+
+    substitutions = {substitution.rule: substitution.chord_ids for substitution in reharmoniser.substitutions(parse_chord(symbol).snapshot(), C_MAJOR)}
+
+    if rule not in substitutions:
+
+        return None
+
+    return [" ".join(chord_from_id(chord_id).get_note_signature()) for chord_id in substitutions[rule]]
+
+def test_substitution_rules():
+
+    reharmoniser = Reharmoniser()
+
+    assert _substitutes(reharmoniser, "G7", "tritone_substitution") == ["Db F Ab Cb"]
+    assert _substitutes(reharmoniser, "G7", "backdoor_progression") == ["F Ab C Eb", "Bb D F Ab"]
+    assert _substitutes(reharmoniser, "Cmaj7", "relative_chord") == ["A C E G"]
+    assert _substitutes(reharmoniser, "Dm7", "secondary_dominant") == ["A C# E G", "D F A C"]
+    assert _substitutes(reharmoniser, "F", "modal_interchange") == ["F Ab C"]
+
+    # The tonic has no secondary dominant, and a dominant seventh chord has no relative chord.
+    assert _substitutes(reharmoniser, "C", "secondary_dominant") is None
+    assert _substitutes(reharmoniser, "G7", "relative_chord") is None
+
+    with pytest.raises(ValueError, match="Invalid rule"):
+
+        Reharmoniser(rules=["plagal"])
+
+
+
+def test_each_source_chord_is_expanded_once():
+
+    calls = []
+
+    register_rule(SubstitutionRule("counting", 0.0, lambda root_index, quality_mask, key: calls.append(root_index)))
+
+    try:
+
+        reharmoniser = Reharmoniser()
+
+        progression = [parse_chord(symbol) for symbol in ("Dm7", "G7", "Cmaj7", "Cmaj7") * 8]
+
+        reharmoniser.search(progression, C_MAJOR)
+        reharmoniser.search(progression, C_MAJOR)
+
+        assert len(calls) == 3
+
+    finally:
+
+        del SUBSTITUTION_RULES["counting"]
+
+
+
+def test_search_returns_distinct_ranked_reharmonisations():
+
+    progression = [parse_chord(symbol) for symbol in ("Cmaj7", "Am7", "Dm7", "G7", "Cmaj7")]
+
+    results = reharmonise(progression, C_MAJOR, k=8)
+
+    assert len(results) == 8
+    assert len({result.chord_ids for result in results}) == 8
+    assert [result.score for result in results] == sorted((result.score for result in results), reverse=True)
+
+    for result in results:
+
+        assert len(result.rules) == len(progression)
+        assert len(result.chord_ids) == len(progression) + sum(rule in ("secondary_dominant", "backdoor_progression") for rule in result.rules)
+
+    # Without substitution rules, the only reharmonisation is the source progression.
+    (result,) = Reharmoniser(rules=[]).search(progression, C_MAJOR, k=3)
+
+    assert result.chord_ids == tuple(chord.snapshot() for chord in progression)
+
+
+
+def test_full_song_search_is_fast():
+
+    progression = [parse_chord(symbol) for symbol in ("Cmaj7 Am7 Dm7 G7 Em7 A7 Dm7 G7 Cmaj7 C7 Fmaj7 Fm7 Em7 A7 Dm7 G7 " * 2).split()]
+
+    reharmoniser = Reharmoniser()
+
+    start = time.perf_counter()
+
+    results = reharmoniser.search(progression, k=5)
+
+    # Allows generous headroom over the target of 100 ms, for slow test machines.
+    assert time.perf_counter() - start < 1.0
+    assert len(results) == 5
@@ -0,0 +1,78 @@
+import pytest
+
+from app.chord import Chord
+from app.chord_array import ChordArray
+from app.key_finding import Key
+from app.library.enums import RootType, ThirdType, FifthType, SeventhType, ThirteenthType
+from app.roman_numerals import RomanNumeralAnalyzer, analyze_progression
+from app.tuning import get_tuning
+from test.conftest import build_chord
+
+C_MAJOR = Key(0, "major")
+
+A_MINOR = Key(9, "minor")
+
+
+
+@pytest.mark.parametrize("chord, key, expected_label", [
+
+    (build_chord(RootType.C), C_MAJOR, "I"),
+    (build_chord(RootType.C, SeventhType.MAJOR), C_MAJOR, "Imaj7"),
+    (build_chord(RootType.D, ThirdType.MINOR, SeventhType.MINOR), C_MAJOR, "ii7"),
+    (build_chord(RootType.G, SeventhType.MINOR), C_MAJOR, "V7"),
+    (build_chord(RootType.G, ThirteenthType.MAJOR), C_MAJOR, "V13"),
+    (build_chord(RootType.B, ThirdType.MINOR, FifthType.DIMINISHED), C_MAJOR, "vii°"),
+    (build_chord(RootType.B, ThirdType.MINOR, FifthType.DIMINISHED, SeventhType.MINOR), C_MAJOR, "viiø7"),
+    (build_chord(RootType.D, SeventhType.MINOR), C_MAJOR, "V7/V"),
+    (build_chord(RootType.C, SeventhType.MINOR), C_MAJOR, "V7/IV"),
+    (build_chord(RootType.E), C_MAJOR, "V/vi"),
+    (build_chord(RootType.B_Flat), C_MAJOR, "bVII"),
+    (build_chord(RootType.A_FLAT), C_MAJOR, "bVI"),
+    (build_chord(RootType.A, ThirdType.MINOR), A_MINOR, "i"),
+    (build_chord(RootType.E, SeventhType.MINOR), A_MINOR, "V7"),
+    (build_chord(RootType.F), A_MINOR, "VI"),
+    (build_chord(RootType.B, ThirdType.MINOR, FifthType.DIMINISHED), A_MINOR, "ii°"),
+
+])
+def test_roman_numeral_labels(chord, key, expected_label):
+
+    assert RomanNumeralAnalyzer().label(chord, key) == expected_label
+
+
+
+def test_roman_numeral_labels_in_other_tunings():
+
+    for tuning_name in ("19-TET", "31-TET"):
+
+        chord = Chord.from_interval_types(build_chord(RootType.G, SeventhType.MINOR).get_interval_types(), get_tuning(tuning_name))
+
+        assert RomanNumeralAnalyzer().label(chord, C_MAJOR) == "V7"
+
+
+
+def test_roman_numeral_lookup_is_memoised():
+
+    analyzer = RomanNumeralAnalyzer()
+
+    progression = [build_chord(RootType.D, ThirdType.MINOR, SeventhType.MINOR), build_chord(RootType.G, SeventhType.MINOR), build_chord(RootType.C)] * 50
+
+    assert analyzer.analyze(progression, C_MAJOR)[:3] == ["ii7", "V7", "I"]
+    assert len(analyzer._labels) == 3
+
+
+
+def test_roman_numeral_batch_apis():
+
+    progression = [build_chord(RootType.D, SeventhType.MINOR), build_chord(RootType.G, SeventhType.MINOR), build_chord(RootType.C), Chord.from_interval_types({})]
+
+    analyzer = RomanNumeralAnalyzer()
+
+    expected = ["V7/V", "V7", "I", None]
+
+    assert analyze_progression(progression, C_MAJOR) == expected
+    assert analyzer.analyze_batch([progression, progression[:1]], [C_MAJOR, Key(2, "major")]) == [expected, ["V7/IV"]]
+    assert analyzer.analyze_array(ChordArray.from_chords(progression), C_MAJOR) == expected
+
+    with pytest.raises(ValueError, match=r"Invalid keys"):
+
+        analyzer.analyze_batch([progression], [])
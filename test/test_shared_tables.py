@@ -0,0 +1,101 @@
+from multiprocessing import Pool
+
+import numpy as np
+import pytest
+
+from app import shared_tables
+from app.markov import chord_id
+from app.shared_tables import SharedTables, attach_worker, build_tables, get_tables
+from app.symbols import parse_chord
+from app.utils import pitch_classes, pitch_class_mask
+
+SYMBOLS = ["C", "Cm7", "G7", "F#m7b5", "Bbmaj9", "D13#11", "Ebdim7", "E7b9"]
+
+
+
+@pytest.fixture(scope="module")
+def published():
+
+    with SharedTables.publish() as tables:
+
+        yield tables
+
+
+
+def _describe_in_worker(symbol):
+
+    tables = get_tables()
+
+    index = chord_id(parse_chord(symbol))
+
+    return shared_tables._attached_tables.handle.name, int(tables["pitch_class_masks"][index]), tables["note_indices"][index].tolist()
+
+
+
+def test_tables_match_chords(published):
+
+    for symbol in SYMBOLS:
+
+        chord = parse_chord(symbol)
+
+        index = chord_id(chord)
+
+        assert published["pitch_class_masks"][index] == pitch_class_mask(pitch_classes(chord.get_note_signature()))
+        assert [interval for interval in published["interval_signatures"][index].tolist() if interval >= 0] == chord.get_interval_signature()
+        assert sorted(note for note in published["note_indices"][index].tolist() if note >= 0) == sorted(chord.tuning.note_index(note) for note in chord.get_note_signature())
+
+    for name, table in build_tables().items():
+
+        assert np.array_equal(published[name], table)
+
+
+
+def test_attached_views_are_read_only_and_shared(published):
+
+    with SharedTables.attach(published.handle) as attached:
+
+        assert not attached.owner
+        assert attached.nbytes == published.nbytes
+
+        with pytest.raises(ValueError):
+
+            attached["pitch_class_masks"][0] = 1
+
+        assert attached["tension"][0b10010001] == published["tension"][0b10010001]
+
+    # Closing an attached block leaves it published.
+    with SharedTables.attach(published.handle) as attached:
+
+        assert attached["codes"].shape == published["codes"].shape
+
+
+
+def test_workers_attach_without_building(published):
+
+    with Pool(2, initializer=attach_worker, initargs=(published.handle,)) as pool:
+
+        results = pool.map(_describe_in_worker, SYMBOLS)
+
+    for symbol, (name, mask, notes) in zip(SYMBOLS, results):
+
+        index = chord_id(parse_chord(symbol))
+
+        assert name == published.handle.name
+        assert (mask, notes) == (published["pitch_class_masks"][index], published["note_indices"][index].tolist())
+
+
+
+def test_unlinked_block_cannot_be_attached():
+
+    tables = SharedTables.publish({"masks": np.arange(12, dtype=np.uint16)})
+
+    handle = tables.handle
+
+    tables.close()
+    tables.close()
+
+    assert tables.nbytes == 0
+
+    with pytest.raises(ValueError, match="Invalid handle"):
+
+        SharedTables.attach(handle)
@@ -0,0 +1,112 @@
+import pytest
+
+from app.chord import Chord
+from app.consonance import interval_vectors
+from app.library.enums import RootType, ThirdType, SeventhType
+from app.similarity import METRICS, SimilarityIndex, get_index, similar
+from app.utils import pitch_classes, pitch_class_mask
+
+def _voice_leading(mask_a, mask_b):
+
+    def nearest(pitch_class, mask):
+
+        return min(min(abs(pitch_class - other), 12 - abs(pitch_class - other)) for other in range(12) if mask >> other & 1)
+
+    return sum(nearest(pitch_class, mask_b) for pitch_class in range(12) if mask_a >> pitch_class & 1) + sum(nearest(pitch_class, mask_a) for pitch_class in range(12) if mask_b >> pitch_class & 1)
+
+def _brute_force_scores(index, mask, metric):
+
+    vectors = interval_vectors()
+
+    scores = {}
+
+    for other in index.catalog_masks.tolist():
+
+        if other == mask:
+
+            continue
+
+        if metric == "voice_leading":
+
+            scores[other] = _voice_leading(mask, other)
+
+        elif metric == "common_tones":
+
+            scores[other] = bin(mask & other).count("1")
+
+        else:
+
+            scores[other] = int(abs(vectors[mask] - vectors[other]).sum())
+
+    return scores
+
+
+
+def test_catalog_covers_every_chord():
+
+    index = get_index()
+
+    chord = Chord()
+
+    chord.set_new_root(RootType.A_FLAT)
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+
+    mask = pitch_class_mask(pitch_classes(chord.get_note_signature()))
+
+    assert mask in set(index.catalog_masks.tolist())
+    assert pitch_class_mask(pitch_classes(index.chord_for_mask(mask).get_note_signature())) == mask
+
+
+
+@pytest.mark.parametrize("metric", METRICS)
+@pytest.mark.parametrize("mask", [0b000010010001, 0b010010010010, 0b100010010100, 0b001001001001])
+def test_neighbours_match_brute_force(metric, mask):
+
+    index = get_index()
+
+    neighbours = index.neighbours(mask, k=8, metric=metric)
+
+    scores = _brute_force_scores(index, mask, metric)
+
+    expected_scores = sorted(scores.values(), reverse=metric == "common_tones")[:8]
+
+    assert [score for _, score in neighbours] == expected_scores
+
+    for neighbour_mask, score in neighbours:
+
+        assert scores[neighbour_mask] == score
+
+
+
+def test_similar_returns_chords():
+
+    chord = Chord()
+
+    chord.third_type = ThirdType.MINOR
+
+    chords = similar(chord, k=3, metric="interval_vector")
+
+    assert len(chords) == 3
+    assert all(isinstance(neighbour, Chord) for neighbour in chords)
+
+    # Ranks the other major and minor triads first, as they share the same interval vector.
+    assert all(len(neighbour.get_note_signature()) == 3 for neighbour in chords)
+    assert sorted(chord.get_note_signature()) not in [sorted(neighbour.get_note_signature()) for neighbour in chords]
+
+
+
+def test_invalid_queries():
+
+    index = SimilarityIndex()
+
+    with pytest.raises(ValueError, match="Invalid metric"):
+
+        index.neighbours(0b10010001, metric="euclidean")
+
+    chord = Chord()
+
+    chord.root_type = None
+
+    with pytest.raises(ValueError, match="Invalid chord"):
+
+        index.similar(chord)
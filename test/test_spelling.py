@@ -0,0 +1,70 @@
+import pytest
+
+from app.chord import Chord
+from app.library.enums import RootType, ThirdType, FifthType, SeventhType, ThirteenthType
+from app.spelling import SPELLING_TABLE, line_of_fifths_position, note_at_position, note_index, spell_note
+from config.config import INTERVAL_DICT, CHROMATIC_LEN
+
+def test_line_of_fifths_round_trip():
+
+    for note in ["C", "G", "F", "B", "Bb", "F#", "Cb", "E#", "Bbb", "F##"]:
+
+        assert note_at_position(line_of_fifths_position(note)) == note
+
+    assert line_of_fifths_position("C") == 0
+    assert line_of_fifths_position("F#") == 6
+    assert note_index("Cb") == 11
+    assert note_index("B#") == 0
+
+
+
+def test_spelling_table_matches_semitones():
+
+    """
+    Every spelled note sounds its interval above the root note.
+    
+    """
+
+    for root_type, spellings in SPELLING_TABLE.items():
+
+        for interval_name, note in spellings.items():
+
+            assert note_index(note) == (note_index(root_type.value) + INTERVAL_DICT[interval_name]) % CHROMATIC_LEN
+
+
+
+@pytest.mark.parametrize("root_type, interval_types, expected_note_signature", [
+
+    (RootType.B, [], ["B", "D#", "F#"]),
+    (RootType.D_FLAT, [SeventhType.MINOR], ["Db", "F", "Ab", "Cb"]),
+    (RootType.C_FLAT, [], ["Cb", "Eb", "Gb"]),
+    (RootType.E_SHARP, [ThirdType.MINOR], ["E#", "G#", "B#"]),
+    (RootType.F_SHARP, [ThirteenthType.MAJOR], ["F#", "A#", "C#", "E", "G#", "B", "D#"]),
+    (RootType.C, [ThirdType.MINOR, FifthType.DIMINISHED, SeventhType.DIMINISHED], ["C", "Eb", "Gb", "Bbb"]),
+
+])
+def test_chord_note_signature_spelling(root_type, interval_types, expected_note_signature):
+
+    chord = Chord()
+
+    chord.set_new_root(root_type)
+
+    for interval_type in interval_types:
+
+        chord.add_or_remove_interval_type_and_attributes(interval_type)
+
+    assert chord.get_note_signature() == expected_note_signature
+
+
+
+def test_enharmonic_roots_share_root_index():
+
+    assert RootType.D_FLAT != RootType.C_SHARP
+
+    chord = Chord()
+
+    chord.set_new_root(RootType.D_FLAT)
+
+    assert chord.root_index == 1
+    assert spell_note(RootType.D_FLAT, "major_third") == "F"
+    assert spell_note(RootType.C_SHARP, "major_third") == "E#"
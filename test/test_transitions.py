@@ -0,0 +1,77 @@
+import pytest
+
+from app.chord_array import ChordArray
+from app.progression import Progression
+from app.symbols import parse_chord
+from app.transitions import all_pair_diffs, chord_diffs, chord_masks, progression_diffs
+from app.utils import pitch_classes
+
+SYMBOLS = ["C", "Am7", "Dm7", "G7", "Cmaj7", "F#m7b5", "Bb13"]
+
+def _set_diff(chord_a, chord_b):
+
+    notes_a, notes_b = set(pitch_classes(chord_a.get_note_signature())), set(pitch_classes(chord_b.get_note_signature()))
+
+    return len(notes_a & notes_b), notes_b - notes_a, notes_a - notes_b
+
+def _notes(mask):
+
+    return {pitch_class for pitch_class in range(12) if mask >> pitch_class & 1}
+
+def test_progression_diffs_match_set_comparisons():
+
+    chords = [parse_chord(symbol) for symbol in SYMBOLS]
+
+    diffs = progression_diffs(chords)
+
+    for index, (chord_a, chord_b) in enumerate(zip(chords, chords[1:])):
+
+        common_tones, added, removed = _set_diff(chord_a, chord_b)
+
+        assert diffs.common_tones[index] == common_tones
+        assert _notes(int(diffs.added[index])) == added
+        assert _notes(int(diffs.removed[index])) == removed
+
+    # C -> Am7 moves the root down a minor third, and only adds A (one semitone from G in both directions).
+    assert (diffs.root_motion[0], diffs.voice_leading[0]) == (-3, 2)
+
+
+
+def test_all_pair_diffs_match_pairwise_diffs():
+
+    chords = [parse_chord(symbol) for symbol in SYMBOLS]
+
+    all_pairs = all_pair_diffs(chords)
+
+    assert all_pairs.common.shape == (len(chords), len(chords))
+
+    for index_a, chord_a in enumerate(chords):
+
+        row = chord_diffs([chord_a] * len(chords), chords)
+
+        for field in all_pairs._fields:
+
+            assert getattr(all_pairs, field)[index_a].tolist() == getattr(row, field).tolist()
+
+    # Every chord shares all of its notes with itself, and needs no voice leading.
+    assert all_pairs.common_tones.diagonal().tolist() == [len(set(chord.get_note_signature())) for chord in chords]
+    assert not all_pairs.voice_leading.diagonal().any()
+
+
+
+def test_collections_are_interchangeable():
+
+    chords = [parse_chord(symbol) for symbol in SYMBOLS]
+
+    masks, root_indices = chord_masks(chords)
+
+    for collection in (ChordArray.from_chords(chords), Progression.from_chords(chords)):
+
+        other_masks, other_root_indices = chord_masks(collection)
+
+        assert other_masks.tolist() == masks.tolist()
+        assert other_root_indices.tolist() == root_indices.tolist()
+
+    with pytest.raises(ValueError, match="Invalid chords"):
+
+        chord_diffs(chords, chords[1:])
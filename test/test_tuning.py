@@ -0,0 +1,123 @@
+import pytest
+
+from app.chord import Chord
+from app.library.enums import RootType, ThirdType, SeventhType, ThirteenthType
+from app.tuning import TWELVE_TET, Tuning, get_tuning, register_tuning, TUNING_BUILDERS, _COMPILED_TUNINGS
+from app.utils import calculate_note, calculate_interval, interval_signature
+from config.config import CHROMATIC_SCALE, INTERVAL_DICT, NOTE_INDEX_DICT
+
+def test_twelve_tet_matches_config():
+
+    assert TWELVE_TET is get_tuning("12-TET")
+    assert TWELVE_TET.interval_steps == INTERVAL_DICT
+    assert TWELVE_TET.note_names == tuple(CHROMATIC_SCALE)
+
+    for note, index in NOTE_INDEX_DICT.items():
+
+        assert TWELVE_TET.note_index(note) == index
+
+
+
+def test_tunings_are_compiled_once():
+
+    assert get_tuning("31-TET") is get_tuning("31-TET")
+
+    with pytest.raises(ValueError, match="Invalid tuning"):
+
+        get_tuning("7-TET")
+
+
+
+@pytest.mark.parametrize("name, divisions, expected_interval_signature", [
+
+    ("12-TET", 12, [0, 4, 7]),
+    ("19-TET", 19, [0, 6, 11]),
+    ("24-TET", 24, [0, 8, 14]),
+    ("31-TET", 31, [0, 10, 18]),
+    ("5-limit-just", 12, [0, 4, 7]),
+
+])
+def test_chord_intervals_in_each_tuning(name, divisions, expected_interval_signature):
+
+    chord = Chord(get_tuning(name))
+
+    assert chord.tuning.divisions == divisions
+    assert chord.get_interval_signature() == expected_interval_signature
+    assert chord.get_note_signature() == ["C", "E", "G"]
+
+
+
+def test_enharmonic_notes_are_distinct_in_meantone_tunings():
+
+    tuning = get_tuning("19-TET")
+
+    assert tuning.note_index("C#") != tuning.note_index("Db")
+    assert TWELVE_TET.note_index("C#") == TWELVE_TET.note_index("Db")
+
+    chord = Chord(tuning)
+
+    chord.set_new_root(RootType.D_FLAT)
+
+    assert chord.root_index == tuning.note_index("Db") == 2
+    assert chord.root_note == "Db"
+
+
+
+def test_utils_route_through_tuning():
+
+    tuning = get_tuning("31-TET")
+
+    root_index = tuning.note_index("D")
+
+    for interval_name, steps in tuning.interval_steps.items():
+
+        note = calculate_note(CHROMATIC_SCALE, root_index, steps, tuning=tuning)
+
+        assert calculate_interval(CHROMATIC_SCALE, root_index, note, tuning=tuning) == steps % tuning.divisions
+
+    # Leaves the 12-TET behaviour unchanged when no tuning is provided.
+    assert calculate_note(CHROMATIC_SCALE, 7, 4) == "B"
+    assert calculate_interval(CHROMATIC_SCALE, 7, "B") == 4
+
+
+
+def test_interval_signature_wraps_by_tuning_divisions():
+
+    chord = Chord(get_tuning("19-TET"))
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+    chord.add_or_remove_interval_type_and_attributes(ThirteenthType.MAJOR)
+
+    assert interval_signature(chord) == sorted(interval_signature(chord))
+    assert interval_signature(chord)[-1] == get_tuning("19-TET").interval_steps["major_thirteenth"]
+
+
+
+def test_just_intonation_cents():
+
+    chord = Chord(get_tuning("5-limit-just"))
+
+    chord.add_or_remove_interval_type_and_attributes(SeventhType.MINOR)
+
+    assert [round(cents, 1) for cents in chord.get_cents_signature()] == [0.0, 386.3, 702.0, 1017.6]
+    assert Chord().get_cents_signature() == [0.0, 400.0, 700.0]
+
+
+
+def test_register_tuning():
+
+    register_tuning("53-TET", lambda: Tuning("53-TET", 53))
+
+    try:
+
+        chord = Chord(get_tuning("53-TET"))
+
+        chord.third_type = ThirdType.MINOR
+
+        # Tunes the minor third as three fifths down, the Pythagorean 32/27.
+        assert chord.get_interval_signature() == [0, 13, 31]
+
+    finally:
+
+        del TUNING_BUILDERS["53-TET"]
+        _COMPILED_TUNINGS.pop("53-TET")